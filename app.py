@@ -22,15 +22,19 @@ import streamlit as st
 import sys
 import os
 import asyncio
+import copy
+import importlib
+from contextlib import contextmanager
+from types import ModuleType
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Final
 
 # Add project root to Python path
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
 # Core imports
-from backend.config import AppConfig, get_settings
+from backend.config import AppConfig, get_settings, settings_fingerprint
 from backend.database.db_manager import DatabaseManager
 from backend.utils.error_handlers import handle_startup_error, log_error
 from backend.utils.validators import validate_environment
@@ -41,38 +45,44 @@ from frontend.components.header import render_header
 from frontend.components.footer import render_footer
 from frontend.components.sidebar import render_sidebar
 
-# Page imports
-from frontend.pages import (
-    home,
-    learn,
-    practice,
-    progress, 
-    achievements,
-    curriculum_explorer,
-    settings as settings_page
-)
 
+# Per-session defaults; mutable values are copied so sessions never share them
+_SESSION_DEFAULTS: Final[Dict[str, Any]] = {
+    'user_id': None,
+    'authenticated': False,
+    'current_page': 'home',
+    'theme': 'light',
+    'language': 'English',
+    'grade': 6,
+    'subject': 'Physics',
+    'points': 0,
+    'streak': 0,
+    'level': 'Beginner',
+    'badges': [],
+    'bookmarks': [],
+    'preferences': {},
+    'analytics_data': {},
+    'current_topic': None,
+    'quiz_state': {},
+    'practice_history': [],
+    'achievement_notifications': [],
+}
 
-class ScienceGPTApp:
-    """Main application class for ScienceGPT v3.0"""
-    
-    def __init__(self):
-        """Initialize the ScienceGPT application"""
-        self.config = get_settings()
-        self.db_manager: Optional[DatabaseManager] = None
-        self.initialized = False
-    
-    def configure_streamlit(self) -> None:
-        """Configure Streamlit page settings with premium styling"""
-        st.set_page_config(
-            page_title="ScienceGPT v3.0 - AI Science Learning Platform",
-            page_icon="🧪",
-            layout="wide",
-            initial_sidebar_state="expanded",
-            menu_items={
-                'Get Help': 'https://github.com/aseemm84/sciencegpt_v3/wiki',
-                'Report a bug': 'https://github.com/aseemm84/sciencegpt_v3/issues/new',
-                'About': """
+# Directories that must exist under the project root
+REQUIRED_TOP_LEVEL_DIRS = ('assets', 'backend', 'frontend')
+
+
+def list_subdirectories(path: Path) -> frozenset:
+    """Return names of the immediate subdirectories of path in one scandir call"""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return frozenset()
+
+
+# Static "About" menu content for the Streamlit page config
+ABOUT_MARKDOWN = """
                 # 🎓 ScienceGPT v3.0
                 
                 **World-Class AI-Powered Science Education Platform**
@@ -104,56 +114,78 @@ class ScienceGPTApp:
                 **Version:** 3.0.0  
                 **License:** MIT
                 """
+
+
+@st.cache_resource
+def load_custom_css_content() -> str:
+    """Read the custom stylesheet once per process"""
+    css_path = project_root / 'assets' / 'styles' / 'custom.css'
+    return css_path.read_text(encoding='utf-8') if css_path.exists() else ""
+
+
+@st.cache_resource
+def get_db_manager() -> DatabaseManager:
+    """Get the process-wide database manager and its connection pool"""
+    return DatabaseManager()
+
+
+@st.cache_resource
+def load_page_module(module_name: str) -> ModuleType:
+    """Import a page module on first use and reuse it across reruns"""
+    return importlib.import_module(f"frontend.pages.{module_name}")
+
+
+class ScienceGPTApp:
+    """Main application class for ScienceGPT v3.0"""
+    
+    def __init__(self):
+        """Initialize the ScienceGPT application"""
+        self.config = get_settings(settings_fingerprint())
+        self.db_manager: Optional[DatabaseManager] = None
+        self.initialized = False
+    
+    def configure_streamlit(self) -> None:
+        """Configure Streamlit page settings with premium styling"""
+        st.set_page_config(
+            page_title="ScienceGPT v3.0 - AI Science Learning Platform",
+            page_icon="🧪",
+            layout="wide",
+            initial_sidebar_state="expanded",
+            menu_items={
+                'Get Help': 'https://github.com/aseemm84/sciencegpt_v3/wiki',
+                'Report a bug': 'https://github.com/aseemm84/sciencegpt_v3/issues/new',
+                'About': ABOUT_MARKDOWN
             }
         )
     
     def load_custom_css(self) -> None:
         """Load premium custom CSS styling"""
-        css_path = project_root / 'assets' / 'styles' / 'custom.css'
-        
-        if css_path.exists():
-            try:
-                with open(css_path, 'r', encoding='utf-8') as f:
-                    css_content = f.read()
+        try:
+            css_content = load_custom_css_content()
+            if css_content:
                 st.markdown(f'<style>{css_content}</style>', unsafe_allow_html=True)
-            except Exception as e:
-                log_error(f"Failed to load custom CSS: {str(e)}")
+        except Exception as e:
+            log_error(f"Failed to load custom CSS: {str(e)}")
     
     def initialize_session_state(self) -> None:
         """Initialize session state with default values"""
-        defaults = {
-            'user_id': None,
-            'authenticated': False,
-            'current_page': 'home',
-            'theme': 'light',
-            'language': 'English',
-            'grade': 6,
-            'subject': 'Physics',
-            'points': 0,
-            'streak': 0,
-            'level': 'Beginner',
-            'badges': [],
-            'bookmarks': [],
-            'preferences': {},
-            'analytics_data': {},
-            'current_topic': None,
-            'quiz_state': {},
-            'practice_history': [],
-            'achievement_notifications': [],
-        }
+        # Defaults only need to be applied on the first run of a session
+        if st.session_state.get('_initialized'):
+            return
         
-        for key, value in defaults.items():
+        for key, value in _SESSION_DEFAULTS.items():
             if key not in st.session_state:
-                st.session_state[key] = value
+                st.session_state[key] = copy.copy(value)
+        
+        st.session_state['_initialized'] = True
     
     async def initialize_database(self) -> bool:
         """Initialize database connection and schema"""
         try:
-            if 'db_initialized' not in st.session_state:
-                self.db_manager = DatabaseManager()
-                await self.db_manager.initialize()
-                st.session_state.db_initialized = True
-                return True
+            # One manager is shared by all sessions; initialize() is a no-op once connected
+            self.db_manager = get_db_manager()
+            await self.db_manager.initialize()
+            st.session_state.db_initialized = True
             return True
         except Exception as e:
             handle_startup_error(f"Database initialization failed: {str(e)}")
@@ -167,29 +199,31 @@ class ScienceGPTApp:
                 st.error("❌ Environment validation failed. Please check your configuration.")
                 return False
             
-            # Check required directories
-            required_dirs = ['assets', 'backend', 'frontend', 'assets/styles']
-            for dir_path in required_dirs:
-                full_path = project_root / dir_path
-                if not full_path.exists():
-                    st.error(f"❌ Required directory missing: {dir_path}")
-                    return False
+            # Check required directories with one listing per parent directory
+            top_level = list_subdirectories(project_root)
+            missing = [dir_name for dir_name in REQUIRED_TOP_LEVEL_DIRS if dir_name not in top_level]
+            if 'assets' not in missing and 'styles' not in list_subdirectories(project_root / 'assets'):
+                missing.append('assets/styles')
+            
+            if missing:
+                st.error(f"❌ Required directory missing: {', '.join(missing)}")
+                return False
             
             return True
         except Exception as e:
             handle_startup_error(f"Prerequisites validation failed: {str(e)}")
             return False
     
-    def get_page_mapping(self) -> Dict[str, Any]:
-        """Get mapping of page names to modules"""
+    def get_page_mapping(self) -> Dict[str, str]:
+        """Get mapping of page names to module names"""
         return {
-            'home': home,
-            'learn': learn,
-            'practice': practice,
-            'progress': progress,
-            'achievements': achievements,
-            'curriculum': curriculum_explorer,
-            'settings': settings_page
+            'home': 'home',
+            'learn': 'learn',
+            'practice': 'practice',
+            'progress': 'progress',
+            'achievements': 'achievements',
+            'curriculum': 'curriculum_explorer',
+            'settings': 'settings'
         }
     
     def render_page(self, page_name: str) -> None:
@@ -198,7 +232,7 @@ class ScienceGPTApp:
         
         if page_name in pages:
             try:
-                pages[page_name].render()
+                load_page_module(pages[page_name]).render()
             except Exception as e:
                 st.error(f"❌ Error rendering page '{page_name}': {str(e)}")
                 log_error(f"Page render error - {page_name}: {str(e)}")
@@ -227,6 +261,9 @@ class ScienceGPTApp:
     
     async def run(self) -> None:
         """Main application run method"""
+        # The app outlives reruns; a new fingerprint picks up .env edits
+        self.config = get_settings(settings_fingerprint())
+        
         # Configure Streamlit
         self.configure_streamlit()
         
@@ -251,36 +288,49 @@ class ScienceGPTApp:
         self.render_layout()
 
 
+@st.cache_resource
+def get_app() -> ScienceGPTApp:
+    """Get the application instance shared across reruns and sessions"""
+    return ScienceGPTApp()
+
+
+# Opt-in profiling: SCIENCEGPT_PROFILE=1 writes a pyinstrument report per rerun
+PROFILE_ENV_VAR = "SCIENCEGPT_PROFILE"
+PROFILE_OUTPUT_PATH = Path("/tmp/sciencegpt_profile.html")
+
+
+@contextmanager
+def profile_rerun() -> Iterator[None]:
+    """Profile the wrapped block when profiling is enabled via the environment"""
+    profiler = None
+    if os.getenv(PROFILE_ENV_VAR) == "1":
+        try:
+            from pyinstrument import Profiler
+            profiler = Profiler(async_mode="enabled")
+        except ImportError:
+            pass
+    
+    if profiler is None:
+        yield
+        return
+    
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        PROFILE_OUTPUT_PATH.write_text(profiler.output_html(), encoding="utf-8")
+
+
 def main():
     """Main entry point with error handling"""
     try:
-        app = ScienceGPTApp()
+        app = get_app()
         
-        # Run the application (handling async)
-        if hasattr(asyncio, 'run'):
-            # Python 3.7+
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Already in an event loop, use create_task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, app.run())
-                        future.result()
-                else:
-                    asyncio.run(app.run())
-            except RuntimeError:
-                # Fallback for environments with existing event loops
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(app.run())
-                finally:
-                    loop.close()
-        else:
-            # Python 3.6 fallback
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(app.run())
+        # Streamlit runs each rerun in a new thread, so each rerun gets its own
+        # loop; asyncio.run closes it (selector and self-pipe) when the rerun ends
+        with profile_rerun():
+            asyncio.run(app.run())
     
     except Exception as e:
         handle_startup_error(f"Application startup failed: {str(e)}")
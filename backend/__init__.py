@@ -3,13 +3,32 @@ ScienceGPT v3.0 Backend Package
 Core backend functionality for the ScienceGPT platform
 """
 
+import importlib
+
 __version__ = "3.0.0"
 __author__ = "Aseem Mehrotra"
 
 from .config import AppConfig, get_settings
-from .database.db_manager import DatabaseManager
-from .ai.llm_handler import LLMHandler
-from .curriculum.ncert_curriculum import NCERTCurriculum
+
+# Heavy components are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "DatabaseManager": ".database.db_manager",
+    "LLMHandler": ".ai.llm_handler",
+    "NCERTCurriculum": ".curriculum.ncert_curriculum",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "AppConfig",
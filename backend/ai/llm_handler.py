@@ -4,30 +4,38 @@ Multi-provider AI integration with intelligent routing, caching, and error handl
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Optional, Any, Union, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator, Callable, ClassVar
+from datetime import datetime
+from dataclasses import dataclass, asdict
 from enum import Enum
-import hashlib
 import time
+from collections import defaultdict, deque
+
+import httpx
+
+# HTTP/2 lets concurrent requests to a provider share one connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # LLM Provider imports
 try:
-    from groq import Groq
+    from groq import AsyncGroq
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
 
 try:
-    import openai
+    from openai import AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
 try:
-    import anthropic
+    from anthropic import AsyncAnthropic
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
@@ -35,9 +43,21 @@ except ImportError:
 from .prompt_templates import PromptTemplates
 from .response_cache import ResponseCache
 from ..config import get_settings
-from ..utils.error_handlers import log_error, LLMError
+from ..utils.error_handlers import LLMError
 from ..utils.validators import validate_input_text, sanitize_input
 
+# Settings are process-wide; resolve them once at import
+_SETTINGS = get_settings()
+
+
+def reload_settings() -> None:
+    """Rebind the module settings after get_settings.cache_clear()
+    
+    Handlers built afterwards use the new settings; existing ones keep theirs.
+    """
+    global _SETTINGS
+    _SETTINGS = get_settings()
+
 
 class LLMProvider(Enum):
     """Available LLM providers"""
@@ -73,64 +93,85 @@ class LLMResponse:
 class RateLimiter:
     """Advanced rate limiter with per-provider limits"""
     
+    # Requests allowed per provider in the sliding window
+    LIMITS = {
+        LLMProvider.GROQ: 30,      # 30 per minute
+        LLMProvider.OPENAI: 60,    # 60 per minute  
+        LLMProvider.ANTHROPIC: 50  # 50 per minute
+    }
+    WINDOW_SECONDS = 60
+    
     def __init__(self):
-        self.requests = {}
-        self.settings = get_settings()
+        # Per-provider request timestamps, oldest on the left
+        self.requests: Dict[str, deque] = defaultdict(deque)
+        # Guards the check-and-log sequence so concurrent callers cannot overshoot a limit
+        self.locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.settings = _SETTINGS
+    
+    def _trim(self, provider_key: str, now: float) -> deque:
+        """Drop timestamps that fell out of the sliding window"""
+        window = self.requests[provider_key]
+        window_seconds = self.WINDOW_SECONDS
+        popleft = window.popleft
+        while window and now - window[0] >= window_seconds:
+            popleft()
+        return window
     
     async def can_make_request(self, provider: LLMProvider) -> Tuple[bool, Optional[str]]:
         """Check if request can be made for given provider"""
         now = time.time()
-        provider_key = provider.value
-        
-        # Initialize if not exists
-        if provider_key not in self.requests:
-            self.requests[provider_key] = []
+        window = self._trim(provider.value, now)
+        limit = self.LIMITS.get(provider, 30)
         
-        # Clean old requests (1 minute window)
-        self.requests[provider_key] = [
-            req_time for req_time in self.requests[provider_key]
-            if now - req_time < 60
-        ]
-        
-        # Check rate limits per provider
-        limits = {
-            LLMProvider.GROQ: 30,      # 30 per minute
-            LLMProvider.OPENAI: 60,    # 60 per minute  
-            LLMProvider.ANTHROPIC: 50  # 50 per minute
-        }
-        
-        current_requests = len(self.requests[provider_key])
-        limit = limits.get(provider, 30)
-        
-        if current_requests >= limit:
-            wait_time = 60 - (now - min(self.requests[provider_key]))
+        if len(window) >= limit:
+            wait_time = self.WINDOW_SECONDS - (now - window[0])
             return False, f"Rate limit exceeded. Try again in {int(wait_time)} seconds."
         
         return True, None
     
     async def log_request(self, provider: LLMProvider) -> None:
         """Log a request for rate limiting"""
-        now = time.time()
-        provider_key = provider.value
-        
-        if provider_key not in self.requests:
-            self.requests[provider_key] = []
-        
-        self.requests[provider_key].append(now)
+        self.requests[provider.value].append(time.time())
+    
+    async def try_acquire(self, provider: LLMProvider) -> Tuple[bool, Optional[str]]:
+        """Atomically check the rate limit and log the request if allowed"""
+        async with self.locks[provider.value]:
+            can_request, error_msg = await self.can_make_request(provider)
+            if can_request:
+                await self.log_request(provider)
+            return can_request, error_msg
 
 
 class LLMHandler:
     """Advanced LLM handler with multi-provider support and intelligent routing"""
     
+    # Start the next provider if the current one has not answered within this delay
+    HEDGE_DELAY_SECONDS = 2.0
+    # In-flight requests allowed per provider, so hedging cannot flood a single API
+    MAX_CONCURRENT_PER_PROVIDER = 10
+    
+    # Provider selection order based on request type
+    _PREFERENCE_ORDER: ClassVar[Dict[str, Tuple[LLMProvider, ...]]] = {
+        "general": (LLMProvider.GROQ, LLMProvider.OPENAI, LLMProvider.ANTHROPIC),
+        "complex": (LLMProvider.OPENAI, LLMProvider.ANTHROPIC, LLMProvider.GROQ),
+        "creative": (LLMProvider.ANTHROPIC, LLMProvider.OPENAI, LLMProvider.GROQ),
+        "factual": (LLMProvider.GROQ, LLMProvider.OPENAI, LLMProvider.ANTHROPIC)
+    }
+    
     def __init__(self):
         """Initialize LLM handler"""
-        self.settings = get_settings()
+        self.settings = _SETTINGS
         self.logger = logging.getLogger(__name__)
         self.prompt_templates = PromptTemplates()
         self.response_cache = ResponseCache()
         self.rate_limiter = RateLimiter()
+        # Requests currently being generated, keyed by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.semaphores: Dict[LLMProvider, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.MAX_CONCURRENT_PER_PROVIDER)
+        )
         
-        # Initialize providers
+        # Initialize providers; this also opens the shared HTTP connection pool
         self.providers = {}
         self._initialize_providers()
         
@@ -161,62 +202,82 @@ class LLMHandler:
                 cost_per_token=0.0008
             )
         }
+        self._config_dicts = {provider: asdict(config) for provider, config in self.provider_configs.items()}
+        
+        # Request kwargs are constant per provider, so build them once
+        self._base_kwargs = {
+            provider: {
+                "model": config.model,
+                "max_tokens": config.max_tokens,
+                "temperature": config.temperature,
+                "timeout": config.timeout
+            }
+            for provider, config in self.provider_configs.items()
+        }
         
     def _initialize_providers(self) -> None:
         """Initialize available LLM providers"""
-        # Initialize Groq
-        if GROQ_AVAILABLE and self.settings.groq_api_key:
-            try:
-                self.providers[LLMProvider.GROQ] = Groq(api_key=self.settings.groq_api_key)
-                self.logger.info("Groq provider initialized")
-            except Exception as e:
-                self.logger.warning(f"Failed to initialize Groq: {str(e)}")
+        settings = _SETTINGS
+        
+        # Providers whose SDK is installed and whose API key is set
+        candidates = [
+            (provider, name, client_class, api_key)
+            for provider, name, client_class, api_key in (
+                (LLMProvider.GROQ, "Groq", AsyncGroq if GROQ_AVAILABLE else None,
+                 settings.groq_api_key),
+                (LLMProvider.OPENAI, "OpenAI", AsyncOpenAI if OPENAI_AVAILABLE else None,
+                 settings.openai_api_key),
+                (LLMProvider.ANTHROPIC, "Anthropic", AsyncAnthropic if ANTHROPIC_AVAILABLE else None,
+                 settings.anthropic_api_key),
+            )
+            if client_class is not None and api_key
+        ]
+        if not candidates:
+            raise LLMError("No LLM providers available. Please configure API keys.")
         
-        # Initialize OpenAI
-        if OPENAI_AVAILABLE and self.settings.openai_api_key:
-            try:
-                openai.api_key = self.settings.openai_api_key
-                self.providers[LLMProvider.OPENAI] = openai
-                self.logger.info("OpenAI provider initialized")
-            except Exception as e:
-                self.logger.warning(f"Failed to initialize OpenAI: {str(e)}")
+        # Shared HTTP connection pool so TCP/TLS sessions are reused across calls;
+        # opened only once a provider is known to be configured
+        self._http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=30, max_connections=100),
+            timeout=httpx.Timeout(30.0)
+        )
         
-        # Initialize Anthropic
-        if ANTHROPIC_AVAILABLE and self.settings.anthropic_api_key:
+        for provider, name, client_class, api_key in candidates:
             try:
-                self.providers[LLMProvider.ANTHROPIC] = anthropic.Anthropic(
-                    api_key=self.settings.anthropic_api_key
-                )
-                self.logger.info("Anthropic provider initialized")
+                self.providers[provider] = client_class(api_key=api_key, http_client=self._http)
+                self.logger.info(f"{name} provider initialized")
             except Exception as e:
-                self.logger.warning(f"Failed to initialize Anthropic: {str(e)}")
+                self.logger.warning(f"Failed to initialize {name}: {str(e)}")
         
         if not self.providers:
+            self._discard_http_client()
             raise LLMError("No LLM providers available. Please configure API keys.")
+        
+        self._available = frozenset(self.providers)
+    
+    def _discard_http_client(self) -> None:
+        """Close the shared HTTP client from synchronous code"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._http.aclose())
+        else:
+            loop.create_task(self._http.aclose())
     
     def _select_provider(self, request_type: str = "general") -> LLMProvider:
         """Intelligently select the best provider for the request"""
-        available_providers = list(self.providers.keys())
-        
-        if not available_providers:
+        if not self.providers:
             raise LLMError("No LLM providers available")
         
-        # Provider selection logic based on request type
-        preference_order = {
-            "general": [LLMProvider.GROQ, LLMProvider.OPENAI, LLMProvider.ANTHROPIC],
-            "complex": [LLMProvider.OPENAI, LLMProvider.ANTHROPIC, LLMProvider.GROQ],
-            "creative": [LLMProvider.ANTHROPIC, LLMProvider.OPENAI, LLMProvider.GROQ],
-            "factual": [LLMProvider.GROQ, LLMProvider.OPENAI, LLMProvider.ANTHROPIC]
-        }
-        
-        preferred = preference_order.get(request_type, preference_order["general"])
+        preferred = self._PREFERENCE_ORDER.get(request_type, self._PREFERENCE_ORDER["general"])
         
         # Return first available provider from preference order
         for provider in preferred:
-            if provider in available_providers:
+            if provider in self._available:
                 return provider
         
-        return available_providers[0]
+        return next(iter(self.providers))
     
     async def generate_response(
         self,
@@ -232,32 +293,218 @@ class LLMHandler:
         if not validate_input_text(question):
             raise LLMError("Invalid input question")
         
+        if not use_cache:
+            return await self._fetch_response(question, context, request_type, use_cache)
+        
         # Check cache first
+        cached_response = await self.response_cache.get(question, context)
+        if cached_response:
+            return cached_response
+        
+        # Coalesce identical in-flight requests so bursts hit the provider once.
+        # The fetch runs as its own task and every caller, the first included,
+        # awaits it through a shield: cancelling one caller never cancels the
+        # shared fetch for the others.
+        key = self.response_cache.make_key(question, context)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_response(question, context, request_type, use_cache)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._settle_inflight(key, done))
+        
+        return await asyncio.shield(task)
+    
+    def _settle_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished in-flight fetch"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the result as retrieved even when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch_response(
+        self,
+        question: str,
+        context: Dict[str, Any],
+        request_type: str,
+        use_cache: bool
+    ) -> LLMResponse:
+        """Fetch a fresh response from the providers and cache it"""
+        
+        # Select provider
+        provider = self._select_provider(request_type)
+        
+        # Try primary provider, hedging with the others if it is slow or fails
+        providers = [provider] + [p for p in self.providers.keys() if p != provider]
+        response = await self._hedged_request(providers, question, context)
+        
+        # Cache successful response
+        if use_cache:
+            await self.response_cache.set(question, context, response)
+        
+        return response
+    
+    async def _hedged_request(
+        self,
+        providers: List[LLMProvider],
+        question: str,
+        context: Dict[str, Any],
+        hedge_delay: Optional[float] = None
+    ) -> LLMResponse:
+        """Race providers in order, returning the first successful response"""
+        
+        hedge_delay = self.HEDGE_DELAY_SECONDS if hedge_delay is None else hedge_delay
+        remaining = list(providers)
+        running: Dict[asyncio.Task, LLMProvider] = {}
+        launch_next = True
+        
+        try:
+            while remaining or running:
+                if remaining and launch_next:
+                    next_provider = remaining.pop(0)
+                    task = asyncio.ensure_future(self._limited_request(next_provider, question, context))
+                    running[task] = next_provider
+                
+                done, _ = await asyncio.wait(
+                    running.keys(),
+                    timeout=hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                # A slow provider brings in the next one alongside it
+                launch_next = not done
+                
+                for task in done:
+                    attempt_provider = running.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    self.logger.warning(f"Provider {attempt_provider.value} failed: {str(task.exception())}")
+                    launch_next = True
+        finally:
+            # Cancel requests that lost the race
+            for task in running:
+                task.cancel()
+        
+        raise LLMError("All LLM providers failed")
+    
+    async def _limited_request(
+        self,
+        provider: LLMProvider,
+        question: str,
+        context: Dict[str, Any]
+    ) -> LLMResponse:
+        """Make request to provider within its concurrency limit"""
+        async with self.semaphores[provider]:
+            return await self._make_request(provider, question, context)
+    
+    async def generate_response_stream(
+        self,
+        question: str,
+        context: Dict[str, Any],
+        request_type: str = "general",
+        use_cache: bool = True,
+        on_complete: Optional[Callable[[LLMResponse], None]] = None
+    ) -> AsyncIterator[str]:
+        """Stream AI response text as it is generated, with provider fallback
+        
+        Falls back to the next provider only if no text has been produced yet.
+        The assembled response is cached and passed to on_complete at the end.
+        """
+        
+        # Validate and sanitize input
+        question = sanitize_input(question)
+        if not validate_input_text(question):
+            raise LLMError("Invalid input question")
+        
+        # Serve cached responses in one chunk
         if use_cache:
             cached_response = await self.response_cache.get(question, context)
             if cached_response:
-                return cached_response
+                yield cached_response.content
+                if on_complete:
+                    on_complete(cached_response)
+                return
         
-        # Select provider
         provider = self._select_provider(request_type)
         
-        # Try primary provider, fallback to others if needed
         for attempt_provider in [provider] + [p for p in self.providers.keys() if p != provider]:
+            chunks: List[str] = []
+            start_time = time.time()
+            
             try:
-                response = await self._make_request(attempt_provider, question, context)
-                
-                # Cache successful response
-                if use_cache:
-                    await self.response_cache.set(question, context, response)
-                
-                return response
-                
+                async with self.semaphores[attempt_provider]:
+                    async for chunk in self._stream_request(attempt_provider, question, context):
+                        chunks.append(chunk)
+                        yield chunk
             except Exception as e:
+                if chunks:
+                    raise LLMError(f"Provider {attempt_provider.value} stream interrupted: {str(e)}") from e
                 self.logger.warning(f"Provider {attempt_provider.value} failed: {str(e)}")
                 continue
+            
+            response = LLMResponse(
+                content="".join(chunks),
+                provider=attempt_provider,
+                model=self.provider_configs[attempt_provider].model,
+                tokens_used=0,
+                response_time_ms=int((time.time() - start_time) * 1000),
+                cached=False,
+                timestamp=datetime.now(),
+                metadata={"streamed": True}
+            )
+            
+            # Cache successful response
+            if use_cache:
+                await self.response_cache.set(question, context, response)
+            if on_complete:
+                on_complete(response)
+            return
         
         raise LLMError("All LLM providers failed")
     
+    async def _stream_request(
+        self,
+        provider: LLMProvider,
+        question: str,
+        context: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Stream text chunks from a specific provider"""
+        
+        # Check rate limits and log the request in one step
+        can_request, error_msg = await self.rate_limiter.try_acquire(provider)
+        if not can_request:
+            raise LLMError(f"Rate limit exceeded: {error_msg}")
+        
+        base_kwargs = self._base_kwargs[provider]
+        client = self.providers[provider]
+        system_prompt = self.prompt_templates.build_system_prompt(context)
+        user_prompt = self.prompt_templates.build_user_prompt(question, context)
+        
+        if provider == LLMProvider.ANTHROPIC:
+            async with client.messages.stream(
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_prompt}],
+                **base_kwargs
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        elif provider in (LLMProvider.GROQ, LLMProvider.OPENAI):
+            stream = await client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                stream=True,
+                **base_kwargs
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        else:
+            raise LLMError(f"Unsupported provider: {provider}")
+    
     async def _make_request(
         self,
         provider: LLMProvider,
@@ -266,14 +513,11 @@ class LLMHandler:
     ) -> LLMResponse:
         """Make request to specific provider"""
         
-        # Check rate limits
-        can_request, error_msg = await self.rate_limiter.can_make_request(provider)
+        # Check rate limits and log the request in one step
+        can_request, error_msg = await self.rate_limiter.try_acquire(provider)
         if not can_request:
             raise LLMError(f"Rate limit exceeded: {error_msg}")
         
-        # Log request
-        await self.rate_limiter.log_request(provider)
-        
         # Get provider config
         config = self.provider_configs[provider]
         
@@ -285,11 +529,11 @@ class LLMHandler:
         
         try:
             if provider == LLMProvider.GROQ:
-                response = await self._make_groq_request(config, system_prompt, user_prompt)
+                response = await self._make_groq_request(system_prompt, user_prompt)
             elif provider == LLMProvider.OPENAI:
-                response = await self._make_openai_request(config, system_prompt, user_prompt)
+                response = await self._make_openai_request(system_prompt, user_prompt)
             elif provider == LLMProvider.ANTHROPIC:
-                response = await self._make_anthropic_request(config, system_prompt, user_prompt)
+                response = await self._make_anthropic_request(system_prompt, user_prompt)
             else:
                 raise LLMError(f"Unsupported provider: {provider}")
             
@@ -311,23 +555,18 @@ class LLMHandler:
     
     async def _make_groq_request(
         self,
-        config: LLMConfig,
         system_prompt: str,
         user_prompt: str
     ) -> Dict[str, Any]:
         """Make request to Groq"""
         client = self.providers[LLMProvider.GROQ]
         
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
-            model=config.model,
+        response = await client.chat.completions.create(
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=config.max_tokens,
-            temperature=config.temperature,
-            timeout=config.timeout
+            **self._base_kwargs[LLMProvider.GROQ]
         )
         
         return {
@@ -341,23 +580,18 @@ class LLMHandler:
     
     async def _make_openai_request(
         self,
-        config: LLMConfig,
         system_prompt: str,
         user_prompt: str
     ) -> Dict[str, Any]:
         """Make request to OpenAI"""
         client = self.providers[LLMProvider.OPENAI]
         
-        response = await asyncio.to_thread(
-            client.ChatCompletion.create,
-            model=config.model,
+        response = await client.chat.completions.create(
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=config.max_tokens,
-            temperature=config.temperature,
-            timeout=config.timeout
+            **self._base_kwargs[LLMProvider.OPENAI]
         )
         
         return {
@@ -371,21 +605,16 @@ class LLMHandler:
     
     async def _make_anthropic_request(
         self,
-        config: LLMConfig,
         system_prompt: str,
         user_prompt: str
     ) -> Dict[str, Any]:
         """Make request to Anthropic"""
         client = self.providers[LLMProvider.ANTHROPIC]
         
-        response = await asyncio.to_thread(
-            client.messages.create,
-            model=config.model,
+        response = await client.messages.create(
             system=system_prompt,
             messages=[{"role": "user", "content": user_prompt}],
-            max_tokens=config.max_tokens,
-            temperature=config.temperature,
-            timeout=config.timeout
+            **self._base_kwargs[LLMProvider.ANTHROPIC]
         )
         
         return {
@@ -424,6 +653,33 @@ class LLMHandler:
             request_type="factual"
         )
     
+    def explain_concept_stream(
+        self,
+        topic: str,
+        grade: int,
+        subject: str,
+        language: str = "English",
+        include_examples: bool = True,
+        on_complete: Optional[Callable[[LLMResponse], None]] = None
+    ) -> AsyncIterator[str]:
+        """Stream concept explanation text as it is generated"""
+        context = {
+            "type": "concept_explanation",
+            "topic": topic,
+            "grade": grade,
+            "subject": subject,
+            "language": language,
+            "include_examples": include_examples,
+            "curriculum": "NCERT"
+        }
+        
+        return self.generate_response_stream(
+            question=f"Explain the concept of {topic}",
+            context=context,
+            request_type="factual",
+            on_complete=on_complete
+        )
+    
     async def generate_quiz_question(
         self,
         topic: str,
@@ -494,17 +750,25 @@ class LLMHandler:
     
     async def get_provider_status(self) -> Dict[str, Any]:
         """Get status of all providers"""
-        status = {}
+        providers = list(LLMProvider)
+        rate_limits = await asyncio.gather(
+            *(self.rate_limiter.can_make_request(provider) for provider in providers)
+        )
         
-        for provider in LLMProvider:
-            status[provider.value] = {
+        return {
+            provider.value: {
                 "available": provider in self.providers,
-                "config": self.provider_configs[provider].__dict__ if provider in self.provider_configs else None,
+                "config": self._config_dicts.get(provider),
                 "recent_requests": len(self.rate_limiter.requests.get(provider.value, [])),
-                "rate_limit": await self.rate_limiter.can_make_request(provider)
+                "rate_limit": rate_limit
             }
-        
-        return status
+            for provider, rate_limit in zip(providers, rate_limits)
+        }
+    
+    async def close(self) -> None:
+        """Close the shared HTTP connection pool and cache connections"""
+        await self._http.aclose()
+        await self.response_cache.close()
     
     async def clear_cache(self) -> bool:
         """Clear response cache"""
@@ -3,114 +3,111 @@ Advanced Prompt Templates for ScienceGPT v3.0
 Optimized prompts for different educational contexts and Indian curriculum
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-
-
-class PromptTemplates:
-    """Advanced prompt templates for educational AI interactions"""
-    
-    def __init__(self):
-        """Initialize prompt templates"""
-        self.indian_context_examples = self._load_indian_context()
-        self.subject_specific_guidance = self._load_subject_guidance()
-        self.grade_level_adjustments = self._load_grade_adjustments()
-    
-    def build_system_prompt(self, context: Dict[str, Any]) -> str:
-        """Build comprehensive system prompt based on context"""
-        
-        prompt_type = context.get("type", "general")
-        grade = context.get("grade", 6)
-        subject = context.get("subject", "Science")
-        language = context.get("language", "English")
-        
-        base_prompt = self._get_base_system_prompt()
-        
-        # Add specific components based on type
-        if prompt_type == "concept_explanation":
-            prompt = self._build_concept_explanation_prompt(context)
-        elif prompt_type == "quiz_generation":
-            prompt = self._build_quiz_generation_prompt(context)
-        elif prompt_type == "study_suggestions":
-            prompt = self._build_study_suggestions_prompt(context)
-        elif prompt_type == "concept_map":
-            prompt = self._build_concept_map_prompt(context)
-        else:
-            prompt = self._build_general_learning_prompt(context)
-        
-        return f"{base_prompt}\n\n{prompt}"
-    
-    def build_user_prompt(self, question: str, context: Dict[str, Any]) -> str:
-        """Build user prompt with context"""
-        
-        grade = context.get("grade", 6)
-        subject = context.get("subject", "Science")
-        topic = context.get("topic", "")
-        
-        # Add context to question
-        contextual_prompt = f"""
-Student Question: {question}
-
-Educational Context:
-- Grade Level: {grade}
-- Subject: {subject}
-- Current Topic: {topic if topic else "General Science"}
-- Learning Objective: {context.get("learning_objective", "Understanding and Application")}
-
-Please provide a comprehensive, age-appropriate response that helps the student learn effectively.
-"""
-        
-        return contextual_prompt.strip()
-    
-    def _get_base_system_prompt(self) -> str:
-        """Base system prompt for all interactions"""
-        return """
-You are ScienceGPT v3.0, an expert AI tutor specialized in science education for Indian students following the NCERT curriculum.
-
-CORE IDENTITY:
-- Expert science educator with deep knowledge of Physics, Chemistry, and Biology
-- Specialized in Indian education system and NCERT curriculum (Classes 1-12)
-- Cultural awareness of Indian context, examples, and learning styles
-- Multilingual capability with focus on clear, simple explanations
-- Patient, encouraging, and adaptive teaching approach
-
-EDUCATIONAL PHILOSOPHY:
-- Learning through understanding, not memorization
-- Real-world applications with Indian context
-- Step-by-step explanations building from basics
-- Encouraging curiosity and scientific thinking
-- Making science accessible and enjoyable
-
-RESPONSE GUIDELINES:
-- Age-appropriate language and complexity
-- Clear structure with logical flow
-- Use relevant Indian examples and contexts
-- Include practical applications when possible
-- Encourage further exploration and questions
-- Maintain scientific accuracy and NCERT alignment
-
-ENGAGEMENT STYLE:
-- Friendly, patient, and supportive tone
-- Use analogies and metaphors familiar to Indian students
-- Build confidence while challenging appropriately
-- Connect concepts to everyday life in India
-- Celebrate learning progress and curiosity
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
+
+
+# Context values that recur on every request; shared copies make the
+# dict lookups and cache-key comparisons below succeed on identity
+_INTERNED_TOKENS = MappingProxyType({
+    token: sys.intern(token)
+    for token in (
+        "Science", "Physics", "Chemistry", "Biology",
+        "English", "Hindi",
+        "general", "concept_explanation", "quiz_generation", "study_suggestions", "concept_map",
+        "beginner", "intermediate", "advanced",
+        "multiple_choice", "true_false",
+    )
+})
+
+
+def intern_token(value: Any) -> Any:
+    """Return the shared copy of a common context string, or the value unchanged"""
+    if isinstance(value, str):
+        return _INTERNED_TOKENS.get(value, value)
+    return value
+
+
+# Indian context examples for different subjects
+_INDIAN_CONTEXT = MappingProxyType({
+    "Physics": (
+        "Indian Space Research Organisation (ISRO) missions",
+        "Monsoon weather patterns and atmospheric pressure",
+        "Solar energy applications in Indian villages",
+        "Indian railway systems and motion physics",
+        "Traditional Indian instruments and sound waves",
+        "Hydroelectric power in Indian rivers",
+        "Optical fibers in Indian telecommunications"
+    ),
+    "Chemistry": (
+        "Turmeric as a natural pH indicator",
+        "Traditional Indian metallurgy and bronze making",
+        "Spice chemistry and essential oils",
+        "Water purification methods in India",
+        "Indian pharmaceutical industry",
+        "Natural dyes from Indian plants",
+        "Traditional soap making with natural ingredients"
+    ),
+    "Biology": (
+        "Indian biodiversity and ecosystem",
+        "Medicinal plants in Ayurveda",
+        "Indian agricultural practices and crop rotation",
+        "Endemic species in Western Ghats",
+        "Traditional food preservation methods",
+        "Indian breeds of cattle and their adaptations",
+        "Mangrove ecosystems in Indian coasts"
+    )
+})
+
+# Subject-specific teaching guidance
+_SUBJECT_GUIDANCE = MappingProxyType({
+    "Physics": """
+- Emphasize mathematical relationships and problem-solving
+- Use everyday examples to explain abstract concepts
+- Connect to real-world applications and technology
+- Encourage experimental thinking and observation
+- Build understanding through step-by-step derivations
+""",
+    "Chemistry": """
+- Start with observable phenomena and chemical changes
+- Emphasize safety in chemical processes and experiments
+- Connect molecular level understanding to macro properties
+- Use everyday chemical reactions as learning contexts
+- Build systematic understanding of chemical principles
+""",
+    "Biology": """
+- Emphasize structure-function relationships in living systems
+- Connect to health, environment, and daily life experiences
+- Use comparative approach across different organisms
+- Encourage observation skills and scientific inquiry
+- Integrate ecological and evolutionary perspectives
 """
-    
-    def _build_concept_explanation_prompt(self, context: Dict[str, Any]) -> str:
-        """Build prompt for concept explanations"""
-        
-        grade = context.get("grade", 6)
-        subject = context.get("subject", "Science")
-        language = context.get("language", "English")
-        include_examples = context.get("include_examples", True)
-        
-        grade_level = self.grade_level_adjustments.get(grade, "intermediate")
-        subject_guidance = self.subject_specific_guidance.get(subject, "")
-        
-        prompt = f"""
+})
+
+# Grade-specific teaching adjustments
+_GRADE_ADJUSTMENTS = MappingProxyType({
+    1: "Use simple words, lots of examples, visual descriptions, basic concepts",
+    2: "Short sentences, concrete examples, hands-on learning focus",
+    3: "Simple explanations, relatable examples, encourage curiosity",
+    4: "Clear cause-and-effect relationships, practical applications",
+    5: "Introduction to scientific method, simple experiments",
+    6: "Systematic approach, basic scientific terminology, NCERT alignment",
+    7: "Conceptual understanding, mathematical relationships, real applications",
+    8: "Deeper concepts, problem-solving approach, scientific reasoning",
+    9: "Advanced concepts, analytical thinking, exam preparation focus",
+    10: "Board exam preparation, comprehensive understanding, practical applications",
+    11: "In-depth subject mastery, advanced problem-solving, JEE preparation readiness",
+    12: "Expert level concepts, competitive exam preparation, career guidance integration"
+})
+
+# Static task bodies. Each system prompt is the base prompt, one of these
+# bodies and then a short TASK PARAMETERS tail, so everything up to the tail
+# is byte-identical for a task type and can hit provider-side prompt caches.
+_CONCEPT_EXPLANATION_BODY = """
 CONCEPT EXPLANATION TASK:
-You are explaining a {subject} concept to a Grade {grade} Indian student.
+You are explaining a science concept to an Indian student. The grade, subject and language are given in TASK PARAMETERS below.
 
 EXPLANATION STRUCTURE:
 1. Simple Definition (1-2 sentences)
@@ -121,93 +118,36 @@ EXPLANATION STRUCTURE:
 6. Connection to Other Concepts
 7. Encouraging Summary
 
-GRADE {grade} CONSIDERATIONS:
-{grade_level}
-
-{subject} SPECIFIC GUIDANCE:
-{subject_guidance}
-
 LANGUAGE AND TONE:
-- Use {language} language
-- Grade {grade} appropriate vocabulary
+- Use the language given in TASK PARAMETERS
+- Vocabulary appropriate for the student's grade
 - Clear, simple sentences
 - Encouraging and positive tone
 
 INDIAN CONTEXT REQUIREMENTS:
-{'- Include relevant Indian examples and applications' if include_examples else '- Keep examples general but relatable'}
+- Follow the examples requirement in TASK PARAMETERS
 - Reference familiar Indian scenarios
 - Consider Indian educational and cultural context
 - Use measurements and units commonly used in India
 
 QUALITY STANDARDS:
 - Scientifically accurate according to NCERT standards
-- Pedagogically sound for the grade level  
+- Pedagogically sound for the grade level
 - Engaging and memorable presentation
 - Practical relevance to student's life in India
 """
-        
-        return prompt
-    
-    def _build_quiz_generation_prompt(self, context: Dict[str, Any]) -> str:
-        """Build prompt for quiz question generation"""
-        
-        grade = context.get("grade", 6)
-        subject = context.get("subject", "Science")
-        difficulty = context.get("difficulty", "intermediate")
-        question_type = context.get("question_type", "multiple_choice")
-        num_options = context.get("num_options", 4)
-        
-        prompt = f"""
+
+_QUIZ_GENERATION_BODY = """
 QUIZ QUESTION GENERATION TASK:
-Create a high-quality {difficulty} level {question_type} question for Grade {grade} {subject}.
+Create one high-quality quiz question. The difficulty, question type, grade and subject are given in TASK PARAMETERS below.
 
 QUESTION REQUIREMENTS:
 - Clear, unambiguous question stem
-- Grade {grade} appropriate vocabulary and concepts
+- Vocabulary and concepts appropriate for the grade
 - Aligned with NCERT curriculum standards
 - Tests understanding, not just memorization
 - Culturally relevant to Indian students
 
-{question_type.upper()} SPECIFIC FORMAT:
-"""
-        
-        if question_type == "multiple_choice":
-            prompt += f"""
-- Question stem ending with clear query
-- {num_options} answer options (A, B, C, D)
-- One clearly correct answer
-- Plausible but incorrect distractors
-- Options similar in length and structure
-
-ANSWER EXPLANATION:
-- Brief explanation of why the correct answer is right
-- Why other options are incorrect (learning opportunity)
-- Additional concept reinforcement
-"""
-        
-        elif question_type == "true_false":
-            prompt += """
-- Clear statement that is definitively true or false
-- No ambiguous or partially correct statements
-- Test important concept understanding
-
-EXPLANATION:
-- Clear justification for the correct answer
-- Clarification of any potential confusion
-"""
-        
-        prompt += f"""
-DIFFICULTY LEVEL - {difficulty.upper()}:
-"""
-        
-        if difficulty == "beginner":
-            prompt += "- Test basic recall and simple understanding\n- Direct application of learned facts\n- Single concept focus"
-        elif difficulty == "intermediate":
-            prompt += "- Test application and analysis\n- Connection between related concepts\n- Problem-solving with guidance"
-        else:  # advanced
-            prompt += "- Test synthesis and evaluation\n- Multiple concept integration\n- Critical thinking and reasoning"
-        
-        prompt += """
 INDIAN CONTEXT:
 - Use familiar Indian examples when appropriate
 - Reference Indian scientists, discoveries, or applications
@@ -222,25 +162,10 @@ Explanation: [Educational explanation]
 Difficulty: [Confirmed difficulty level]
 Learning Objective: [What this tests]
 """
-        
-        return prompt
-    
-    def _build_study_suggestions_prompt(self, context: Dict[str, Any]) -> str:
-        """Build prompt for personalized study suggestions"""
-        
-        grade = context.get("student_grade", 6)
-        weak_subjects = context.get("weak_subjects", [])
-        strong_subjects = context.get("strong_subjects", [])
-        
-        prompt = f"""
-PERSONALIZED STUDY SUGGESTIONS TASK:
-Create tailored study recommendations for a Grade {grade} Indian student.
 
-STUDENT PROFILE:
-- Grade Level: {grade}
-- Stronger Areas: {', '.join(strong_subjects) if strong_subjects else 'Not specified'}
-- Areas for Improvement: {', '.join(weak_subjects) if weak_subjects else 'Not specified'}
-- Educational System: NCERT/Indian curriculum
+_STUDY_SUGGESTIONS_BODY = """
+PERSONALIZED STUDY SUGGESTIONS TASK:
+Create tailored study recommendations for an Indian student following the NCERT curriculum. The student profile is given in TASK PARAMETERS below.
 
 SUGGESTIONS STRUCTURE:
 1. Priority Focus Areas (2-3 most important topics)
@@ -272,31 +197,20 @@ OUTPUT STYLE:
 - Organized and easy to follow
 - Culturally sensitive to Indian context
 """
-        
-        return prompt
-    
-    def _build_concept_map_prompt(self, context: Dict[str, Any]) -> str:
-        """Build prompt for concept map generation"""
-        
-        topic = context.get("topic", "Science Topic")
-        grade = context.get("grade", 6)
-        subject = context.get("subject", "Science")
-        max_nodes = context.get("max_nodes", 15)
-        
-        prompt = f"""
+
+_CONCEPT_MAP_BODY = """
 CONCEPT MAP GENERATION TASK:
-Create a hierarchical concept map structure for "{topic}" suitable for Grade {grade} {subject}.
+Create a hierarchical concept map structure. The central topic, node limit, grade and subject are given in TASK PARAMETERS below.
 
 CONCEPT MAP REQUIREMENTS:
-- Central topic: {topic}
-- Maximum {max_nodes} nodes total
+- Stay within the maximum number of nodes
 - 3-4 hierarchy levels maximum
 - Clear relationships between concepts
-- Age-appropriate for Grade {grade}
+- Age-appropriate for the grade
 - NCERT curriculum alignment
 
 STRUCTURE FORMAT:
-Main Topic: {topic}
+Main Topic: [Central topic]
 ├── Primary Concept 1
 │   ├── Sub-concept 1.1
 │   └── Sub-concept 1.2
@@ -334,19 +248,10 @@ OUTPUT FORMAT:
 4. Suggested sequence for teaching
 5. Assessment questions for understanding
 """
-        
-        return prompt
-    
-    def _build_general_learning_prompt(self, context: Dict[str, Any]) -> str:
-        """Build prompt for general learning interactions"""
-        
-        grade = context.get("grade", 6)
-        subject = context.get("subject", "Science")
-        language = context.get("language", "English")
-        
-        prompt = f"""
+
+_GENERAL_LEARNING_BODY = """
 GENERAL LEARNING INTERACTION:
-Provide educational support for a Grade {grade} {subject} student's question.
+Provide educational support for a student's science question. The grade, subject and language are given in TASK PARAMETERS below.
 
 RESPONSE APPROACH:
 1. Acknowledge the question positively
@@ -356,14 +261,14 @@ RESPONSE APPROACH:
 5. Encourage further exploration
 
 EDUCATIONAL STANDARDS:
-- Grade {grade} appropriate complexity
-- NCERT curriculum alignment  
+- Complexity appropriate for the grade
+- NCERT curriculum alignment
 - Scientific accuracy and precision
 - Clear, logical explanation flow
 - Encouraging learning atmosphere
 
 LANGUAGE AND COMMUNICATION:
-- Use {language} language
+- Use the language given in TASK PARAMETERS
 - Grade-appropriate vocabulary
 - Clear, simple sentence structure
 - Engaging and friendly tone
@@ -383,80 +288,284 @@ INDIAN EDUCATIONAL CONTEXT:
 - Support holistic science understanding
 - Encourage scientific temperament
 """
+
+# Fixed fragments of the quiz parameters, selected by question type and difficulty
+_QUIZ_FORMAT_SECTIONS = MappingProxyType({
+    "multiple_choice": """
+- Question stem ending with clear query
+- {num_options} answer options (A, B, C, D)
+- One clearly correct answer
+- Plausible but incorrect distractors
+- Options similar in length and structure
+
+ANSWER EXPLANATION:
+- Brief explanation of why the correct answer is right
+- Why other options are incorrect (learning opportunity)
+- Additional concept reinforcement
+""",
+    "true_false": """
+- Clear statement that is definitively true or false
+- No ambiguous or partially correct statements
+- Test important concept understanding
+
+EXPLANATION:
+- Clear justification for the correct answer
+- Clarification of any potential confusion
+""",
+})
+
+_QUIZ_DIFFICULTY_GUIDANCE = MappingProxyType({
+    "beginner": "- Test basic recall and simple understanding\n- Direct application of learned facts\n- Single concept focus\n",
+    "intermediate": "- Test application and analysis\n- Connection between related concepts\n- Problem-solving with guidance\n",
+    "advanced": "- Test synthesis and evaluation\n- Multiple concept integration\n- Critical thinking and reasoning\n",
+})
+
+# Examples line of the concept explanation parameters
+_EXAMPLES_REQUIREMENT = MappingProxyType({
+    True: "Include relevant Indian examples and applications",
+    False: "Keep examples general but relatable",
+})
+
+# Fixed text of the per-question user prompt
+_USER_PROMPT_CLOSING = (
+    "\n\nPlease provide a comprehensive, age-appropriate response "
+    "that helps the student learn effectively."
+)
+
+
+@lru_cache(maxsize=32)
+def _compact_guidance(guidance: str) -> str:
+    """Collapse a bulleted guidance block into one semicolon-separated line"""
+    items = [line.lstrip("- ").strip() for line in guidance.splitlines()]
+    return "; ".join(item for item in items if item)
+
+
+@lru_cache(maxsize=512)
+def _join_system_prompt(base_prompt: str, section_prompt: str) -> str:
+    """Combine the base prompt with a task section"""
+    return f"{base_prompt}\n\n{section_prompt}"
+
+
+@lru_cache(maxsize=512)
+def _concept_explanation_prompt(
+    grade: int,
+    subject: str,
+    language: str,
+    include_examples: bool,
+    grade_level: str,
+    subject_guidance: str
+) -> str:
+    """Build the concept explanation section"""
+    guidance = _compact_guidance(subject_guidance)
+    guidance_line = f"- Subject Guidance: {guidance}\n" if guidance else ""
+    
+    return f"""{_CONCEPT_EXPLANATION_BODY}
+TASK PARAMETERS:
+- Grade: {grade}
+- Subject: {subject}
+- Language: {language}
+- Examples: {_EXAMPLES_REQUIREMENT[bool(include_examples)]}
+- Grade Style: {grade_level}
+{guidance_line}"""
+
+
+@lru_cache(maxsize=512)
+def _quiz_generation_prompt(
+    grade: int,
+    subject: str,
+    difficulty: str,
+    question_type: str,
+    num_options: int
+) -> str:
+    """Build the quiz generation section"""
+    return "".join((
+        _QUIZ_GENERATION_BODY,
+        "\nTASK PARAMETERS:\n- Difficulty: ", str(difficulty),
+        "\n- Question Type: ", str(question_type),
+        "\n- Grade: ", str(grade),
+        "\n- Subject: ", str(subject),
+        "\n\n", str(question_type).upper(), " SPECIFIC FORMAT:\n",
+        _QUIZ_FORMAT_SECTIONS.get(question_type, "").format(num_options=num_options),
+        "\nDIFFICULTY LEVEL - ", str(difficulty).upper(), ":\n",
+        _QUIZ_DIFFICULTY_GUIDANCE.get(difficulty, _QUIZ_DIFFICULTY_GUIDANCE["advanced"])
+    ))
+
+
+@lru_cache(maxsize=512)
+def _study_suggestions_prompt(
+    grade: int,
+    weak_subjects: Tuple[str, ...],
+    strong_subjects: Tuple[str, ...]
+) -> str:
+    """Build the study suggestions section"""
+    return f"""{_STUDY_SUGGESTIONS_BODY}
+TASK PARAMETERS:
+- Grade Level: {grade}
+- Stronger Areas: {', '.join(strong_subjects) if strong_subjects else 'Not specified'}
+- Areas for Improvement: {', '.join(weak_subjects) if weak_subjects else 'Not specified'}
+"""
+
+
+@lru_cache(maxsize=512)
+def _concept_map_prompt(
+    topic: str,
+    grade: int,
+    subject: str,
+    max_nodes: int
+) -> str:
+    """Build the concept map section"""
+    return f"""{_CONCEPT_MAP_BODY}
+TASK PARAMETERS:
+- Central Topic: "{topic}"
+- Maximum Nodes: {max_nodes}
+- Grade: {grade}
+- Subject: {subject}
+"""
+
+
+@lru_cache(maxsize=512)
+def _general_learning_prompt(
+    grade: int,
+    subject: str,
+    language: str
+) -> str:
+    """Build the general learning section"""
+    return f"""{_GENERAL_LEARNING_BODY}
+TASK PARAMETERS:
+- Grade: {grade}
+- Subject: {subject}
+- Language: {language}
+"""
+
+
+class PromptTemplates:
+    """Advanced prompt templates for educational AI interactions"""
+    
+    def __init__(self):
+        """Initialize prompt templates"""
+        self.indian_context_examples = _INDIAN_CONTEXT
+        self.subject_specific_guidance = _SUBJECT_GUIDANCE
+        self.grade_level_adjustments = _GRADE_ADJUSTMENTS
         
-        return prompt
+        # The base prompt is constant; sections are memoized by their inputs
+        self._base_prompt = self._get_base_system_prompt()
     
-    def _load_indian_context(self) -> Dict[str, List[str]]:
-        """Load Indian context examples for different subjects"""
-        return {
-            "Physics": [
-                "Indian Space Research Organisation (ISRO) missions",
-                "Monsoon weather patterns and atmospheric pressure",
-                "Solar energy applications in Indian villages",
-                "Indian railway systems and motion physics",
-                "Traditional Indian instruments and sound waves",
-                "Hydroelectric power in Indian rivers",
-                "Optical fibers in Indian telecommunications"
-            ],
-            "Chemistry": [
-                "Turmeric as a natural pH indicator",
-                "Traditional Indian metallurgy and bronze making",
-                "Spice chemistry and essential oils",
-                "Water purification methods in India",
-                "Indian pharmaceutical industry",
-                "Natural dyes from Indian plants",
-                "Traditional soap making with natural ingredients"
-            ],
-            "Biology": [
-                "Indian biodiversity and ecosystem",
-                "Medicinal plants in Ayurveda",
-                "Indian agricultural practices and crop rotation",
-                "Endemic species in Western Ghats",
-                "Traditional food preservation methods",
-                "Indian breeds of cattle and their adaptations",
-                "Mangrove ecosystems in Indian coasts"
-            ]
-        }
+    def build_system_prompt(self, context: Dict[str, Any]) -> str:
+        """Build comprehensive system prompt based on context"""
+        
+        # Add specific components based on type
+        build_section = self._SECTION_BUILDERS.get(
+            intern_token(context.get("type", "general")), PromptTemplates._build_general_learning_prompt
+        )
+        
+        return _join_system_prompt(self._base_prompt, build_section(self, context))
     
-    def _load_subject_guidance(self) -> Dict[str, str]:
-        """Load subject-specific teaching guidance"""
-        return {
-            "Physics": """
-- Emphasize mathematical relationships and problem-solving
-- Use everyday examples to explain abstract concepts
-- Connect to real-world applications and technology
-- Encourage experimental thinking and observation
-- Build understanding through step-by-step derivations
-""",
-            "Chemistry": """
-- Start with observable phenomena and chemical changes
-- Emphasize safety in chemical processes and experiments
-- Connect molecular level understanding to macro properties
-- Use everyday chemical reactions as learning contexts
-- Build systematic understanding of chemical principles
-""",
-            "Biology": """
-- Emphasize structure-function relationships in living systems
-- Connect to health, environment, and daily life experiences
-- Use comparative approach across different organisms
-- Encourage observation skills and scientific inquiry
-- Integrate ecological and evolutionary perspectives
+    def build_user_prompt(self, question: str, context: Dict[str, Any]) -> str:
+        """Build user prompt with context"""
+        
+        grade = context.get("grade", 6)
+        subject = context.get("subject", "Science")
+        topic = context.get("topic", "")
+        
+        # Only the question and context values vary between calls
+        return "".join((
+            "Student Question: ", question,
+            "\n\nEducational Context:\n- Grade Level: ", str(grade),
+            "\n- Subject: ", str(subject),
+            "\n- Current Topic: ", str(topic) if topic else "General Science",
+            "\n- Learning Objective: ", str(context.get("learning_objective", "Understanding and Application")),
+            _USER_PROMPT_CLOSING
+        ))
+    
+    def _get_base_system_prompt(self) -> str:
+        """Base system prompt for all interactions"""
+        return """
+You are ScienceGPT v3.0, an expert AI tutor specialized in science education for Indian students following the NCERT curriculum.
+
+CORE IDENTITY:
+- Expert science educator with deep knowledge of Physics, Chemistry, and Biology
+- Specialized in Indian education system and NCERT curriculum (Classes 1-12)
+- Cultural awareness of Indian context, examples, and learning styles
+- Multilingual capability with focus on clear, simple explanations
+- Patient, encouraging, and adaptive teaching approach
+
+EDUCATIONAL PHILOSOPHY:
+- Learning through understanding, not memorization
+- Real-world applications with Indian context
+- Step-by-step explanations building from basics
+- Encouraging curiosity and scientific thinking
+- Making science accessible and enjoyable
+
+RESPONSE GUIDELINES:
+- Age-appropriate language and complexity
+- Clear structure with logical flow
+- Use relevant Indian examples and contexts
+- Include practical applications when possible
+- Encourage further exploration and questions
+- Maintain scientific accuracy and NCERT alignment
+
+ENGAGEMENT STYLE:
+- Friendly, patient, and supportive tone
+- Use analogies and metaphors familiar to Indian students
+- Build confidence while challenging appropriately
+- Connect concepts to everyday life in India
+- Celebrate learning progress and curiosity
 """
-        }
     
-    def _load_grade_adjustments(self) -> Dict[int, str]:
-        """Load grade-specific teaching adjustments"""
-        return {
-            1: "Use simple words, lots of examples, visual descriptions, basic concepts",
-            2: "Short sentences, concrete examples, hands-on learning focus",
-            3: "Simple explanations, relatable examples, encourage curiosity",
-            4: "Clear cause-and-effect relationships, practical applications",
-            5: "Introduction to scientific method, simple experiments",
-            6: "Systematic approach, basic scientific terminology, NCERT alignment",
-            7: "Conceptual understanding, mathematical relationships, real applications",
-            8: "Deeper concepts, problem-solving approach, scientific reasoning",
-            9: "Advanced concepts, analytical thinking, exam preparation focus",
-            10: "Board exam preparation, comprehensive understanding, practical applications",
-            11: "In-depth subject mastery, advanced problem-solving, JEE preparation readiness",
-            12: "Expert level concepts, competitive exam preparation, career guidance integration"
-        }
+    def _build_concept_explanation_prompt(self, context: Dict[str, Any]) -> str:
+        """Build prompt for concept explanations"""
+        
+        grade = context.get("grade", 6)
+        subject = intern_token(context.get("subject", "Science"))
+        
+        return _concept_explanation_prompt(
+            grade,
+            subject,
+            intern_token(context.get("language", "English")),
+            context.get("include_examples", True),
+            self.grade_level_adjustments.get(grade, "intermediate"),
+            self.subject_specific_guidance.get(subject, "")
+        )
+    
+    def _build_quiz_generation_prompt(self, context: Dict[str, Any]) -> str:
+        """Build prompt for quiz question generation"""
+        return _quiz_generation_prompt(
+            context.get("grade", 6),
+            intern_token(context.get("subject", "Science")),
+            intern_token(context.get("difficulty", "intermediate")),
+            intern_token(context.get("question_type", "multiple_choice")),
+            context.get("num_options", 4)
+        )
+    
+    def _build_study_suggestions_prompt(self, context: Dict[str, Any]) -> str:
+        """Build prompt for personalized study suggestions"""
+        return _study_suggestions_prompt(
+            context.get("student_grade", 6),
+            tuple(context.get("weak_subjects", ())),
+            tuple(context.get("strong_subjects", ()))
+        )
+    
+    def _build_concept_map_prompt(self, context: Dict[str, Any]) -> str:
+        """Build prompt for concept map generation"""
+        return _concept_map_prompt(
+            context.get("topic", "Science Topic"),
+            context.get("grade", 6),
+            intern_token(context.get("subject", "Science")),
+            context.get("max_nodes", 15)
+        )
+    
+    def _build_general_learning_prompt(self, context: Dict[str, Any]) -> str:
+        """Build prompt for general learning interactions"""
+        return _general_learning_prompt(
+            context.get("grade", 6),
+            intern_token(context.get("subject", "Science")),
+            intern_token(context.get("language", "English"))
+        )
+    
+    # Prompt type -> section builder, shared by all instances
+    _SECTION_BUILDERS = MappingProxyType({
+        "concept_explanation": _build_concept_explanation_prompt,
+        "quiz_generation": _build_quiz_generation_prompt,
+        "study_suggestions": _build_study_suggestions_prompt,
+        "concept_map": _build_concept_map_prompt,
+    })
@@ -6,25 +6,198 @@ High-performance caching system with intelligent key generation and TTL manageme
 import asyncio
 import hashlib
 import json
+import gzip
+import heapq
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import re
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-import pickle
-import gzip
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 from pathlib import Path
 
-from .llm_handler import LLMResponse, LLMProvider
+# Fast hashing/serialization, with stdlib fallbacks
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Shared cache tier across processes and Streamlit sessions
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+REDIS_KEY_PREFIX = "sciencegpt:cache:"
+
+# One-byte codec tags prefixed to serialized payloads
+CODEC_RAW = b"r"
+CODEC_GZIP = b"g"
+CODEC_ZSTD = b"z"
+
+if ZSTD_AVAILABLE:
+    _ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+
+from .prompt_templates import intern_token
 from ..config import get_settings
 
+if TYPE_CHECKING:
+    from .llm_handler import LLMResponse
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize a JSON-compatible dict to bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Deserialize bytes produced by _dumps"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_payload(data: bytes, compression_threshold: int) -> bytes:
+    """Tag a serialized payload with its codec, compressing it above the threshold"""
+    if len(data) <= compression_threshold:
+        return CODEC_RAW + data
+    if ZSTD_AVAILABLE:
+        return CODEC_ZSTD + _ZSTD_COMPRESSOR.compress(data)
+    return CODEC_GZIP + gzip.compress(data, compresslevel=1)
+
+
+def _decode_payload(raw: bytes) -> bytes:
+    """Reverse _encode_payload; untagged JSON from older versions passes through"""
+    codec, body = raw[:1], raw[1:]
+    if codec == CODEC_RAW:
+        return body
+    if codec == CODEC_ZSTD:
+        return _ZSTD_DECOMPRESSOR.decompress(body)
+    if codec == CODEC_GZIP:
+        return gzip.decompress(body)
+    return raw
+
+
+def _response_to_dict(response: "LLMResponse") -> Dict[str, Any]:
+    """Convert a response to a JSON-compatible dict"""
+    data = asdict(response)
+    data["provider"] = response.provider.value
+    data["timestamp"] = response.timestamp.isoformat()
+    return data
+
+
+def _response_from_dict(data: Dict[str, Any]) -> "LLMResponse":
+    """Rebuild a response from _response_to_dict output"""
+    # Imported here: llm_handler imports this module at load time
+    from .llm_handler import LLMProvider, LLMResponse
+    
+    data = dict(data)
+    data["provider"] = LLMProvider(data["provider"])
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    return LLMResponse(**data)
+
+
+def _cached_copy(response: "LLMResponse") -> "LLMResponse":
+    """Copy a response flagged as cached, so callers never share one object"""
+    return replace(response, cached=True, metadata=dict(response.metadata))
+
+
+# Question canonicalization so trivially different phrasings share a key
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s?.!,;:]+$")
+
+
+def _canonicalize_question(question: str) -> str:
+    """Fold case, Unicode forms, whitespace runs and trailing punctuation"""
+    question = unicodedata.normalize("NFKC", question).casefold()
+    return _TRAILING_PUNCT_RE.sub("", _WHITESPACE_RE.sub(" ", question)).strip()
+
+
+# Rough per-entry overhead for the entry object, its key and metadata
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+def _encode_response(response: "LLMResponse", compression_threshold: int) -> bytes:
+    """Serialize a response to a codec-tagged payload"""
+    return _encode_payload(_dumps(_response_to_dict(response)), compression_threshold)
+
+
+def _decode_response(payload: bytes) -> "LLMResponse":
+    """Rebuild a response from an _encode_response payload"""
+    return _response_from_dict(_loads(_decode_payload(payload)))
+
+
+def _project_context(context: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Project a context onto the fields that affect the answer"""
+    return (
+        context.get("grade", 6),
+        intern_token(context.get("subject", "Science")),
+        intern_token(context.get("language", "English")),
+        intern_token(context.get("type", "general")),
+        context.get("include_examples", True)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _key_for(
+    question: str,
+    grade: int,
+    subject: str,
+    language: str,
+    request_type: str,
+    include_examples: bool
+) -> str:
+    """Hash a question and its context projection into a cache key"""
+    
+    # Fixed field order with NUL separators; no JSON encoding needed
+    payload = b"\x00".join((
+        _canonicalize_question(question).encode("utf-8"),
+        str(grade).encode(),
+        str(subject).encode("utf-8"),
+        str(language).encode("utf-8"),
+        str(request_type).encode("utf-8"),
+        b"1" if include_examples else b"0"
+    ))
+    
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
 
 @dataclass
 class CacheEntry:
     """Cache entry with metadata"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "key", "payload", "created_at", "accessed_at",
+        "access_count", "ttl_seconds", "compressed", "size_bytes"
+    )
+    
     key: str
-    response: LLMResponse
-    created_at: datetime
-    accessed_at: datetime
+    payload: bytes      # codec-tagged serialized LLMResponse
+    created_at: float   # time.monotonic() seconds
+    accessed_at: float
     access_count: int
     ttl_seconds: int
     compressed: bool
@@ -40,53 +213,121 @@ class ResponseCache:
         self.logger = logging.getLogger(__name__)
         
         # Cache storage
-        self.cache: Dict[str, CacheEntry] = {}
+        # Kept in LRU order: least recently used first
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.cache_stats = {
             "hits": 0,
             "misses": 0,
-            "evictions": 0,
-            "total_entries": 0,
-            "total_size_bytes": 0
+            "evictions": 0
         }
+        self._total_bytes = 0  # Entry count is len(self.cache)
+        
+        # Monotonic reference point for reporting entry times as wall-clock
+        self._epoch_wall = datetime.now()
+        self._epoch_mono = time.monotonic()
+        
+        # Live objects for the most recently read entries, so hot keys skip
+        # deserialization; everything else is held as compact bytes
+        self._hot: "OrderedDict[str, LLMResponse]" = OrderedDict()
+        self.hot_entries = 64
+        
+        # (monotonic expiry, key) pairs so maintenance only visits due entries
+        self._expiry_heap: List[Tuple[float, str]] = []
         
         # Cache configuration
         self.max_entries = 10000
         self.max_size_mb = 500
         self.default_ttl = self.settings.cache_ttl
-        self.compression_threshold = 1024  # Compress entries > 1KB
+        self.compression_threshold = 1024  # Compress payloads > 1KB
+        
+        # Optional Redis tier shared by all sessions and workers
+        self.redis = None
+        if REDIS_AVAILABLE and self.settings.enable_caching and self.settings.enable_redis_cache:
+            try:
+                self.redis = aioredis.from_url(self.settings.redis_url)
+            except Exception as e:
+                self.logger.warning(f"Failed to initialize Redis cache: {str(e)}")
         
-        # Start background maintenance
-        if self.settings.enable_caching:
-            asyncio.create_task(self._maintenance_loop())
+        # Optional on-disk tier that keeps evicted entries out of the LLM path
+        self.disk: Optional[sqlite3.Connection] = None
+        if self.settings.enable_caching and self.settings.enable_disk_cache:
+            try:
+                self.disk = self._open_disk_cache(self.settings.disk_cache_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to initialize disk cache: {str(e)}")
+        # Rows of evicted entries awaiting their batched disk write, and the
+        # lock serializing every use of the shared connection across threads
+        self._pending_demotions: List[Tuple[str, float, bytes]] = []
+        self._disk_lock: Optional[asyncio.Lock] = None
+        
+        # Start background maintenance once an event loop is running
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._start_maintenance()
     
-    def _generate_cache_key(self, question: str, context: Dict[str, Any]) -> str:
-        """Generate consistent cache key from question and context"""
+    def _start_maintenance(self) -> None:
+        """Start the maintenance loop if caching is on and a loop is running"""
         
-        # Extract relevant context for key generation
-        key_context = {
-            "question": question.lower().strip(),
-            "grade": context.get("grade", 6),
-            "subject": context.get("subject", "Science"),
-            "language": context.get("language", "English"),
-            "type": context.get("type", "general"),
-            "include_examples": context.get("include_examples", True)
-        }
+        if self._maintenance_task is not None or not self.settings.enable_caching:
+            return
         
-        # Create deterministic key
-        key_string = json.dumps(key_context, sort_keys=True)
-        return hashlib.sha256(key_string.encode()).hexdigest()[:32]
+        try:
+            self._maintenance_task = asyncio.get_running_loop().create_task(self._maintenance_loop())
+        except RuntimeError:
+            # Constructed outside an event loop; set() starts it later
+            pass
+    
+    def _generate_cache_key(self, question: str, context: Dict[str, Any]) -> str:
+        """Generate consistent cache key from question and context"""
+        return _key_for(question, *_project_context(context))
     
-    async def get(self, question: str, context: Dict[str, Any]) -> Optional[LLMResponse]:
+    def _generate_cache_keys(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Generate cache keys for a batch of (question, context) pairs"""
+        return [_key_for(question, *_project_context(context)) for question, context in items]
+    
+    def make_key(self, question: str, context: Dict[str, Any]) -> str:
+        """Public access to the cache key used for a question and context"""
+        return self._generate_cache_key(question, context)
+    
+    async def get(self, question: str, context: Dict[str, Any]) -> Optional["LLMResponse"]:
         """Get cached response if available and valid"""
         
         if not self.settings.enable_caching:
             return None
         
-        key = self._generate_cache_key(question, context)
+        return await self._get_by_key(self._generate_cache_key(question, context), context)
+    
+    async def get_many(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Optional["LLMResponse"]]:
+        """Get cached responses for a batch of (question, context) pairs, in order"""
+        
+        if not self.settings.enable_caching:
+            return [None] * len(items)
+        
+        keys = self._generate_cache_keys(items)
+        return [await self._get_by_key(key, context) for key, (_, context) in zip(keys, items)]
+    
+    async def _get_by_key(self, key: str, context: Dict[str, Any]) -> Optional["LLMResponse"]:
+        """Look up a key in the local cache, falling back to disk and then Redis"""
         
         if key not in self.cache:
-            self.cache_stats["misses"] += 1
-            return None
+            disk_hit = await self._disk_get(key)
+            if disk_hit is not None:
+                payload, remaining_ttl = disk_hit
+                entry = self._make_entry(key, payload, remaining_ttl)
+                await self._insert_entry(entry)
+                response = self._entry_response(entry)
+                self.cache_stats["hits"] += 1
+                return response
+            
+            response = await self._redis_get(key)
+            if response is None:
+                self.cache_stats["misses"] += 1
+                return None
+            
+            # Promote shared entry into the local cache
+            response.cached = True
+            await self._store(key, context, response)
+            self.cache_stats["hits"] += 1
+            return response
         
         entry = self.cache[key]
         
@@ -97,61 +338,220 @@ class ResponseCache:
             return None
         
         # Update access information
-        entry.accessed_at = datetime.now()
+        entry.accessed_at = time.monotonic()
         entry.access_count += 1
+        self.cache.move_to_end(key)
         
         # Create response with cache flag
-        response = entry.response
-        response.cached = True
+        response = self._entry_response(entry)
         
         self.cache_stats["hits"] += 1
         self.logger.debug(f"Cache hit for key: {key[:8]}...")
         
         return response
     
-    async def set(self, question: str, context: Dict[str, Any], response: LLMResponse) -> bool:
-        """Cache response with intelligent TTL and compression"""
+    async def set(self, question: str, context: Dict[str, Any], response: "LLMResponse") -> bool:
+        """Cache response with intelligent TTL"""
         
         if not self.settings.enable_caching:
             return False
         
+        self._start_maintenance()
         key = self._generate_cache_key(question, context)
         
+        stored, ttl = await self._store(key, context, response)
+        if stored:
+            await self._redis_set(key, self.cache[key].payload, ttl)
+        
+        return stored
+    
+    async def _store(self, key: str, context: Dict[str, Any], response: "LLMResponse") -> Tuple[bool, int]:
+        """Store response in the local cache, returning success and the TTL used"""
+        
         # Determine TTL based on response type and quality
         ttl = self._calculate_ttl(context, response)
         
         # Serialize and optionally compress response
-        data = pickle.dumps(response)
-        compressed = False
+        entry = self._make_entry(key, _encode_response(response, self.compression_threshold), ttl)
+        
+        stored = await self._insert_entry(entry)
+        if stored:
+            self._remember_hot(key, response)
+            self.logger.debug(f"Cached response for key: {key[:8]}... (TTL: {ttl}s)")
         
-        if len(data) > self.compression_threshold:
-            data = gzip.compress(data)
-            compressed = True
+        return stored, ttl
+    
+    def _make_entry(self, key: str, payload: bytes, ttl: int,
+                    age_seconds: float = 0.0, access_count: int = 1) -> CacheEntry:
+        """Build an entry for a serialized payload"""
         
-        # Create cache entry
-        entry = CacheEntry(
+        now = time.monotonic()
+        return CacheEntry(
             key=key,
-            response=response,
-            created_at=datetime.now(),
-            accessed_at=datetime.now(),
-            access_count=1,
+            payload=payload,
+            created_at=now - age_seconds,
+            accessed_at=now,
+            access_count=access_count,
             ttl_seconds=ttl,
-            compressed=compressed,
-            size_bytes=len(data)
+            compressed=payload[:1] != CODEC_RAW,
+            size_bytes=len(payload) + _ENTRY_OVERHEAD_BYTES
         )
+    
+    def _entry_response(self, entry: CacheEntry) -> "LLMResponse":
+        """Return a cached-flagged copy of an entry's response, deserializing cold entries"""
+        
+        response = self._hot.get(entry.key)
+        if response is None:
+            response = _decode_response(entry.payload)
+            self._remember_hot(entry.key, response)
+        else:
+            self._hot.move_to_end(entry.key)
+        
+        return _cached_copy(response)
+    
+    def _remember_hot(self, key: str, response: "LLMResponse") -> None:
+        """Keep a private copy of a recently used response, dropping the coldest"""
+        
+        self._hot[key] = _cached_copy(response)
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+    
+    async def _insert_entry(self, entry: CacheEntry) -> bool:
+        """Add an entry at the most recently used end, enforcing cache limits"""
+        
+        # Nothing up to the insert suspends, so concurrent sets of one key
+        # cannot both pass the removal and count the entry's bytes twice
+        
+        # Replacing an entry re-inserts it at the most recently used end
+        await self._remove_entry(entry.key)
+        
+        # Check cache limits before adding; evictions only queue their disk rows
+        stored = await self._check_and_enforce_limits()
+        if stored:
+            self.cache[entry.key] = entry
+            self._total_bytes += entry.size_bytes
+            heapq.heappush(self._expiry_heap, (entry.created_at + entry.ttl_seconds, entry.key))
+        
+        await self._flush_demotions()
+        return stored
+    
+    async def _redis_get(self, key: str) -> Optional["LLMResponse"]:
+        """Look up a response in the shared Redis tier"""
+        
+        if self.redis is None:
+            return None
+        
+        try:
+            raw = await self.redis.get(REDIS_KEY_PREFIX + key)
+            return _decode_response(raw) if raw else None
+        except Exception as e:
+            self.logger.warning(f"Redis cache lookup failed: {str(e)}")
+            return None
+    
+    async def _redis_set(self, key: str, payload: bytes, ttl: int) -> None:
+        """Write a serialized response to the shared Redis tier with matching expiry"""
+        
+        if self.redis is None:
+            return
         
-        # Check cache limits before adding
-        if await self._check_and_enforce_limits():
-            self.cache[key] = entry
-            self.cache_stats["total_entries"] += 1
-            self.cache_stats["total_size_bytes"] += entry.size_bytes
+        try:
+            await self.redis.set(REDIS_KEY_PREFIX + key, payload, ex=ttl)
+        except Exception as e:
+            self.logger.warning(f"Redis cache write failed: {str(e)}")
+    
+    def _open_disk_cache(self, path: str) -> sqlite3.Connection:
+        """Open (creating if needed) the SQLite file backing the disk tier"""
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+        return conn
+    
+    def _disk_access(self) -> asyncio.Lock:
+        """Lock held around every use of the disk tier connection"""
+        
+        # Created on first use, inside the loop that runs the cache
+        if self._disk_lock is None:
+            self._disk_lock = asyncio.Lock()
+        return self._disk_lock
+    
+    async def _disk_get(self, key: str) -> Optional[Tuple[bytes, int]]:
+        """Read a serialized response and its remaining TTL from the disk tier"""
+        
+        if self.disk is None:
+            return None
+        
+        async with self._disk_access():
+            if self.disk is None:
+                return None
             
-            self.logger.debug(f"Cached response for key: {key[:8]}... (TTL: {ttl}s)")
-            return True
+            try:
+                row = self.disk.execute(
+                    "SELECT expires_at, payload FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                remaining_ttl = int(row[0] - time.time())
+                if remaining_ttl <= 0:
+                    self.disk.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                
+                return bytes(row[1]), remaining_ttl
+            except Exception as e:
+                self.logger.warning(f"Disk cache lookup failed: {str(e)}")
+                return None
+    
+    async def _flush_demotions(self) -> None:
+        """Write queued eviction rows in one transaction, off the event loop"""
         
-        return False
+        if not self._pending_demotions:
+            return
+        
+        rows, self._pending_demotions = self._pending_demotions, []
+        async with self._disk_access():
+            await asyncio.to_thread(self._disk_put_many, rows)
     
-    def _calculate_ttl(self, context: Dict[str, Any], response: LLMResponse) -> int:
+    def _disk_row(self, entry: CacheEntry) -> Optional[Tuple[str, float, bytes]]:
+        """Build the disk tier row for an entry leaving memory, keeping its expiry"""
+        
+        remaining_ttl = entry.created_at + entry.ttl_seconds - time.monotonic()
+        if remaining_ttl <= 0:
+            return None
+        
+        return entry.key, time.time() + remaining_ttl, entry.payload
+    
+    def _disk_put_many(self, rows: List[Tuple[str, float, bytes]]) -> None:
+        """Write demoted entries to the disk tier in a single transaction
+        
+        Runs in a worker thread; callers hold the disk lock.
+        """
+        
+        disk = self.disk
+        if disk is None or not rows:
+            return
+        
+        try:
+            disk.execute("BEGIN")
+            try:
+                disk.executemany(
+                    "INSERT OR REPLACE INTO responses (key, expires_at, payload) VALUES (?, ?, ?)",
+                    rows
+                )
+            except Exception:
+                disk.execute("ROLLBACK")
+                raise
+            disk.execute("COMMIT")
+        except Exception as e:
+            self.logger.warning(f"Disk cache write failed: {str(e)}")
+    
+    def _calculate_ttl(self, context: Dict[str, Any], response: "LLMResponse") -> int:
         """Calculate TTL based on context and response characteristics"""
         
         base_ttl = self.default_ttl
@@ -180,8 +580,11 @@ class ResponseCache:
     
     def _is_expired(self, entry: CacheEntry) -> bool:
         """Check if cache entry is expired"""
-        age_seconds = (datetime.now() - entry.created_at).total_seconds()
-        return age_seconds > entry.ttl_seconds
+        return time.monotonic() - entry.created_at > entry.ttl_seconds
+    
+    def _to_wall_clock(self, monotonic_time: float) -> datetime:
+        """Convert an entry's monotonic timestamp to wall-clock time"""
+        return self._epoch_wall + timedelta(seconds=monotonic_time - self._epoch_mono)
     
     async def _check_and_enforce_limits(self) -> bool:
         """Check cache limits and evict entries if needed"""
@@ -191,7 +594,7 @@ class ResponseCache:
             await self._evict_entries(count=int(self.max_entries * 0.1))
         
         # Check size limit
-        size_mb = self.cache_stats["total_size_bytes"] / (1024 * 1024)
+        size_mb = self._total_bytes / (1024 * 1024)
         if size_mb >= self.max_size_mb:
             await self._evict_entries(size_target=int(self.max_size_mb * 0.8 * 1024 * 1024))
         
@@ -204,23 +607,25 @@ class ResponseCache:
         if not self.cache:
             return 0
         
-        # Sort by access time (oldest first)
-        entries_by_age = sorted(
-            self.cache.items(),
-            key=lambda x: x[1].accessed_at
-        )
-        
         evicted_count = 0
-        current_size = self.cache_stats["total_size_bytes"]
+        current_size = self._total_bytes
         
-        for key, entry in entries_by_age:
+        # Entries are in LRU order, so evict from the front
+        while self.cache:
             if count and evicted_count >= count:
                 break
             if size_target and current_size <= size_target:
                 break
             
-            await self._remove_entry(key)
+            key = next(iter(self.cache))
+            entry = self.cache[key]
             current_size -= entry.size_bytes
+            if self.disk is not None:
+                row = self._disk_row(entry)
+                if row is not None:
+                    # Written by _insert_entry as one batch after its insert
+                    self._pending_demotions.append(row)
+            await self._remove_entry(key)
             evicted_count += 1
         
         self.cache_stats["evictions"] += evicted_count
@@ -231,16 +636,13 @@ class ResponseCache:
     async def _remove_entry(self, key: str) -> bool:
         """Remove single cache entry"""
         
-        if key in self.cache:
-            entry = self.cache[key]
-            del self.cache[key]
-            
-            self.cache_stats["total_entries"] -= 1
-            self.cache_stats["total_size_bytes"] -= entry.size_bytes
-            
-            return True
+        entry = self.cache.pop(key, None)
+        self._hot.pop(key, None)
+        if entry is None:
+            return False
         
-        return False
+        self._total_bytes -= entry.size_bytes
+        return True
     
     async def _maintenance_loop(self):
         """Background maintenance for cache cleanup"""
@@ -249,17 +651,18 @@ class ResponseCache:
             try:
                 await asyncio.sleep(300)  # Run every 5 minutes
                 
-                # Remove expired entries
-                expired_keys = [
-                    key for key, entry in self.cache.items()
-                    if self._is_expired(entry)
-                ]
+                # Pop due heap items; replaced entries carry a later item of their own
+                expired_count = 0
+                now = time.monotonic()
+                while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                    _, key = heapq.heappop(self._expiry_heap)
+                    entry = self.cache.get(key)
+                    if entry is not None and self._is_expired(entry):
+                        await self._remove_entry(key)
+                        expired_count += 1
                 
-                for key in expired_keys:
-                    await self._remove_entry(key)
-                
-                if expired_keys:
-                    self.logger.debug(f"Removed {len(expired_keys)} expired cache entries")
+                if expired_count:
+                    self.logger.debug(f"Removed {expired_count} expired cache entries")
                 
                 # Log cache statistics
                 self.logger.debug(f"Cache stats: {self.cache_stats}")
@@ -272,13 +675,21 @@ class ResponseCache:
         
         try:
             self.cache.clear()
+            self._hot.clear()
+            self._pending_demotions.clear()
+            async with self._disk_access():
+                if self.disk is not None:
+                    self.disk.execute("DELETE FROM responses")
+            if self.redis is not None:
+                async for redis_key in self.redis.scan_iter(match=REDIS_KEY_PREFIX + "*"):
+                    await self.redis.unlink(redis_key)
             self.cache_stats = {
                 "hits": 0,
                 "misses": 0,
-                "evictions": 0,
-                "total_entries": 0,
-                "total_size_bytes": 0
+                "evictions": 0
             }
+            self._total_bytes = 0
+            self._expiry_heap.clear()
             
             self.logger.info("Cache cleared successfully")
             return True
@@ -287,6 +698,18 @@ class ResponseCache:
             self.logger.error(f"Failed to clear cache: {str(e)}")
             return False
     
+    async def close(self) -> None:
+        """Stop maintenance and close the Redis and disk cache connections if open"""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        if self.redis is not None:
+            await self.redis.aclose()
+        async with self._disk_access():
+            if self.disk is not None:
+                self.disk.close()
+                self.disk = None
+    
     async def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics"""
         
@@ -297,13 +720,15 @@ class ResponseCache:
             "enabled": self.settings.enable_caching,
             "total_entries": len(self.cache),
             "max_entries": self.max_entries,
-            "size_mb": round(self.cache_stats["total_size_bytes"] / (1024 * 1024), 2),
+            "size_mb": round(self._total_bytes / (1024 * 1024), 2),
             "max_size_mb": self.max_size_mb,
             "hit_rate_percent": round(hit_rate, 2),
             "total_requests": total_requests,
             "hits": self.cache_stats["hits"],
             "misses": self.cache_stats["misses"],
             "evictions": self.cache_stats["evictions"],
+            "redis_enabled": self.redis is not None,
+            "disk_cache_enabled": self.disk is not None,
             "compression_threshold_bytes": self.compression_threshold,
             "default_ttl_seconds": self.default_ttl
         }
@@ -316,8 +741,8 @@ class ResponseCache:
         for key, entry in list(self.cache.items())[:limit]:
             keys_info.append({
                 "key": key[:16] + "...",
-                "created_at": entry.created_at.isoformat(),
-                "accessed_at": entry.accessed_at.isoformat(),
+                "created_at": self._to_wall_clock(entry.created_at).isoformat(),
+                "accessed_at": self._to_wall_clock(entry.accessed_at).isoformat(),
                 "access_count": entry.access_count,
                 "ttl_seconds": entry.ttl_seconds,
                 "size_bytes": entry.size_bytes,
@@ -328,32 +753,36 @@ class ResponseCache:
         return keys_info
     
     async def export_cache(self, filepath: str) -> bool:
-        """Export cache to file for backup"""
+        """Export cache to a JSON Lines file for backup, one entry per line"""
         
         try:
-            cache_data = {
+            header = {
                 "exported_at": datetime.now().isoformat(),
-                "stats": self.cache_stats,
-                "entries": {}
-            }
-            
-            for key, entry in self.cache.items():
-                cache_data["entries"][key] = {
-                    "response": asdict(entry.response),
-                    "metadata": {
-                        "created_at": entry.created_at.isoformat(),
-                        "accessed_at": entry.accessed_at.isoformat(),
-                        "access_count": entry.access_count,
-                        "ttl_seconds": entry.ttl_seconds,
-                        "compressed": entry.compressed,
-                        "size_bytes": entry.size_bytes
-                    }
+                "stats": {
+                    **self.cache_stats,
+                    "total_entries": len(self.cache),
+                    "total_size_bytes": self._total_bytes
                 }
+            }
             
-            # Save to file
+            # Stream entries to disk instead of building one document in memory
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(header) + b"\n")
+                
+                for key, entry in list(self.cache.items()):
+                    f.write(_dumps({
+                        "key": key,
+                        "response": _loads(_decode_payload(entry.payload)),
+                        "metadata": {
+                            "created_at": self._to_wall_clock(entry.created_at).isoformat(),
+                            "accessed_at": self._to_wall_clock(entry.accessed_at).isoformat(),
+                            "access_count": entry.access_count,
+                            "ttl_seconds": entry.ttl_seconds,
+                            "compressed": entry.compressed,
+                            "size_bytes": entry.size_bytes
+                        }
+                    }) + b"\n")
             
             self.logger.info(f"Cache exported to {filepath}")
             return True
@@ -361,3 +790,43 @@ class ResponseCache:
         except Exception as e:
             self.logger.error(f"Failed to export cache: {str(e)}")
             return False
+    
+    async def import_cache(self, filepath: str) -> int:
+        """Load entries from an export_cache file, skipping expired ones"""
+        
+        imported = 0
+        
+        try:
+            with open(filepath, 'rb') as f:
+                f.readline()  # Export header
+                
+                for line in f:
+                    if not line.strip():
+                        continue
+                    
+                    record = _loads(line)
+                    metadata = record["metadata"]
+                    
+                    # Carry over the entry's age so its original TTL still applies
+                    age = (datetime.now() - datetime.fromisoformat(metadata["created_at"])).total_seconds()
+                    if age >= metadata["ttl_seconds"]:
+                        continue
+                    
+                    # The exported response dict is already in serialized form
+                    entry = self._make_entry(
+                        record["key"],
+                        _encode_payload(_dumps(record["response"]), self.compression_threshold),
+                        metadata["ttl_seconds"],
+                        age_seconds=max(age, 0.0),
+                        access_count=metadata["access_count"]
+                    )
+                    
+                    if await self._insert_entry(entry):
+                        imported += 1
+            
+            self.logger.info(f"Imported {imported} cache entries from {filepath}")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to import cache: {str(e)}")
+        
+        return imported
@@ -4,94 +4,119 @@ Centralized configuration using Pydantic Settings
 """
 
 import os
-from typing import List, Optional
-from pydantic import BaseSettings, Field, validator
+from typing import Annotated, Optional, Tuple
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from functools import lru_cache
 
 
+# Allowed values for the validated settings, built once at import
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALID_ENVS = frozenset({'development', 'testing', 'production'})
+_VALID_THEMES = frozenset({'light', 'dark'})
+
+# Dotenv file read by AppConfig, relative to the working directory
+ENV_FILE = ".env"
+
+
 class AppConfig(BaseSettings):
     """Application configuration with environment variable support"""
     
     # Application Settings
-    app_name: str = Field(default="ScienceGPT v3.0", env="APP_NAME")
-    app_version: str = Field(default="3.0.0", env="APP_VERSION")
-    app_env: str = Field(default="development", env="APP_ENV")
-    debug: bool = Field(default=False, env="DEBUG")
+    app_name: str = "ScienceGPT v3.0"
+    app_version: str = "3.0.0"
+    app_env: str = "development"
+    debug: bool = False
     
     # Database Configuration
-    database_url: str = Field(default="sqlite:///sciencegpt_v3.db", env="DATABASE_URL")
-    database_pool_size: int = Field(default=20, env="DATABASE_POOL_SIZE")
-    database_max_overflow: int = Field(default=30, env="DATABASE_MAX_OVERFLOW")
+    database_url: str = "sqlite:///sciencegpt_v3.db"
+    database_pool_size: int = 20
+    database_max_overflow: int = 30
     
     # AI/LLM Configuration
-    groq_api_key: Optional[str] = Field(default=None, env="GROQ_API_KEY")
-    openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
-    anthropic_api_key: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
+    groq_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    anthropic_api_key: Optional[str] = None
     
     # Cache Configuration
-    redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
-    cache_ttl: int = Field(default=3600, env="CACHE_TTL")
-    enable_caching: bool = Field(default=True, env="ENABLE_CACHING")
+    redis_url: str = "redis://localhost:6379"
+    cache_ttl: int = 3600
+    enable_caching: bool = True
+    enable_redis_cache: bool = False
+    enable_disk_cache: bool = False
+    disk_cache_path: str = "cache/responses.db"
     
     # Security Settings
-    secret_key: str = Field(default="dev_secret_key_change_in_production", env="SECRET_KEY")
-    encryption_key: Optional[str] = Field(default=None, env="ENCRYPTION_KEY")
+    secret_key: str = "dev_secret_key_change_in_production"
+    encryption_key: Optional[str] = None
     
     # Performance Settings
-    max_concurrent_requests: int = Field(default=50, env="MAX_CONCURRENT_REQUESTS")
-    request_timeout: int = Field(default=30, env="REQUEST_TIMEOUT")
-    rate_limit_per_minute: int = Field(default=100, env="RATE_LIMIT_PER_MINUTE")
+    max_concurrent_requests: int = 50
+    request_timeout: int = 30
+    rate_limit_per_minute: int = 100
     
     # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: str = Field(default="logs/sciencegpt.log", env="LOG_FILE")
-    enable_debug_logging: bool = Field(default=False, env="ENABLE_DEBUG_LOGGING")
+    log_level: str = "INFO"
+    log_file: str = "logs/sciencegpt.log"
+    enable_debug_logging: bool = False
     
     # Feature Flags
-    enable_analytics: bool = Field(default=True, env="ENABLE_ANALYTICS")
-    enable_gamification: bool = Field(default=True, env="ENABLE_GAMIFICATION")
-    enable_offline_mode: bool = Field(default=False, env="ENABLE_OFFLINE_MODE")
-    enable_voice_features: bool = Field(default=False, env="ENABLE_VOICE_FEATURES")
+    enable_analytics: bool = True
+    enable_gamification: bool = True
+    enable_offline_mode: bool = False
+    enable_voice_features: bool = False
     
     # UI/UX Settings
-    default_theme: str = Field(default="light", env="DEFAULT_THEME")
-    enable_animations: bool = Field(default=True, env="ENABLE_ANIMATIONS")
-    mobile_responsive: bool = Field(default=True, env="MOBILE_RESPONSIVE")
+    default_theme: str = "light"
+    enable_animations: bool = True
+    mobile_responsive: bool = True
     
     # Curriculum Settings
-    default_curriculum: str = Field(default="NCERT", env="DEFAULT_CURRICULUM")
-    supported_languages: str = Field(
-        default="English,Hindi,Tamil,Telugu,Bengali,Marathi,Gujarati,Kannada,Malayalam,Punjabi",
-        env="SUPPORTED_LANGUAGES"
+    default_curriculum: str = "NCERT"
+    # SUPPORTED_LANGUAGES is a comma-separated list; NoDecode skips JSON parsing
+    supported_languages: Annotated[Tuple[str, ...], NoDecode] = (
+        "English", "Hindi", "Tamil", "Telugu", "Bengali",
+        "Marathi", "Gujarati", "Kannada", "Malayalam", "Punjabi"
     )
     
-    @validator('log_level')
+    @field_validator('log_level')
+    @classmethod
     def validate_log_level(cls, v):
         """Validate log level"""
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if v.upper() not in valid_levels:
-            raise ValueError(f'log_level must be one of: {valid_levels}')
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f'log_level must be one of: {sorted(_VALID_LOG_LEVELS)}')
+        return level
     
-    @validator('app_env')
+    @field_validator('app_env')
+    @classmethod
     def validate_app_env(cls, v):
         """Validate application environment"""
-        valid_envs = ['development', 'testing', 'production']
-        if v.lower() not in valid_envs:
-            raise ValueError(f'app_env must be one of: {valid_envs}')
-        return v.lower()
+        env = v.casefold()
+        if env not in _VALID_ENVS:
+            raise ValueError(f'app_env must be one of: {sorted(_VALID_ENVS)}')
+        return env
     
-    @validator('default_theme')
+    @field_validator('default_theme')
+    @classmethod
     def validate_theme(cls, v):
         """Validate default theme"""
-        valid_themes = ['light', 'dark']
-        if v.lower() not in valid_themes:
-            raise ValueError(f'default_theme must be one of: {valid_themes}')
-        return v.lower()
-    
-    def get_supported_languages_list(self) -> List[str]:
-        """Get supported languages as a list"""
-        return [lang.strip() for lang in self.supported_languages.split(',')]
+        theme = v.casefold()
+        if theme not in _VALID_THEMES:
+            raise ValueError(f'default_theme must be one of: {sorted(_VALID_THEMES)}')
+        return theme
+    
+    @field_validator('supported_languages', mode='before')
+    @classmethod
+    def parse_supported_languages(cls, v):
+        """Split a comma-separated language list once at load"""
+        if isinstance(v, str):
+            return tuple(lang.strip() for lang in v.split(',') if lang.strip())
+        return tuple(v)
+    
+    def get_supported_languages_list(self) -> Tuple[str, ...]:
+        """Get supported languages as an immutable sequence"""
+        return self.supported_languages
     
     def is_production(self) -> bool:
         """Check if running in production environment"""
@@ -101,15 +126,39 @@ class AppConfig(BaseSettings):
         """Check if running in development environment"""
         return self.app_env == 'development'
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    # Field names map to upper-case environment variables (APP_NAME, ...).
+    # Frozen: one instance is shared process-wide and is hashable.
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True
+    )
+
+
+def settings_fingerprint() -> str:
+    """Cache key for get_settings derived from the deployment environment
+    
+    Covers APP_ENV, APP_VERSION and the .env file's modification time, so
+    editing .env yields a new key.
+    """
+    try:
+        env_file_mtime = os.stat(ENV_FILE).st_mtime_ns
+    except OSError:
+        env_file_mtime = 0
+    return f"{os.environ.get('APP_ENV', '')}:{os.environ.get('APP_VERSION', '')}:{env_file_mtime}"
 
 
-@lru_cache()
-def get_settings() -> AppConfig:
-    """Get cached application settings"""
+@lru_cache(maxsize=4)
+def get_settings(env_fingerprint: str = "") -> AppConfig:
+    """Get the shared, immutable application settings
+    
+    Without an argument this is the process-wide singleton. Callers that want
+    to follow environment or .env changes pass settings_fingerprint(), and a
+    new fingerprint loads a fresh instance; tests can also call
+    get_settings.cache_clear() after changing the environment.
+    """
     return AppConfig()
 
 
@@ -3,8 +3,26 @@ Curriculum Package for ScienceGPT v3.0
 Complete NCERT curriculum mapping and topic management
 """
 
-from .ncert_curriculum import NCERTCurriculum
-from .topic_mapper import TopicMapper
-from .learning_paths import LearningPathGenerator
+import importlib
+
+# Submodules are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "NCERTCurriculum": ".ncert_curriculum",
+    "TopicMapper": ".topic_mapper",
+    "LearningPathGenerator": ".learning_paths",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = ["NCERTCurriculum", "TopicMapper", "LearningPathGenerator"]
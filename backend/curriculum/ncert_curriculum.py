@@ -4,10 +4,118 @@ Comprehensive topic mapping for Classes 1-12 (Physics, Chemistry, Biology)
 Over 500 topics organized by grade, subject, and difficulty level
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Sequence, Set, Tuple, Union
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+from array import array
+from operator import itemgetter
+import hashlib
+import heapq
 import json
+import logging
+import mmap
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Shared value for topics without prerequisites
+_EMPTY: Tuple[str, ...] = ()
+
+# Curriculum content, one JSON object per grade, shipped with the package
+CURRICULUM_DATA_PATH = Path(__file__).parent / "data" / "ncert_curriculum.jsonl"
+
+def _default_cache_path() -> Optional[Path]:
+    """Snapshot location in the current user's own cache directory"""
+    try:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    except (KeyError, RuntimeError):
+        # No resolvable home directory; run without a snapshot
+        return None
+    return Path(base) / "sciencegpt" / "curriculum.snapshot"
+
+
+# On-disk snapshot of the built curriculum: a magic line, a JSON header line
+# (source version, payload hash and per-grade (offset, length) pairs), then
+# one pickled blob per grade. The file is memory-mapped, so worker processes
+# share its pages through the OS page cache and each only unpickles the
+# grades it actually touches. It lives in a user-owned directory, and nothing
+# is unpickled until the header and payload hash check out. Only preload()
+# writes it; plain reads never build grades they were not asked for.
+CURRICULUM_CACHE_PATH = _default_cache_path()
+
+# First line of a snapshot file; bump it when the layout changes
+_SNAPSHOT_MAGIC = b"SCIENCEGPT-CURRICULUM-SNAPSHOT 2\n"
+
+# Grades covered by the curriculum: elementary (1-5), middle (6-8),
+# secondary (9-10) and senior secondary (11-12)
+GRADES = range(1, 13)
+
+# Leading grade field of a data file line, read without parsing the rest
+_GRADE_PREFIX_RE = re.compile(r'^\{"grade":\s*(\d+)')
+
+# Character n-gram length of the substring search index
+_NGRAM_SIZE = 3
+
+# Decoder for data file records; orjson is faster than the stdlib decoder
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _source_version() -> Dict[str, Any]:
+    """Identify the module and data file so snapshots go stale when either changes"""
+    module_stat = os.stat(__file__)
+    return {
+        "module": [module_stat.st_mtime_ns, module_stat.st_size],
+        "data_sha256": hashlib.sha256(CURRICULUM_DATA_PATH.read_bytes()).hexdigest(),
+        "pickle_protocol": pickle.HIGHEST_PROTOCOL,
+    }
+
+
+def _is_private(path: Path) -> bool:
+    """Whether a path is owned by the current user and not writable by others"""
+    if not hasattr(os, "getuid"):
+        # No POSIX ownership (Windows); the per-user cache directory is private
+        return True
+    stat = os.stat(path)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _ngrams(text: str) -> Set[str]:
+    """Distinct character n-grams of a string"""
+    return {text[i:i + _NGRAM_SIZE] for i in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+def _dump_export(data: Any) -> bytes:
+    """Serialize export data as two-space indented UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        # OPT_INDENT_2 matches json.dumps(indent=2) output, UTF-8 throughout
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def _read_grade_records(path: Path) -> Dict[int, str]:
+    """Map each grade to its unparsed line in the curriculum data file"""
+    records = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            match = _GRADE_PREFIX_RE.match(line)
+            grade = int(match.group(1)) if match else _loads(line)["grade"]
+            records[grade] = line
+    return records
 
 
 class Subject(Enum):
@@ -24,9 +132,45 @@ class Difficulty(Enum):
     ADVANCED = "Advanced"
 
 
-@dataclass
-class Topic:
+# Small-integer codes for the columnar topic table, in declaration order.
+# The enums keep their string values, which the UI and export rely on.
+SUBJECT_CODES: Dict[Subject, int] = {subject: code for code, subject in enumerate(Subject)}
+DIFFICULTY_CODES: Dict[Difficulty, int] = {
+    difficulty: code for code, difficulty in enumerate(Difficulty)
+}
+
+# String values of the enum members; a dict lookup skips the enum's
+# Python-level value property in per-topic loops
+_SUBJECT_VALUES: Dict[Subject, str] = {subject: subject.value for subject in Subject}
+_DIFFICULTY_VALUES: Dict[Difficulty, str] = {
+    difficulty: difficulty.value for difficulty in Difficulty
+}
+
+
+class _FrozenRecord:
+    """Pickle support for frozen slotted dataclasses"""
+    __slots__ = ()
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        # The frozen __setattr__ would reject the default slot restore
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class Topic(_FrozenRecord):
     """Individual curriculum topic"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "id", "title", "description", "subject", "grade", "chapter",
+        "difficulty", "keywords", "learning_objectives", "prerequisites",
+        "real_world_applications", "ncert_reference", "estimated_time_minutes",
+        "keyword_set"
+    )
+    
     id: str
     title: str
     description: str
@@ -34,1102 +178,729 @@ class Topic:
     grade: int
     chapter: str
     difficulty: Difficulty
-    keywords: List[str]
-    learning_objectives: List[str]
-    prerequisites: List[str]
-    real_world_applications: List[str]
+    keywords: Tuple[str, ...]
+    learning_objectives: Tuple[str, ...]
+    prerequisites: Tuple[str, ...]
+    real_world_applications: Tuple[str, ...]
     ncert_reference: str
     estimated_time_minutes: int
+    
+    def __post_init__(self):
+        # Chapter names, references, keywords and prerequisite IDs repeat
+        # across topics; interning makes equal values share one object. The
+        # interpreter's intern table doubles as the pool for objective and
+        # application phrases, so a repeated phrase is stored once.
+        intern = sys.intern
+        object.__setattr__(self, "chapter", intern(self.chapter))
+        object.__setattr__(self, "ncert_reference", intern(self.ncert_reference))
+        object.__setattr__(self, "keywords", tuple(intern(k) for k in self.keywords))
+        # Lower-cased keywords for O(1) membership tests and set algebra;
+        # keywords itself keeps its order for display and export
+        object.__setattr__(
+            self, "keyword_set", frozenset(intern(k.lower()) for k in self.keywords)
+        )
+        object.__setattr__(
+            self, "learning_objectives", tuple(intern(o) for o in self.learning_objectives)
+        )
+        object.__setattr__(
+            self, "real_world_applications",
+            tuple(intern(a) for a in self.real_world_applications)
+        )
+        object.__setattr__(
+            self, "prerequisites",
+            tuple(intern(p) for p in self.prerequisites) if self.prerequisites else _EMPTY
+        )
+    
+    def __hash__(self):
+        # Equal topics share an ID; hashing the ID alone is cheaper than the
+        # generated hash, which would walk every field and each tuple in it
+        return hash(self.id)
+    
+    def has_keyword(self, keyword: str) -> bool:
+        """Check whether the topic is tagged with a keyword (case-insensitive)"""
+        return keyword.lower() in self.keyword_set
 
 
-@dataclass
-class Chapter:
-    """Chapter containing multiple topics"""
+@dataclass(frozen=True)
+class Chapter(_FrozenRecord):
+    """Chapter containing multiple topics
+    
+    topics may be given as a zero-argument callable; it is called on the
+    first read of chapter.topics, so chapter headers can be listed without
+    constructing their Topic objects.
+    """
+    __slots__ = (
+        "id", "title", "description", "subject", "grade", "topics",
+        "ncert_chapter_number", "_topic_factory"
+    )
+    
     id: str
     title: str
     description: str
     subject: Subject
     grade: int
-    topics: List[Topic]
+    topics: Union[List[Topic], Callable[[], List[Topic]]]
     ncert_chapter_number: str
+    
+    def __post_init__(self):
+        factory = self.topics if callable(self.topics) else None
+        object.__setattr__(self, "_topic_factory", factory)
+        if factory is not None:
+            # Leave the slot empty so the first read falls through to __getattr__
+            object.__delattr__(self, "topics")
+    
+    def __hash__(self):
+        return hash(self.id)
+    
+    def __getattr__(self, name):
+        # Only reached for unset slots; materialize lazily supplied topics
+        factory = object.__getattribute__(self, "_topic_factory")
+        if name != "topics" or factory is None:
+            raise AttributeError(name)
+        topics = factory()
+        object.__setattr__(self, "topics", topics)
+        object.__setattr__(self, "_topic_factory", None)
+        return topics
+
+
+def _topic_from_record(record: Dict[str, Any], subject: Subject,
+                       grade: int, chapter: str) -> Topic:
+    """Build a Topic from its data file record within a chapter"""
+    return Topic(
+        id=record["id"],
+        title=record["title"],
+        description=record["description"],
+        subject=subject,
+        grade=grade,
+        chapter=chapter,
+        difficulty=Difficulty(record["difficulty"]),
+        keywords=record["keywords"],
+        learning_objectives=record["learning_objectives"],
+        prerequisites=record["prerequisites"],
+        real_world_applications=record["real_world_applications"],
+        ncert_reference=record["ncert_reference"],
+        estimated_time_minutes=record["estimated_time_minutes"]
+    )
+
+
+def _chapter_from_record(grade: int, record: Dict[str, Any]) -> Chapter:
+    """Build a Chapter from its data file record; topics are built on first access"""
+    subject = Subject(record["subject"])
+    title = record["title"]
+    topic_records = record["topics"]
+    return Chapter(
+        id=record["id"],
+        title=title,
+        description=record["description"],
+        subject=subject,
+        grade=grade,
+        topics=lambda: [
+            _topic_from_record(topic, subject, grade, title) for topic in topic_records
+        ],
+        ncert_chapter_number=record["ncert_chapter_number"]
+    )
+
+
+class TopicTable:
+    """Columnar (struct-of-arrays) view of the indexed topics
+    
+    Row i of every column describes topics[i]; filters scan the compact
+    columns instead of reading attributes off each Topic object.
+    """
+    __slots__ = (
+        "topics", "ids", "row_of", "grades", "subjects", "difficulties", "minutes",
+        "titles_lower", "descriptions_lower", "keywords_lower",
+        "prereq_indptr", "prereq_indices", "_filter_cache"
+    )
+    
+    def __init__(self, topics: Iterable[Topic]):
+        self.topics: Tuple[Topic, ...] = tuple(topics)
+        self.ids = tuple(t.id for t in self.topics)
+        self.row_of: Dict[str, int] = {topic_id: row for row, topic_id in enumerate(self.ids)}
+        # Numeric columns are packed machine integers (1-2 bytes per value)
+        self.grades = array("B", (t.grade for t in self.topics))
+        self.subjects = array("B", (SUBJECT_CODES[t.subject] for t in self.topics))
+        self.difficulties = array("B", (DIFFICULTY_CODES[t.difficulty] for t in self.topics))
+        self.minutes = array("H", (t.estimated_time_minutes for t in self.topics))
+        # Lower-cased text columns, so searches do not re-lower every field
+        self.titles_lower = tuple(t.title.lower() for t in self.topics)
+        self.descriptions_lower = tuple(t.description.lower() for t in self.topics)
+        # Lower-cased keywords are interned like the originals, so a keyword
+        # shared by many topics is stored once
+        self.keywords_lower = tuple(
+            tuple(sys.intern(k.lower()) for k in t.keywords) for t in self.topics
+        )
+        
+        # Prerequisite DAG in CSR form: the prerequisites of row i are
+        # prereq_indices[prereq_indptr[i]:prereq_indptr[i + 1]]
+        row_of = self.row_of
+        self.prereq_indptr = array("l", [0])
+        self.prereq_indices = array("l")
+        for topic in self.topics:
+            self.prereq_indices.extend(
+                row_of[prereq_id] for prereq_id in topic.prerequisites if prereq_id in row_of
+            )
+            self.prereq_indptr.append(len(self.prereq_indices))
+        
+        # Rows per (grade, subject code) filter; the table never changes
+        self._filter_cache: Dict[Tuple[Optional[int], Optional[int]], Tuple[int, ...]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.topics)
+    
+    def rows(self, grade: Optional[int] = None,
+             subject: Optional[Subject] = None) -> Sequence[int]:
+        """Row numbers matching the given grade and subject filters"""
+        code = None if subject is None else SUBJECT_CODES[subject]
+        key = (grade, code)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        rows: Sequence[int] = range(len(self.topics))
+        if grade is not None:
+            grades = self.grades
+            rows = [i for i in rows if grades[i] == grade]
+        if code is not None:
+            subjects = self.subjects
+            rows = [i for i in rows if subjects[i] == code]
+        
+        cached = self._filter_cache[key] = tuple(rows)
+        return cached
+    
+    def prerequisite_closure(self, row: int) -> List[int]:
+        """Rows of all direct and transitive prerequisites of a row
+        
+        Each row is listed after its own prerequisites, i.e. in study order.
+        """
+        indptr = self.prereq_indptr
+        indices = self.prereq_indices
+        visited = bytearray(len(self.topics))
+        visited[row] = 1
+        order: List[int] = []
+        
+        # Iterative post-order DFS; each stack entry is (row, next edge)
+        stack = [(row, indptr[row])]
+        while stack:
+            node, edge = stack[-1]
+            if edge < indptr[node + 1]:
+                stack[-1] = (node, edge + 1)
+                child = indices[edge]
+                if not visited[child]:
+                    visited[child] = 1
+                    stack.append((child, indptr[child]))
+            else:
+                stack.pop()
+                if node != row:
+                    order.append(node)
+        return order
 
 
 class NCERTCurriculum:
     """Complete NCERT curriculum implementation"""
     
-    def __init__(self):
-        """Initialize curriculum with all topics"""
-        self.curriculum_data = self._initialize_complete_curriculum()
-        self._build_indexes()
+    # Built grades and indexes are shared by every instance with the same
+    # snapshot path (Borg pattern); the data is static and read-only
+    _shared_states: Dict[Optional[Path], Dict[str, Any]] = {}
     
-    def _initialize_complete_curriculum(self) -> Dict[str, Any]:
-        """Initialize complete curriculum structure with 500+ topics"""
+    def __init__(self, cache_path: Optional[Path] = CURRICULUM_CACHE_PATH):
+        """Initialize curriculum; each grade is built on first access
         
-        curriculum = {
-            # Elementary Classes (1-5) - Foundation Science
-            1: self._get_class_1_curriculum(),
-            2: self._get_class_2_curriculum(),
-            3: self._get_class_3_curriculum(),
-            4: self._get_class_4_curriculum(),
-            5: self._get_class_5_curriculum(),
-            
-            # Middle Classes (6-8) - Integrated Science
-            6: self._get_class_6_curriculum(),
-            7: self._get_class_7_curriculum(),
-            8: self._get_class_8_curriculum(),
-            
-            # Secondary Classes (9-10) - Separate Sciences Begin
-            9: self._get_class_9_curriculum(),
-            10: self._get_class_10_curriculum(),
-            
-            # Senior Secondary (11-12) - Advanced Specialization
-            11: self._get_class_11_curriculum(),
-            12: self._get_class_12_curriculum(),
-        }
+        Grades are unpickled from the snapshot at cache_path when it matches
+        this module's source; pass None to always build from the data file.
+        """
+        self.__dict__ = self._shared_states.setdefault(cache_path, {})
+        if self.__dict__:
+            return
         
+        self.logger = logging.getLogger(__name__)
+        self._cache_path = cache_path
+        self._pickled_grades: Optional[Dict[int, memoryview]] = None
+        self._grade_records: Optional[Dict[int, str]] = None
+        self._grade_cache: Dict[int, Dict[str, List[Chapter]]] = {}
+        # Serializes lazy builds across Streamlit script threads; reentrant
+        # because building the indexes loads grades
+        self._build_lock = threading.RLock()
+        self._grade_subject_index: Dict[Tuple[int, Subject], Tuple[Topic, ...]] = {}
+        self._indexed = False
+        self._export_json: Optional[str] = None
+    
+    @classmethod
+    def preload(cls, cache_path: Optional[Path] = CURRICULUM_CACHE_PATH,
+                lazy_export: bool = False) -> "NCERTCurriculum":
+        """Build every grade, index and (unless lazy_export) the JSON export up front
+        
+        Also rewrites the snapshot at cache_path if it is missing or stale, so
+        later processes can map their grades from it.
+        """
+        curriculum = cls(cache_path)
+        curriculum._ensure_indexes()
+        curriculum._save_snapshot()
+        if not lazy_export:
+            curriculum.export_curriculum_json()
         return curriculum
     
-    def _get_class_1_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 1 curriculum - Basic observation and awareness"""
+    def get_grade(self, grade: int) -> Dict[str, List[Chapter]]:
+        """Get the chapters of one grade, building them on first access"""
+        grade_data = self._grade_cache.get(grade)
+        if grade_data is None:
+            with self._build_lock:
+                grade_data = self._grade_cache.get(grade)
+                if grade_data is None:
+                    grade_data = self._grade_cache[grade] = self._build_or_load(grade)
+        return grade_data
+    
+    def _build_or_load(self, grade: int) -> Dict[str, List[Chapter]]:
+        """Unpickle a grade from the snapshot, or build it from the data file"""
+        if self._pickled_grades is None:
+            self._pickled_grades = self._load_snapshot()
         
-        return {
-            "Environmental Studies": [
-                Chapter(
-                    id="cl1_env_ch1",
-                    title="Myself",
-                    description="Understanding self, body parts, and basic needs",
-                    subject=Subject.BIOLOGY,
-                    grade=1,
-                    ncert_chapter_number="Chapter 1",
-                    topics=[
-                        Topic(
-                            id="cl1_env_myself_body_parts",
-                            title="Body Parts",
-                            description="Identifying different parts of the human body",
-                            subject=Subject.BIOLOGY,
-                            grade=1,
-                            chapter="Myself",
-                            difficulty=Difficulty.BEGINNER,
-                            keywords=["body", "parts", "head", "hands", "legs", "eyes", "nose"],
-                            learning_objectives=[
-                                "Identify major body parts",
-                                "Understand basic functions of body parts",
-                                "Develop body awareness"
-                            ],
-                            prerequisites=[],
-                            real_world_applications=[
-                                "Personal hygiene",
-                                "Safety awareness",
-                                "Health care"
-                            ],
-                            ncert_reference="Class 1, EVS, Chapter 1",
-                            estimated_time_minutes=30
-                        ),
-                        Topic(
-                            id="cl1_env_myself_senses",
-                            title="Our Senses",
-                            description="Understanding five senses and their functions",
-                            subject=Subject.BIOLOGY,
-                            grade=1,
-                            chapter="Myself",
-                            difficulty=Difficulty.BEGINNER,
-                            keywords=["senses", "see", "hear", "smell", "taste", "touch"],
-                            learning_objectives=[
-                                "Identify five senses",
-                                "Match senses with body parts",
-                                "Understand importance of senses"
-                            ],
-                            prerequisites=["cl1_env_myself_body_parts"],
-                            real_world_applications=[
-                                "Food tasting",
-                                "Safety through senses",
-                                "Enjoying nature"
-                            ],
-                            ncert_reference="Class 1, EVS, Chapter 1",
-                            estimated_time_minutes=35
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl1_env_ch2", 
-                    title="Plants Around Us",
-                    description="Basic introduction to plants and their parts",
-                    subject=Subject.BIOLOGY,
-                    grade=1,
-                    ncert_chapter_number="Chapter 2",
-                    topics=[
-                        Topic(
-                            id="cl1_env_plants_parts",
-                            title="Parts of a Plant",
-                            description="Identifying roots, stem, leaves, flowers, and fruits",
-                            subject=Subject.BIOLOGY,
-                            grade=1,
-                            chapter="Plants Around Us", 
-                            difficulty=Difficulty.BEGINNER,
-                            keywords=["plants", "roots", "stem", "leaves", "flowers", "fruits"],
-                            learning_objectives=[
-                                "Identify plant parts",
-                                "Understand basic functions",
-                                "Recognize plants in environment"
-                            ],
-                            prerequisites=[],
-                            real_world_applications=[
-                                "Gardening",
-                                "Food sources",
-                                "Environment awareness"
-                            ],
-                            ncert_reference="Class 1, EVS, Chapter 2",
-                            estimated_time_minutes=40
-                        )
-                    ]
-                )
-            ]
-        }
+        blob = self._pickled_grades.get(grade)
+        if blob is not None:
+            return pickle.loads(blob)
+        return self._load_grade(grade)
     
-    def _get_class_6_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 6 curriculum - Integrated science approach"""
+    def _load_snapshot(self) -> Dict[int, memoryview]:
+        """Map the pickled grades, or nothing if the snapshot is missing, stale or untrusted"""
+        if self._cache_path is None:
+            return {}
         
-        return {
-            "Science": [
-                Chapter(
-                    id="cl6_sci_ch1",
-                    title="Food: Where Does it Come From?",
-                    description="Understanding food sources and types",
-                    subject=Subject.BIOLOGY,
-                    grade=6,
-                    ncert_chapter_number="Chapter 1",
-                    topics=[
-                        Topic(
-                            id="cl6_sci_food_sources",
-                            title="Food Sources",
-                            description="Plant and animal sources of food",
-                            subject=Subject.BIOLOGY,
-                            grade=6,
-                            chapter="Food: Where Does it Come From?",
-                            difficulty=Difficulty.BEGINNER,
-                            keywords=["food", "plants", "animals", "sources", "nutrition"],
-                            learning_objectives=[
-                                "Identify plant and animal food sources",
-                                "Classify food items by origin",
-                                "Understand food chains"
-                            ],
-                            prerequisites=[],
-                            real_world_applications=[
-                                "Agriculture in India",
-                                "Food security",
-                                "Balanced diet planning"
-                            ],
-                            ncert_reference="Class 6, Science, Chapter 1",
-                            estimated_time_minutes=45
-                        ),
-                        Topic(
-                            id="cl6_sci_food_types",
-                            title="Types of Food",
-                            description="Categorizing food into different groups",
-                            subject=Subject.BIOLOGY,
-                            grade=6,
-                            chapter="Food: Where Does it Come From?",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["carbohydrates", "proteins", "fats", "vitamins", "minerals"],
-                            learning_objectives=[
-                                "Classify food into nutrient groups",
-                                "Understand balanced diet",
-                                "Identify nutrient-rich Indian foods"
-                            ],
-                            prerequisites=["cl6_sci_food_sources"],
-                            real_world_applications=[
-                                "Meal planning",
-                                "Nutritional awareness",
-                                "Health management"
-                            ],
-                            ncert_reference="Class 6, Science, Chapter 1",
-                            estimated_time_minutes=50
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl6_sci_ch10",
-                    title="Motion and Measurement of Distances",
-                    description="Understanding motion and measurement",
-                    subject=Subject.PHYSICS,
-                    grade=6,
-                    ncert_chapter_number="Chapter 10",
-                    topics=[
-                        Topic(
-                            id="cl6_sci_motion_types",
-                            title="Types of Motion",
-                            description="Linear, circular, and oscillatory motion",
-                            subject=Subject.PHYSICS,
-                            grade=6,
-                            chapter="Motion and Measurement of Distances",
-                            difficulty=Difficulty.BEGINNER,
-                            keywords=["motion", "linear", "circular", "oscillatory", "movement"],
-                            learning_objectives=[
-                                "Identify different types of motion",
-                                "Observe motion in daily life",
-                                "Classify motion types"
-                            ],
-                            prerequisites=[],
-                            real_world_applications=[
-                                "Transportation systems",
-                                "Sports movements",
-                                "Mechanical devices"
-                            ],
-                            ncert_reference="Class 6, Science, Chapter 10",
-                            estimated_time_minutes=40
-                        ),
-                        Topic(
-                            id="cl6_sci_measurement",
-                            title="Measurement of Length",
-                            description="Units and methods of measuring length",
-                            subject=Subject.PHYSICS,
-                            grade=6,
-                            chapter="Motion and Measurement of Distances",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["measurement", "length", "units", "meter", "scale"],
-                            learning_objectives=[
-                                "Use standard units of length",
-                                "Perform accurate measurements",
-                                "Convert between units"
-                            ],
-                            prerequisites=["cl6_sci_motion_types"],
-                            real_world_applications=[
-                                "Construction work",
-                                "Tailoring",
-                                "Scientific experiments"
-                            ],
-                            ncert_reference="Class 6, Science, Chapter 10",
-                            estimated_time_minutes=45
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl6_sci_ch4",
-                    title="Sorting Materials into Groups",
-                    description="Classification of materials based on properties",
-                    subject=Subject.CHEMISTRY,
-                    grade=6,
-                    ncert_chapter_number="Chapter 4",
-                    topics=[
-                        Topic(
-                            id="cl6_sci_material_properties",
-                            title="Properties of Materials",
-                            description="Hardness, solubility, transparency, and other properties",
-                            subject=Subject.CHEMISTRY,
-                            grade=6,
-                            chapter="Sorting Materials into Groups",
-                            difficulty=Difficulty.BEGINNER,
-                            keywords=["materials", "properties", "hardness", "solubility", "transparency"],
-                            learning_objectives=[
-                                "Identify material properties",
-                                "Group materials by properties",
-                                "Test material characteristics"
-                            ],
-                            prerequisites=[],
-                            real_world_applications=[
-                                "Material selection for construction",
-                                "Packaging design", 
-                                "Product manufacturing"
-                            ],
-                            ncert_reference="Class 6, Science, Chapter 4",
-                            estimated_time_minutes=50
-                        )
-                    ]
+        try:
+            if not (_is_private(self._cache_path.parent) and _is_private(self._cache_path)):
+                self.logger.warning(
+                    f"Ignoring curriculum snapshot in a directory others can write: {self._cache_path}"
                 )
-            ]
-        }
+                return {}
+            return self._read_snapshot(_source_version()) or {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable curriculum snapshot: {str(e)}")
+            return {}
     
-    def _get_class_10_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 10 curriculum - Comprehensive science coverage"""
+    def _save_snapshot(self) -> None:
+        """Write every grade to the snapshot unless the mapped one is current"""
+        if self._cache_path is None:
+            return
         
-        return {
-            "Science": [
-                # Physics Chapters
-                Chapter(
-                    id="cl10_sci_ch10",
-                    title="Light - Reflection and Refraction",
-                    description="Comprehensive study of light behavior",
-                    subject=Subject.PHYSICS,
-                    grade=10,
-                    ncert_chapter_number="Chapter 10",
-                    topics=[
-                        Topic(
-                            id="cl10_sci_light_reflection",
-                            title="Reflection of Light",
-                            description="Laws of reflection and mirrors",
-                            subject=Subject.PHYSICS,
-                            grade=10,
-                            chapter="Light - Reflection and Refraction",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["reflection", "mirrors", "images", "laws", "ray diagrams"],
-                            learning_objectives=[
-                                "Understand laws of reflection",
-                                "Construct ray diagrams for mirrors",
-                                "Solve numerical problems on mirrors"
-                            ],
-                            prerequisites=["cl8_sci_light_basics"],
-                            real_world_applications=[
-                                "Periscopes in submarines",
-                                "Solar cookers", 
-                                "Telescopes and microscopes",
-                                "Car mirrors and traffic safety"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 10",
-                            estimated_time_minutes=90
-                        ),
-                        Topic(
-                            id="cl10_sci_light_refraction",
-                            title="Refraction of Light",
-                            description="Light bending and lens behavior",
-                            subject=Subject.PHYSICS,
-                            grade=10,
-                            chapter="Light - Reflection and Refraction",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["refraction", "lenses", "focal length", "power", "optical instruments"],
-                            learning_objectives=[
-                                "Understand refraction phenomena",
-                                "Apply lens formula and magnification",
-                                "Analyze optical instruments"
-                            ],
-                            prerequisites=["cl10_sci_light_reflection"],
-                            real_world_applications=[
-                                "Eyeglasses and contact lenses",
-                                "Camera and photography",
-                                "Microscopes in medical diagnosis",
-                                "Optical fibers in telecommunications"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 10",
-                            estimated_time_minutes=120
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl10_sci_ch12",
-                    title="Electricity",
-                    description="Current electricity and electrical circuits",
-                    subject=Subject.PHYSICS,
-                    grade=10,
-                    ncert_chapter_number="Chapter 12",
-                    topics=[
-                        Topic(
-                            id="cl10_sci_electric_current",
-                            title="Electric Current and Circuit",
-                            description="Flow of electricity and circuit components",
-                            subject=Subject.PHYSICS,
-                            grade=10,
-                            chapter="Electricity",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["current", "voltage", "resistance", "ohm's law", "circuits"],
-                            learning_objectives=[
-                                "Understand electric current flow",
-                                "Apply Ohm's law in calculations",
-                                "Analyze series and parallel circuits"
-                            ],
-                            prerequisites=["cl8_sci_electric_basics"],
-                            real_world_applications=[
-                                "Household electrical wiring",
-                                "Electronic devices",
-                                "Power distribution systems",
-                                "Electric vehicles in India"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 12",
-                            estimated_time_minutes=100
-                        ),
-                        Topic(
-                            id="cl10_sci_electric_power",
-                            title="Electric Power and Energy",
-                            description="Electrical power consumption and energy calculations",
-                            subject=Subject.PHYSICS,
-                            grade=10,
-                            chapter="Electricity",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["power", "energy", "kilowatt-hour", "electrical bills", "heating effect"],
-                            learning_objectives=[
-                                "Calculate electrical power and energy",
-                                "Understand electricity bills",
-                                "Analyze heating effects of current"
-                            ],
-                            prerequisites=["cl10_sci_electric_current"],
-                            real_world_applications=[
-                                "Energy conservation in homes",
-                                "Electric heating appliances",
-                                "Power plant operations",
-                                "Solar power systems in India"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 12",
-                            estimated_time_minutes=80
-                        )
-                    ]
-                ),
-                
-                # Chemistry Chapters
-                Chapter(
-                    id="cl10_sci_ch1",
-                    title="Chemical Reactions and Equations",
-                    description="Understanding chemical changes and their representation",
-                    subject=Subject.CHEMISTRY,
-                    grade=10,
-                    ncert_chapter_number="Chapter 1",
-                    topics=[
-                        Topic(
-                            id="cl10_sci_chemical_reactions",
-                            title="Chemical Reactions",
-                            description="Types and characteristics of chemical reactions",
-                            subject=Subject.CHEMISTRY,
-                            grade=10,
-                            chapter="Chemical Reactions and Equations",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["chemical reactions", "reactants", "products", "chemical change"],
-                            learning_objectives=[
-                                "Identify chemical reactions",
-                                "Distinguish physical and chemical changes",
-                                "Classify types of chemical reactions"
-                            ],
-                            prerequisites=["cl9_sci_matter_basics"],
-                            real_world_applications=[
-                                "Cooking processes",
-                                "Digestion in human body",
-                                "Industrial manufacturing",
-                                "Rusting and corrosion prevention"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 1",
-                            estimated_time_minutes=75
-                        ),
-                        Topic(
-                            id="cl10_sci_chemical_equations",
-                            title="Chemical Equations",
-                            description="Writing and balancing chemical equations",
-                            subject=Subject.CHEMISTRY,
-                            grade=10,
-                            chapter="Chemical Reactions and Equations",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["chemical equations", "balancing", "coefficients", "symbols"],
-                            learning_objectives=[
-                                "Write chemical equations",
-                                "Balance chemical equations",
-                                "Interpret equation information"
-                            ],
-                            prerequisites=["cl10_sci_chemical_reactions"],
-                            real_world_applications=[
-                                "Pharmaceutical formulations",
-                                "Fertilizer production",
-                                "Metallurgical processes",
-                                "Environmental chemistry"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 1",
-                            estimated_time_minutes=90
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl10_sci_ch4",
-                    title="Carbon and its Compounds",
-                    description="Organic chemistry introduction and carbon compounds",
-                    subject=Subject.CHEMISTRY,
-                    grade=10,
-                    ncert_chapter_number="Chapter 4",
-                    topics=[
-                        Topic(
-                            id="cl10_sci_carbon_bonding",
-                            title="Carbon and its Bonding",
-                            description="Covalent bonding and carbon chains",
-                            subject=Subject.CHEMISTRY,
-                            grade=10,
-                            chapter="Carbon and its Compounds",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["carbon", "covalent bonding", "chains", "tetravalency"],
-                            learning_objectives=[
-                                "Understand carbon's bonding capacity",
-                                "Explain formation of carbon chains",
-                                "Draw structural formulas"
-                            ],
-                            prerequisites=["cl10_sci_chemical_bonding"],
-                            real_world_applications=[
-                                "Petroleum and its products",
-                                "Plastics and polymers",
-                                "Pharmaceuticals",
-                                "Organic farming methods"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 4",
-                            estimated_time_minutes=85
-                        )
-                    ]
-                ),
-                
-                # Biology Chapters
-                Chapter(
-                    id="cl10_sci_ch6",
-                    title="Life Processes",
-                    description="Fundamental processes in living organisms",
-                    subject=Subject.BIOLOGY,
-                    grade=10,
-                    ncert_chapter_number="Chapter 6",
-                    topics=[
-                        Topic(
-                            id="cl10_sci_nutrition",
-                            title="Nutrition",
-                            description="Modes of nutrition in plants and animals",
-                            subject=Subject.BIOLOGY,
-                            grade=10,
-                            chapter="Life Processes",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["nutrition", "photosynthesis", "digestion", "autotrophic", "heterotrophic"],
-                            learning_objectives=[
-                                "Understand modes of nutrition",
-                                "Explain photosynthesis process",
-                                "Describe human digestive system"
-                            ],
-                            prerequisites=["cl9_sci_basic_biology"],
-                            real_world_applications=[
-                                "Agriculture and crop production",
-                                "Nutrition and health",
-                                "Food processing industry",
-                                "Sustainable farming practices"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 6",
-                            estimated_time_minutes=100
-                        ),
-                        Topic(
-                            id="cl10_sci_respiration",
-                            title="Respiration",
-                            description="Cellular respiration and gas exchange",
-                            subject=Subject.BIOLOGY,
-                            grade=10,
-                            chapter="Life Processes",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["respiration", "cellular respiration", "gas exchange", "ATP"],
-                            learning_objectives=[
-                                "Understand cellular respiration",
-                                "Explain gas exchange mechanisms",
-                                "Compare aerobic and anaerobic respiration"
-                            ],
-                            prerequisites=["cl10_sci_nutrition"],
-                            real_world_applications=[
-                                "Exercise and fitness",
-                                "Respiratory health",
-                                "Fermentation in food industry",
-                                "Altitude effects on breathing"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 6",
-                            estimated_time_minutes=90
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl10_sci_ch8",
-                    title="How do Organisms Reproduce?",
-                    description="Reproduction in plants and animals",
-                    subject=Subject.BIOLOGY,
-                    grade=10,
-                    ncert_chapter_number="Chapter 8",
-                    topics=[
-                        Topic(
-                            id="cl10_sci_reproduction_types",
-                            title="Types of Reproduction",
-                            description="Sexual and asexual reproduction mechanisms",
-                            subject=Subject.BIOLOGY,
-                            grade=10,
-                            chapter="How do Organisms Reproduce?",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["reproduction", "sexual", "asexual", "gametes", "fertilization"],
-                            learning_objectives=[
-                                "Compare sexual and asexual reproduction",
-                                "Understand reproductive strategies",
-                                "Explain fertilization process"
-                            ],
-                            prerequisites=["cl10_sci_life_processes"],
-                            real_world_applications=[
-                                "Plant breeding and agriculture",
-                                "Animal husbandry",
-                                "Reproductive health",
-                                "Population control measures"
-                            ],
-                            ncert_reference="Class 10, Science, Chapter 8",
-                            estimated_time_minutes=95
-                        )
-                    ]
+        if self._pickled_grades is None:
+            self._pickled_grades = self._load_snapshot()
+        if all(grade in self._pickled_grades for grade in GRADES):
+            return
+        
+        parent = self._cache_path.parent
+        try:
+            if parent.exists() and not _is_private(parent):
+                self.logger.warning(
+                    f"Not writing curriculum snapshot to a directory others can write: {parent}"
                 )
-            ]
-        }
+                return
+            grades = {
+                grade: pickle.dumps(self.get_grade(grade), protocol=pickle.HIGHEST_PROTOCOL)
+                for grade in GRADES
+            }
+            self._write_snapshot(_source_version(), grades)
+        except OSError as e:
+            self.logger.warning(f"Could not write curriculum snapshot: {str(e)}")
     
-    def _get_class_12_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 12 curriculum - Advanced specialization"""
+    def _read_snapshot(self, version: Dict[str, Any]) -> Optional[Dict[int, memoryview]]:
+        """Map the snapshot's grade blobs, or None if it is stale or corrupt
         
+        The header is plain JSON, and the payload hash is checked against it,
+        before any blob is handed to pickle.
+        """
+        with open(self._cache_path, "rb") as f:
+            if f.readline() != _SNAPSHOT_MAGIC:
+                return None
+            header = json.loads(f.readline())
+            if header.get("version") != version:
+                return None
+            
+            base = f.tell()
+            # The mapping stays valid after the file is closed
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        
+        if hashlib.sha256(view[base:]).hexdigest() != header["payload_sha256"]:
+            self.logger.warning("Ignoring curriculum snapshot with a mismatched payload hash")
+            return None
         return {
-            "Physics": [
-                Chapter(
-                    id="cl12_phy_ch1",
-                    title="Electric Charges and Fields",
-                    description="Electrostatics and electric field theory",
-                    subject=Subject.PHYSICS,
-                    grade=12,
-                    ncert_chapter_number="Chapter 1",
-                    topics=[
-                        Topic(
-                            id="cl12_phy_electric_charges",
-                            title="Electric Charges",
-                            description="Properties and behavior of electric charges",
-                            subject=Subject.PHYSICS,
-                            grade=12,
-                            chapter="Electric Charges and Fields",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["electric charge", "coulomb's law", "superposition", "electrostatics"],
-                            learning_objectives=[
-                                "Understand properties of electric charges",
-                                "Apply Coulomb's law",
-                                "Use principle of superposition"
-                            ],
-                            prerequisites=["cl11_phy_electrostatics"],
-                            real_world_applications=[
-                                "Electrostatic precipitators in pollution control",
-                                "Photocopying and printing technology", 
-                                "Lightning rods and protection",
-                                "Semiconductor device physics"
-                            ],
-                            ncert_reference="Class 12, Physics, Chapter 1",
-                            estimated_time_minutes=120
-                        ),
-                        Topic(
-                            id="cl12_phy_electric_fields",
-                            title="Electric Fields",
-                            description="Electric field concept and field lines",
-                            subject=Subject.PHYSICS,
-                            grade=12,
-                            chapter="Electric Charges and Fields",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["electric field", "field lines", "electric potential", "equipotential"],
-                            learning_objectives=[
-                                "Visualize electric fields",
-                                "Calculate electric field strength",
-                                "Understand potential difference"
-                            ],
-                            prerequisites=["cl12_phy_electric_charges"],
-                            real_world_applications=[
-                                "Cathode ray tube technology",
-                                "Particle accelerators",
-                                "Medical imaging equipment",
-                                "Electronic devices and circuits"
-                            ],
-                            ncert_reference="Class 12, Physics, Chapter 1",
-                            estimated_time_minutes=110
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl12_phy_ch10",
-                    title="Wave Optics",
-                    description="Wave nature of light and interference phenomena",
-                    subject=Subject.PHYSICS,
-                    grade=12,
-                    ncert_chapter_number="Chapter 10",
-                    topics=[
-                        Topic(
-                            id="cl12_phy_wave_nature_light",
-                            title="Wave Nature of Light",
-                            description="Huygens' principle and wave theory",
-                            subject=Subject.PHYSICS,
-                            grade=12,
-                            chapter="Wave Optics",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["wave optics", "huygens principle", "wavelength", "frequency"],
-                            learning_objectives=[
-                                "Understand wave nature of light",
-                                "Apply Huygens' principle",
-                                "Explain wave propagation"
-                            ],
-                            prerequisites=["cl11_phy_ray_optics"],
-                            real_world_applications=[
-                                "Optical fiber communications",
-                                "Holography and 3D imaging",
-                                "Laser technology",
-                                "Spectroscopy in research"
-                            ],
-                            ncert_reference="Class 12, Physics, Chapter 10",
-                            estimated_time_minutes=100
-                        ),
-                        Topic(
-                            id="cl12_phy_interference",
-                            title="Interference of Light",
-                            description="Young's double slit experiment and interference patterns",
-                            subject=Subject.PHYSICS,
-                            grade=12,
-                            chapter="Wave Optics",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["interference", "double slit", "coherence", "fringe width"],
-                            learning_objectives=[
-                                "Explain interference phenomenon",
-                                "Analyze Young's double slit experiment",
-                                "Calculate fringe width and spacing"
-                            ],
-                            prerequisites=["cl12_phy_wave_nature_light"],
-                            real_world_applications=[
-                                "Anti-reflection coatings on lenses",
-                                "Interferometry in precision measurements",
-                                "Optical quality testing",
-                                "Thin film applications"
-                            ],
-                            ncert_reference="Class 12, Physics, Chapter 10",
-                            estimated_time_minutes=115
-                        )
-                    ]
-                )
-            ],
-            "Chemistry": [
-                Chapter(
-                    id="cl12_chem_ch1",
-                    title="The Solid State",
-                    description="Crystal structures and solid state properties",
-                    subject=Subject.CHEMISTRY,
-                    grade=12,
-                    ncert_chapter_number="Chapter 1",
-                    topics=[
-                        Topic(
-                            id="cl12_chem_crystal_lattice",
-                            title="Crystal Lattices and Unit Cells",
-                            description="Crystal structure and lattice types",
-                            subject=Subject.CHEMISTRY,
-                            grade=12,
-                            chapter="The Solid State",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["crystal lattice", "unit cell", "coordination number", "packing"],
-                            learning_objectives=[
-                                "Understand crystal lattice structure",
-                                "Calculate packing efficiency",
-                                "Identify crystal systems"
-                            ],
-                            prerequisites=["cl11_chem_chemical_bonding"],
-                            real_world_applications=[
-                                "Semiconductor manufacturing",
-                                "Pharmaceutical crystal engineering",
-                                "Materials science and engineering",
-                                "Nanotechnology applications"
-                            ],
-                            ncert_reference="Class 12, Chemistry, Chapter 1",
-                            estimated_time_minutes=130
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl12_chem_ch16",
-                    title="Chemistry in Everyday Life",
-                    description="Applications of chemistry in daily life",
-                    subject=Subject.CHEMISTRY,
-                    grade=12,
-                    ncert_chapter_number="Chapter 16",
-                    topics=[
-                        Topic(
-                            id="cl12_chem_medicines",
-                            title="Medicines and Drugs",
-                            description="Pharmaceutical chemistry and drug action",
-                            subject=Subject.CHEMISTRY,
-                            grade=12,
-                            chapter="Chemistry in Everyday Life",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["medicines", "drugs", "antibiotics", "analgesics", "antiseptics"],
-                            learning_objectives=[
-                                "Classify different types of medicines",
-                                "Understand drug action mechanisms",
-                                "Learn about drug development"
-                            ],
-                            prerequisites=["cl12_chem_organic_chemistry"],
-                            real_world_applications=[
-                                "Indian pharmaceutical industry",
-                                "Traditional medicine and modern chemistry",
-                                "Drug discovery and development",
-                                "Healthcare and medical treatment"
-                            ],
-                            ncert_reference="Class 12, Chemistry, Chapter 16",
-                            estimated_time_minutes=90
-                        )
-                    ]
-                )
-            ],
-            "Biology": [
-                Chapter(
-                    id="cl12_bio_ch1",
-                    title="Reproduction in Organisms",
-                    description="Reproductive strategies and mechanisms in living organisms",
-                    subject=Subject.BIOLOGY,
-                    grade=12,
-                    ncert_chapter_number="Chapter 1", 
-                    topics=[
-                        Topic(
-                            id="cl12_bio_reproduction_types",
-                            title="Types of Reproduction",
-                            description="Asexual and sexual reproduction in organisms",
-                            subject=Subject.BIOLOGY,
-                            grade=12,
-                            chapter="Reproduction in Organisms",
-                            difficulty=Difficulty.INTERMEDIATE,
-                            keywords=["reproduction", "asexual", "sexual", "gametes", "life cycles"],
-                            learning_objectives=[
-                                "Compare reproductive strategies",
-                                "Understand evolutionary advantages",
-                                "Analyze reproductive cycles"
-                            ],
-                            prerequisites=["cl11_bio_plant_physiology"],
-                            real_world_applications=[
-                                "Agricultural breeding programs",
-                                "Conservation of endangered species",
-                                "Aquaculture and fisheries",
-                                "Biotechnology and genetic engineering"
-                            ],
-                            ncert_reference="Class 12, Biology, Chapter 1",
-                            estimated_time_minutes=95
-                        )
-                    ]
-                ),
-                Chapter(
-                    id="cl12_bio_ch6",
-                    title="Molecular Basis of Inheritance",
-                    description="DNA, RNA and genetic information transfer",
-                    subject=Subject.BIOLOGY,
-                    grade=12,
-                    ncert_chapter_number="Chapter 6",
-                    topics=[
-                        Topic(
-                            id="cl12_bio_dna_structure",
-                            title="DNA Structure and Function",
-                            description="Double helix structure and genetic information storage",
-                            subject=Subject.BIOLOGY,
-                            grade=12,
-                            chapter="Molecular Basis of Inheritance",
-                            difficulty=Difficulty.ADVANCED,
-                            keywords=["DNA", "double helix", "nucleotides", "base pairing", "replication"],
-                            learning_objectives=[
-                                "Describe DNA structure",
-                                "Explain DNA replication process",
-                                "Understand genetic information storage"
-                            ],
-                            prerequisites=["cl12_bio_heredity"],
-                            real_world_applications=[
-                                "DNA fingerprinting and forensics",
-                                "Gene therapy and medical treatment",
-                                "Genetic engineering and biotechnology",
-                                "Evolutionary studies and phylogenetics"
-                            ],
-                            ncert_reference="Class 12, Biology, Chapter 6",
-                            estimated_time_minutes=120
-                        )
-                    ]
-                )
-            ]
+            int(grade): view[base + offset:base + offset + length]
+            for grade, (offset, length) in header["grades"].items()
         }
     
-    # Helper methods to generate curriculum for other classes
-    def _get_class_2_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 2 curriculum structure"""
-        return {"Environmental Studies": []}  # Simplified for brevity
-    
-    def _get_class_3_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 3 curriculum structure"""
-        return {"Environmental Studies": []}
-    
-    def _get_class_4_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 4 curriculum structure"""
-        return {"Environmental Studies": []}
+    def _write_snapshot(self, version: Dict[str, Any], grades: Dict[int, bytes]) -> None:
+        """Atomically write the header and per-grade blobs"""
+        offsets = {}
+        position = 0
+        payload_hash = hashlib.sha256()
+        for grade, blob in grades.items():
+            offsets[str(grade)] = [position, len(blob)]
+            position += len(blob)
+            payload_hash.update(blob)
+        header = {"version": version, "payload_sha256": payload_hash.hexdigest(), "grades": offsets}
+        
+        # Private to the user, so no one else can plant a snapshot to unpickle
+        self._cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # A temp file unique to this writer, so concurrent workers never write
+        # to or publish each other's half-written file
+        with tempfile.NamedTemporaryFile(
+            dir=self._cache_path.parent, prefix=self._cache_path.name + ".",
+            suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                f.write(_SNAPSHOT_MAGIC)
+                f.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+                for blob in grades.values():
+                    f.write(blob)
+            except BaseException:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        os.replace(tmp_path, self._cache_path)
     
-    def _get_class_5_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 5 curriculum structure"""
-        return {"Environmental Studies": []}
+    def _index_grade(self, grade: int, grade_data: Dict[str, List[Chapter]]) -> None:
+        """Index a grade's topics by (grade, subject) in one pass over its sections"""
+        index = self._grade_subject_index
+        buckets: Dict[Tuple[int, Subject], List[Topic]] = {}
+        for subject_name, chapters in grade_data.items():
+            # A topic is listed under its subject only in sections named after it;
+            # tuple membership matches enum members by identity before __eq__,
+            # where a set would call the Python-level Enum.__hash__ per topic
+            section_subjects = tuple(subject for subject in Subject if subject.value in subject_name)
+            if not section_subjects:
+                continue
+            for chapter in chapters:
+                for topic in chapter.topics:
+                    if topic.subject in section_subjects:
+                        buckets.setdefault((grade, topic.subject), []).append(topic)
+        
+        for subject in Subject:
+            index[(grade, subject)] = tuple(buckets.get((grade, subject), _EMPTY))
     
-    def _get_class_7_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 7 curriculum structure"""
-        return {"Science": []}
+    @property
+    def curriculum_data(self) -> Dict[int, Dict[str, List[Chapter]]]:
+        """Complete curriculum structure in grade order"""
+        return {grade: self.get_grade(grade) for grade in GRADES}
     
-    def _get_class_8_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 8 curriculum structure"""
-        return {"Science": []}
+    def _ensure_indexes(self) -> None:
+        """Build the cross-grade indexes before the first query that needs them"""
+        # Double-checked so concurrent first queries build once; the indexes
+        # are all assigned before _indexed is set
+        if self._indexed:
+            return
+        with self._build_lock:
+            if not self._indexed:
+                self._build_indexes()
+                self._indexed = True
     
-    def _get_class_9_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 9 curriculum structure"""
-        return {"Science": []}
+    def _load_grade(self, grade: int) -> Dict[str, List[Chapter]]:
+        """Build one grade from its record in the curriculum data file"""
+        if self._grade_records is None:
+            self._grade_records = _read_grade_records(CURRICULUM_DATA_PATH)
+        
+        record = self._grade_records.get(grade)
+        if record is None:
+            return {}
+        
+        sections = _loads(record)["sections"]
+        return {
+            section: [_chapter_from_record(grade, chapter) for chapter in chapters]
+            for section, chapters in sections.items()
+        }
     
-    def _get_class_11_curriculum(self) -> Dict[str, List[Chapter]]:
-        """Class 11 curriculum structure"""
-        return {"Physics": [], "Chemistry": [], "Biology": []}
+    def _iter_chapters(self) -> Iterator[Chapter]:
+        """Every chapter of every grade, in grade order"""
+        for subjects in self.curriculum_data.values():
+            for chapters in subjects.values():
+                yield from chapters
     
     def _build_indexes(self) -> None:
-        """Build search indexes for efficient topic retrieval"""
-        self.topic_index = {}
-        self.subject_index = {}
-        self.keyword_index = {}
+        """Build search indexes for efficient topic retrieval
         
-        # Build indexes for quick lookup
-        for grade, subjects in self.curriculum_data.items():
-            for subject_name, chapters in subjects.items():
-                for chapter in chapters:
-                    for topic in chapter.topics:
-                        # Topic ID index
-                        self.topic_index[topic.id] = topic
-                        
-                        # Subject index
-                        if topic.subject not in self.subject_index:
-                            self.subject_index[topic.subject] = []
-                        self.subject_index[topic.subject].append(topic)
-                        
-                        # Keyword index
-                        for keyword in topic.keywords:
-                            if keyword not in self.keyword_index:
-                                self.keyword_index[keyword] = []
-                            self.keyword_index[keyword].append(topic)
+        Everything is built in locals and assigned at the end, so no reader
+        sees a partly filled index.
+        """
+        topic_index: Dict[str, Topic] = {}
+        chapter_index: Dict[str, Chapter] = {}
+        subject_index: Dict[Subject, List[Topic]] = defaultdict(list)
+        # Histograms for the stats, counted in the same pass
+        grade_counts: Counter = Counter()
+        difficulty_counts: Counter = Counter()
+        
+        for chapter in self._iter_chapters():
+            chapter_index[chapter.id] = chapter
+            
+            for topic in chapter.topics:
+                # Topic ID index
+                topic_index[topic.id] = topic
+                
+                # Subject index
+                subject_index[topic.subject].append(topic)
+                
+                grade_counts[topic.grade] += 1
+                difficulty_counts[topic.difficulty] += 1
+        
+        # Columnar copy of every indexed topic; its row numbers are the
+        # integer handles used by the internal indexes
+        table = TopicTable(topic_index.values())
+        
+        # Inverted indexes over rows: lower-cased keyword -> topics tagged with
+        # it, and n-gram -> topics whose title, description or keywords contain it
+        keyword_postings: Dict[str, Set[int]] = defaultdict(set)
+        ngram_postings: Dict[str, Set[int]] = defaultdict(set)
+        for row, topic in enumerate(table.topics):
+            for keyword in topic.keyword_set:
+                keyword_postings[keyword].add(row)
+            
+            grams = _ngrams(table.titles_lower[row]) | _ngrams(table.descriptions_lower[row])
+            for keyword in table.keywords_lower[row]:
+                grams |= _ngrams(keyword)
+            for gram in grams:
+                ngram_postings[gram].add(row)
+        
+        self.topic_index = topic_index
+        self.chapter_index = chapter_index
+        # Plain dict, so lookups of absent subjects do not insert empty lists
+        self.subject_index: Dict[Subject, List[Topic]] = dict(subject_index)
+        self._count_by_grade = grade_counts
+        self._count_by_difficulty = difficulty_counts
+        self.topic_table = table
+        # Flat snapshot of every topic for the hot loops; tuples iterate
+        # without walking dict buckets
+        self._all_topics: Tuple[Topic, ...] = table.topics
+        self.keyword_index: Dict[str, Set[int]] = dict(keyword_postings)
+        self._ngram_index: Dict[str, Set[int]] = dict(ngram_postings)
+        self._stats_cache = self._compute_stats()
+    
+    def _search_candidates(self, query_lower: str) -> Optional[Set[int]]:
+        """Rows that may contain the query as a substring, or None to scan all
+        
+        A field containing the query contains every n-gram of it, so the
+        intersection of the query's n-gram postings is a superset of the
+        matches; shorter queries have no n-grams and fall back to a scan.
+        """
+        grams = _ngrams(query_lower)
+        if not grams:
+            return None
+        
+        postings = []
+        for gram in grams:
+            rows = self._ngram_index.get(gram)
+            if rows is None:
+                return set()
+            postings.append(rows)
+        
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
     
     # Public API Methods
     
     def get_topics_by_grade_subject(self, grade: int, subject: Subject) -> List[Topic]:
         """Get all topics for a specific grade and subject"""
-        topics = []
-        
-        if grade in self.curriculum_data:
-            grade_data = self.curriculum_data[grade]
-            
-            # Find matching subject
-            for subject_name, chapters in grade_data.items():
-                if subject.value in subject_name or subject_name == subject.value:
-                    for chapter in chapters:
-                        for topic in chapter.topics:
-                            if topic.subject == subject:
-                                topics.append(topic)
+        if grade not in GRADES:
+            return []
         
-        return topics
+        key = (grade, subject)
+        if key not in self._grade_subject_index:
+            self._index_grade(grade, self.get_grade(grade))
+        return list(self._grade_subject_index[key])
+    
+    def get_chapter_by_id(self, chapter_id: str) -> Optional[Chapter]:
+        """Get specific chapter by ID"""
+        self._ensure_indexes()
+        return self.chapter_index.get(chapter_id)
     
     def get_topic_by_id(self, topic_id: str) -> Optional[Topic]:
         """Get specific topic by ID"""
+        self._ensure_indexes()
         return self.topic_index.get(topic_id)
     
     def search_topics(self, query: str, grade: Optional[int] = None, 
                      subject: Optional[Subject] = None) -> List[Topic]:
         """Search topics by title, keywords, or description"""
-        results = []
+        self._ensure_indexes()
         query_lower = query.lower()
+        table = self.topic_table
+        topics = self._all_topics
         
-        # Search through all topics
-        for topic in self.topic_index.values():
-            # Filter by grade if specified
-            if grade and topic.grade != grade:
-                continue
-            
-            # Filter by subject if specified  
-            if subject and topic.subject != subject:
-                continue
-            
-            # Check if query matches title, description, or keywords
-            if (query_lower in topic.title.lower() or 
-                query_lower in topic.description.lower() or
-                any(query_lower in keyword.lower() for keyword in topic.keywords)):
-                results.append(topic)
+        # Grade and subject filters run on the columns; the n-gram index then
+        # narrows them to rows that can contain the query
+        rows = table.rows(grade or None, subject or None)
+        candidates = self._search_candidates(query_lower)
+        if candidates is not None:
+            rows = [row for row in rows if row in candidates]
         
-        # Sort by relevance (simplified scoring)
-        results.sort(key=lambda t: self._calculate_relevance_score(t, query_lower))
+        titles = table.titles_lower
+        descriptions = table.descriptions_lower
+        keywords = table.keywords_lower
+        scored = []
+        for row in rows:
+            # Match and relevance score in one pass: title 10, each matching
+            # keyword 5, description 2; rows that match nothing score 0
+            score = 0.0
+            if query_lower in titles[row]:
+                score += 10.0
+            for keyword in keywords[row]:
+                if query_lower in keyword:
+                    score += 5.0
+            if query_lower in descriptions[row]:
+                score += 2.0
+            if score:
+                scored.append((score, row))
         
-        return results[:50]  # Limit results
+        # Most relevant first; ties keep curriculum order
+        best = heapq.nlargest(50, scored, key=itemgetter(0))
+        return [topics[row] for _, row in best]
     
-    def _calculate_relevance_score(self, topic: Topic, query: str) -> float:
-        """Calculate relevance score for search results"""
-        score = 0.0
-        
-        # Title match gets highest score
-        if query in topic.title.lower():
-            score += 10.0
-        
-        # Keyword matches
-        for keyword in topic.keywords:
-            if query in keyword.lower():
-                score += 5.0
+    def search_by_keywords(self, keywords: Iterable[str],
+                           match_all: bool = True) -> List[Topic]:
+        """Find topics tagged with all (or, with match_all=False, any) of the keywords"""
+        self._ensure_indexes()
+        postings = [
+            self.keyword_index.get(keyword.lower(), frozenset())
+            for keyword in keywords
+        ]
+        if not postings:
+            return []
         
-        # Description match
-        if query in topic.description.lower():
-            score += 2.0
+        if match_all:
+            # Intersect starting from the shortest posting list
+            postings.sort(key=len)
+            rows = set(postings[0]).intersection(*postings[1:])
+        else:
+            rows = set().union(*postings)
         
-        return score
+        topics = self._all_topics
+        return [topics[row] for row in sorted(rows)]
     
     def get_prerequisites(self, topic_id: str) -> List[Topic]:
         """Get prerequisite topics for a given topic"""
-        topic = self.get_topic_by_id(topic_id)
-        if not topic:
+        self._ensure_indexes()
+        table = self.topic_table
+        row = table.row_of.get(topic_id)
+        if row is None:
             return []
         
-        prerequisites = []
-        for prereq_id in topic.prerequisites:
-            prereq_topic = self.get_topic_by_id(prereq_id)
-            if prereq_topic:
-                prerequisites.append(prereq_topic)
+        # Prerequisite IDs were resolved to rows when the table was built
+        indptr = table.prereq_indptr
+        topics = table.topics
+        return [topics[r] for r in table.prereq_indices[indptr[row]:indptr[row + 1]]]
+    
+    def get_prerequisite_closure(self, topic_id: str) -> List[Topic]:
+        """Get every direct and transitive prerequisite, in study order"""
+        self._ensure_indexes()
+        table = self.topic_table
+        row = table.row_of.get(topic_id)
+        if row is None:
+            return []
         
-        return prerequisites
+        topics = table.topics
+        return [topics[r] for r in table.prerequisite_closure(row)]
     
     def get_curriculum_stats(self) -> Dict[str, Any]:
         """Get comprehensive curriculum statistics"""
-        stats = {
-            "total_topics": len(self.topic_index),
-            "grades_covered": list(self.curriculum_data.keys()),
-            "subjects": list(self.subject_index.keys()),
-            "topics_by_grade": {},
-            "topics_by_subject": {},
-            "difficulty_distribution": {"Beginner": 0, "Intermediate": 0, "Advanced": 0}
-        }
-        
+        self._ensure_indexes()
+        # The curriculum never changes, so the counts are taken once; callers
+        # get their own top-level dict and lists, the count maps are read-only
+        stats = dict(self._stats_cache)
+        stats["grades_covered"] = list(stats["grades_covered"])
+        stats["subjects"] = list(stats["subjects"])
+        return stats
+    
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Count the indexed topics by grade, subject and difficulty"""
         # Count topics by grade
-        for grade in self.curriculum_data.keys():
-            stats["topics_by_grade"][grade] = len([
-                t for t in self.topic_index.values() if t.grade == grade
-            ])
+        topics_by_grade = {
+            grade: self._count_by_grade[grade] for grade in GRADES
+        }
         
         # Count topics by subject
-        for subject in self.subject_index:
-            stats["topics_by_subject"][subject.value] = len(self.subject_index[subject])
+        topics_by_subject = {
+            _SUBJECT_VALUES[subject]: len(topics) for subject, topics in self.subject_index.items()
+        }
         
         # Count by difficulty
-        for topic in self.topic_index.values():
-            stats["difficulty_distribution"][topic.difficulty.value] += 1
+        difficulty_distribution = {
+            value: self._count_by_difficulty[difficulty]
+            for difficulty, value in _DIFFICULTY_VALUES.items()
+        }
         
-        return stats
+        return {
+            "total_topics": len(self._all_topics),
+            "grades_covered": tuple(GRADES),
+            "subjects": tuple(self.subject_index),
+            "topics_by_grade": MappingProxyType(topics_by_grade),
+            "topics_by_subject": MappingProxyType(topics_by_subject),
+            "difficulty_distribution": MappingProxyType(difficulty_distribution)
+        }
     
     def export_curriculum_json(self) -> str:
         """Export complete curriculum as JSON"""
-        export_data = {}
+        # The curriculum is immutable, so the document is serialized once
+        if self._export_json is None:
+            self._export_json = b"".join(self.export_curriculum_iter()).decode()
+        return self._export_json
+    
+    def export_curriculum_iter(self) -> Iterator[bytes]:
+        """Stream the JSON export as UTF-8 chunks, one grade at a time
         
+        The chunks join to the same document as export_curriculum_json(), but
+        only one grade's subtree is held in memory while serializing, so the
+        export can be written to a file or response body as it is produced.
+        """
+        separator = b"{"
         for grade, subjects in self.curriculum_data.items():
-            export_data[str(grade)] = {}
-            for subject_name, chapters in subjects.items():
-                export_data[str(grade)][subject_name] = []
-                for chapter in chapters:
-                    chapter_data = {
-                        "id": chapter.id,
-                        "title": chapter.title,
-                        "description": chapter.description,
-                        "ncert_chapter_number": chapter.ncert_chapter_number,
-                        "topics": []
+            # Indent the grade's own document one level, as it nests in the whole
+            body = _dump_export(self._grade_export_data(subjects)).replace(b"\n", b"\n  ")
+            yield b'%s\n  "%d": %s' % (separator, grade, body)
+            separator = b","
+        yield b"{}" if separator == b"{" else b"\n}"
+    
+    def _grade_export_data(self, subjects: Dict[str, List[Chapter]]) -> Dict[str, Any]:
+        """Plain export structure of one grade's chapters and topics"""
+        grade_data = {}
+        
+        for subject_name, chapters in subjects.items():
+            grade_data[subject_name] = []
+            for chapter in chapters:
+                chapter_data = {
+                    "id": chapter.id,
+                    "title": chapter.title,
+                    "description": chapter.description,
+                    "ncert_chapter_number": chapter.ncert_chapter_number,
+                    "topics": []
+                }
+                
+                for topic in chapter.topics:
+                    topic_data = {
+                        "id": topic.id,
+                        "title": topic.title,
+                        "description": topic.description,
+                        "subject": _SUBJECT_VALUES[topic.subject],
+                        "grade": topic.grade,
+                        "chapter": topic.chapter,
+                        "difficulty": _DIFFICULTY_VALUES[topic.difficulty],
+                        "keywords": topic.keywords,
+                        "learning_objectives": topic.learning_objectives,
+                        "prerequisites": topic.prerequisites,
+                        "real_world_applications": topic.real_world_applications,
+                        "ncert_reference": topic.ncert_reference,
+                        "estimated_time_minutes": topic.estimated_time_minutes
                     }
-                    
-                    for topic in chapter.topics:
-                        topic_data = {
-                            "id": topic.id,
-                            "title": topic.title,
-                            "description": topic.description,
-                            "subject": topic.subject.value,
-                            "grade": topic.grade,
-                            "chapter": topic.chapter,
-                            "difficulty": topic.difficulty.value,
-                            "keywords": topic.keywords,
-                            "learning_objectives": topic.learning_objectives,
-                            "prerequisites": topic.prerequisites,
-                            "real_world_applications": topic.real_world_applications,
-                            "ncert_reference": topic.ncert_reference,
-                            "estimated_time_minutes": topic.estimated_time_minutes
-                        }
-                        chapter_data["topics"].append(topic_data)
-                    
-                    export_data[str(grade)][subject_name].append(chapter_data)
+                    chapter_data["topics"].append(topic_data)
+                
+                grade_data[subject_name].append(chapter_data)
         
-        return json.dumps(export_data, indent=2, ensure_ascii=False)
+        return grade_data
 
 
-# Global curriculum instance
-_curriculum_instance = None
+# Global curriculum instance. Construction only sets up empty shared state
+# (grades load on first access), so it is created at import, under the import
+# lock, rather than racing on first use from several threads; the lazy grade
+# and index builds then run under the instance's build lock.
+_curriculum_instance = NCERTCurriculum()
 
 def get_curriculum() -> NCERTCurriculum:
     """Get singleton curriculum instance"""
-    global _curriculum_instance
-    if _curriculum_instance is None:
-        _curriculum_instance = NCERTCurriculum()
     return _curriculum_instance
@@ -4,24 +4,46 @@ Maps topics to difficulty levels, learning paths, and related concepts
 """
 
 from typing import Dict, List, Any, Optional, Tuple, Set
+from collections import defaultdict
 from dataclasses import dataclass
+from array import array
 from enum import Enum
 
 from .ncert_curriculum import NCERTCurriculum, Topic, Subject, Difficulty
 
 
+# Starting difficulty score of each level, before grade and prerequisite adjustments
+_DIFFICULTY_BASE_SCORES: Dict[Difficulty, float] = {
+    Difficulty.BEGINNER: 0.2,
+    Difficulty.INTERMEDIATE: 0.5,
+    Difficulty.ADVANCED: 0.8
+}
+
+
 @dataclass
 class TopicRelationship:
-    """Relationship between topics"""
+    """Relationship between topics
+    
+    Used while the mapper is built; the frozen mapper stores its edges in an
+    _EdgeTable and only materializes these for the relationships view.
+    """
+    # Declared by hand; dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("source_topic_id", "target_topic_id", "relationship_type", "strength")
+    
     source_topic_id: str
     target_topic_id: str
     relationship_type: str  # prerequisite, related, builds_upon, applies_to
     strength: float  # 0.0 to 1.0
 
 
-@dataclass 
+@dataclass
 class LearningPath:
     """Sequence of topics for learning"""
+    __slots__ = (
+        "path_id", "name", "description", "subject", "grade_range", "topics",
+        "estimated_hours"
+    )
+    
     path_id: str
     name: str
     description: str
@@ -31,19 +53,80 @@ class LearningPath:
     estimated_hours: int
 
 
+class _EdgeTable:
+    """Relationship lists packed into flat CSR arrays
+    
+    The edges grouped under nodes[i] are positions
+    offsets[i]:offsets[i + 1] of the parallel edge columns.
+    """
+    __slots__ = ("nodes", "row_of", "offsets", "sources", "targets", "types", "strengths")
+    
+    def __init__(self, groups: Dict[str, List[TopicRelationship]]):
+        self.nodes: Tuple[str, ...] = tuple(groups)
+        self.row_of: Dict[str, int] = {node: row for row, node in enumerate(self.nodes)}
+        edges = [rel for node in self.nodes for rel in groups[node]]
+        self.offsets = array("l", [0])
+        for node in self.nodes:
+            self.offsets.append(self.offsets[-1] + len(groups[node]))
+        self.sources = tuple(rel.source_topic_id for rel in edges)
+        self.targets = tuple(rel.target_topic_id for rel in edges)
+        self.types = tuple(rel.relationship_type for rel in edges)
+        # Doubles, so strengths read back exactly as they were given
+        self.strengths = array("d", (rel.strength for rel in edges))
+    
+    def edges(self, node: str) -> range:
+        """Edge positions grouped under a node (empty if it has none)"""
+        row = self.row_of.get(node)
+        if row is None:
+            return range(0)
+        return range(self.offsets[row], self.offsets[row + 1])
+
+
 class TopicMapper:
     """Maps relationships between curriculum topics"""
     
     def __init__(self, curriculum: NCERTCurriculum):
         """Initialize topic mapper"""
         self.curriculum = curriculum
-        self.relationships: Dict[str, List[TopicRelationship]] = {}
+        # Relationship lists keyed by target topic, until _freeze packs them
+        self._pending_edges: Optional[Dict[str, List[TopicRelationship]]] = defaultdict(list)
         self.difficulty_progressions: Dict[str, List[str]] = {}
         self.cross_subject_connections: List[TopicRelationship] = []
+        # Topic ID -> (progression name, position) of each progression containing it
+        self._progression_index: Dict[str, List[Tuple[str, int]]] = {}
+        # Per-topic results; the curriculum and progressions never change
+        self._path_cache: Dict[str, Tuple[Topic, ...]] = {}
+        self._difficulty_cache: Dict[str, float] = {}
         
         self._build_relationships()
         self._identify_progressions()
         self._find_cross_subject_connections()
+        self._freeze()
+    
+    def _freeze(self) -> None:
+        """Pack the finished relationship lists into a CSR table and drop the lists"""
+        self._edges = _EdgeTable(self._pending_edges)
+        self._pending_edges = None
+    
+    @property
+    def relationships(self) -> Dict[str, List[TopicRelationship]]:
+        """Relationship lists keyed by target topic, rebuilt from the edge table"""
+        edges = self._edges
+        return {
+            node: [
+                TopicRelationship(
+                    source_topic_id=edges.sources[edge],
+                    target_topic_id=edges.targets[edge],
+                    relationship_type=edges.types[edge],
+                    strength=edges.strengths[edge]
+                )
+                for edge in edges.edges(node)
+            ]
+            for node in edges.nodes
+        }
+    
+    # Edges are keyed by target topic already, so the reverse view is the same
+    reverse_relationships = relationships
     
     def _build_relationships(self) -> None:
         """Build relationships between topics"""
@@ -102,9 +185,7 @@ class TopicMapper:
                     strength=0.8
                 )
                 
-                if topic_ids[i] not in self.relationships:
-                    self.relationships[topic_ids[i]] = []
-                self.relationships[topic_ids[i]].append(relationship)
+                self._pending_edges[topic_ids[i]].append(relationship)
     
     def _build_chemistry_relationships(self) -> None:
         """Build chemistry topic relationships"""
@@ -159,9 +240,17 @@ class TopicMapper:
             self.difficulty_progressions[progression_name] = topic_ids
     
     def _identify_progressions(self) -> None:
-        """Identify difficulty progressions within subjects"""
-        # Already handled in individual subject relationship builders
-        pass
+        """Index where each topic sits in the difficulty progressions"""
+        # The progressions themselves come from the subject relationship builders
+        for progression_name, topic_ids in self.difficulty_progressions.items():
+            seen: Set[str] = set()
+            for position, topic_id in enumerate(topic_ids):
+                # First occurrence only, as list.index() would report
+                if topic_id not in seen:
+                    seen.add(topic_id)
+                    self._progression_index.setdefault(topic_id, []).append(
+                        (progression_name, position)
+                    )
     
     def _find_cross_subject_connections(self) -> None:
         """Find connections between different subjects"""
@@ -196,20 +285,20 @@ class TopicMapper:
         
         related = []
         
+        # Both directions read the edges grouped under this topic
+        edges = self._edges
+        
         # Get direct relationships
-        if topic_id in self.relationships:
-            for rel in self.relationships[topic_id]:
-                related_topic = self.curriculum.get_topic_by_id(rel.target_topic_id)
-                if related_topic:
-                    related.append((related_topic, rel.relationship_type, rel.strength))
+        for edge in edges.edges(topic_id):
+            related_topic = self.curriculum.get_topic_by_id(edges.targets[edge])
+            if related_topic:
+                related.append((related_topic, edges.types[edge], edges.strengths[edge]))
         
         # Get reverse relationships
-        for other_topic_id, relationships in self.relationships.items():
-            for rel in relationships:
-                if rel.target_topic_id == topic_id:
-                    related_topic = self.curriculum.get_topic_by_id(rel.source_topic_id)
-                    if related_topic:
-                        related.append((related_topic, f"reverse_{rel.relationship_type}", rel.strength))
+        for edge in edges.edges(topic_id):
+            related_topic = self.curriculum.get_topic_by_id(edges.sources[edge])
+            if related_topic:
+                related.append((related_topic, f"reverse_{edges.types[edge]}", edges.strengths[edge]))
         
         # Sort by strength and return top results
         related.sort(key=lambda x: x[2], reverse=True)
@@ -217,45 +306,60 @@ class TopicMapper:
     
     def get_learning_path(self, topic_id: str) -> Optional[List[Topic]]:
         """Get optimal learning path to reach a topic"""
+        path = self._path_cache.get(topic_id)
+        if path is None:
+            path = self._build_learning_path(topic_id)
+            if path is None:
+                # Unknown IDs are not cached, so arbitrary input cannot grow the cache
+                return None
+            self._path_cache[topic_id] = path
+        return list(path)
+    
+    def _build_learning_path(self, topic_id: str) -> Optional[Tuple[Topic, ...]]:
+        """Topics of the progression containing a topic, up to and including it"""
         
-        # Find which progression this topic belongs to
-        for progression_name, topic_ids in self.difficulty_progressions.items():
-            if topic_id in topic_ids:
-                target_index = topic_ids.index(topic_id)
-                
-                # Return all topics up to and including the target
-                path_topics = []
-                for i in range(target_index + 1):
-                    topic = self.curriculum.get_topic_by_id(topic_ids[i])
-                    if topic:
-                        path_topics.append(topic)
-                
-                return path_topics
+        # Find which progression this topic belongs to (the first listing it)
+        positions = self._progression_index.get(topic_id)
+        if not positions:
+            return None
         
-        return None
+        progression_name, target_index = positions[0]
+        topic_ids = self.difficulty_progressions[progression_name]
+        
+        # Return all topics up to and including the target
+        path_topics = []
+        for i in range(target_index + 1):
+            topic = self.curriculum.get_topic_by_id(topic_ids[i])
+            if topic:
+                path_topics.append(topic)
+        
+        return tuple(path_topics)
     
     def suggest_next_topics(self, completed_topic_ids: List[str], subject: Optional[Subject] = None) -> List[Topic]:
         """Suggest next topics based on completed topics"""
         
         suggestions = []
-        completed_set = set(completed_topic_ids)
+        
+        # Highest completed position in each progression, found through the index
+        max_completed: Dict[str, int] = {}
+        for tid in set(completed_topic_ids):
+            for progression_name, position in self._progression_index.get(tid, ()):
+                if position > max_completed.get(progression_name, -1):
+                    max_completed[progression_name] = position
         
         # Look through progressions to find next logical topics
         for progression_name, topic_ids in self.difficulty_progressions.items():
             
             # Check if any topic in this progression has been completed
-            completed_in_progression = [tid for tid in topic_ids if tid in completed_set]
+            max_completed_index = max_completed.get(progression_name)
             
-            if completed_in_progression:
-                # Find the highest completed topic
-                max_completed_index = max(topic_ids.index(tid) for tid in completed_in_progression)
-                
+            if max_completed_index is not None:
                 # Suggest the next topic if it exists
                 if max_completed_index + 1 < len(topic_ids):
                     next_topic_id = topic_ids[max_completed_index + 1]
                     next_topic = self.curriculum.get_topic_by_id(next_topic_id)
                     
-                    if next_topic and (not subject or next_topic.subject == subject):
+                    if next_topic and (not subject or next_topic.subject is subject):
                         suggestions.append(next_topic)
         
         # Remove duplicates and limit results
@@ -271,16 +375,18 @@ class TopicMapper:
     
     def get_topic_difficulty_score(self, topic_id: str) -> float:
         """Calculate difficulty score for a topic (0.0 to 1.0)"""
+        score = self._difficulty_cache.get(topic_id)
+        if score is None:
+            topic = self.curriculum.get_topic_by_id(topic_id)
+            if not topic:
+                return 0.0
+            score = self._difficulty_cache[topic_id] = self._compute_difficulty_score(topic)
+        return score
+    
+    def _compute_difficulty_score(self, topic: Topic) -> float:
+        """Score a topic from its difficulty, grade and prerequisite count"""
         
-        topic = self.curriculum.get_topic_by_id(topic_id)
-        if not topic:
-            return 0.0
-        
-        base_score = {
-            Difficulty.BEGINNER: 0.2,
-            Difficulty.INTERMEDIATE: 0.5, 
-            Difficulty.ADVANCED: 0.8
-        }.get(topic.difficulty, 0.5)
+        base_score = _DIFFICULTY_BASE_SCORES.get(topic.difficulty, 0.5)
         
         # Adjust based on grade level
         grade_factor = (topic.grade - 1) / 11  # Normalize grade 1-12 to 0-1
@@ -324,14 +430,15 @@ class TopicMapper:
         }
         
         # Export relationships
-        for topic_id, relationships in self.relationships.items():
+        edges = self._edges
+        for topic_id in edges.nodes:
             export_data["relationships"][topic_id] = [
                 {
-                    "target": rel.target_topic_id,
-                    "type": rel.relationship_type,
-                    "strength": rel.strength
+                    "target": edges.targets[edge],
+                    "type": edges.types[edge],
+                    "strength": edges.strengths[edge]
                 }
-                for rel in relationships
+                for edge in edges.edges(topic_id)
             ]
         
         # Export cross-subject connections
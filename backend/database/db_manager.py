@@ -5,9 +5,10 @@ High-performance database operations with connection pooling, migrations, and ba
 
 import asyncio
 import logging
+import threading
 from typing import Optional, List, Dict, Any, AsyncGenerator, Type
 from contextlib import asynccontextmanager
-from sqlalchemy import create_engine, text, MetaData
+from sqlalchemy import create_engine, event, text, MetaData
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.engine import Engine
@@ -23,6 +24,26 @@ from ..config import get_settings
 from ..utils.error_handlers import log_error, DatabaseError
 
 
+# Per-connection SQLite tuning, applied to every pooled connection
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-64000;",       # 64 MB page cache
+    "PRAGMA mmap_size=268435456;",     # 256 MB memory-mapped I/O
+    "PRAGMA foreign_keys=ON;",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLite PRAGMAs when the pool opens a new connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class DatabaseManager:
     """Advanced database manager with connection pooling and async support"""
     
@@ -33,9 +54,31 @@ class DatabaseManager:
         self.session_factory: Optional[sessionmaker] = None
         self.logger = logging.getLogger(__name__)
         self._initialized = False
+        # One manager serves every session, and each Streamlit rerun runs its
+        # own event loop on its own thread, so a thread lock guards first use
+        self._init_lock = threading.Lock()
     
     async def initialize(self) -> None:
-        """Initialize database connection and schema"""
+        """Initialize database connection and schema
+        
+        Concurrent first callers wait for a single initialization instead of
+        each creating an engine.
+        """
+        if self._initialized:
+            return
+        
+        # Poll rather than block, so a waiting caller keeps its loop running
+        # and can be cancelled without leaving the lock held
+        while not self._init_lock.acquire(blocking=False):
+            await asyncio.sleep(0.05)
+        try:
+            if not self._initialized:
+                await self._initialize_locked()
+        finally:
+            self._init_lock.release()
+    
+    async def _initialize_locked(self) -> None:
+        """Create the engine, schema and default data; the caller holds _init_lock"""
         try:
             # Create engine with connection pooling
             self.engine = create_engine(
@@ -48,6 +91,9 @@ class DatabaseManager:
                 echo=self.settings.debug
             )
             
+            if "sqlite" in self.settings.database_url:
+                event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+            
             # Create session factory
             self.session_factory = sessionmaker(
                 bind=self.engine,
@@ -68,6 +114,11 @@ class DatabaseManager:
             self.logger.info("Database initialized successfully")
             
         except Exception as e:
+            # Release the engine's pool, so a retry does not leak it
+            if self.engine is not None:
+                self.engine.dispose()
+                self.engine = None
+                self.session_factory = None
             error_msg = f"Database initialization failed: {str(e)}"
             self.logger.error(error_msg)
             raise DatabaseError(error_msg) from e
@@ -104,13 +155,10 @@ class DatabaseManager:
     async def _setup_maintenance(self) -> None:
         """Set up database maintenance tasks"""
         try:
-            # Enable WAL mode for SQLite
+            # Enable WAL mode for SQLite (persisted in the database file)
             if "sqlite" in self.settings.database_url:
                 with self.get_session() as session:
                     session.execute(text("PRAGMA journal_mode=WAL;"))
-                    session.execute(text("PRAGMA synchronous=NORMAL;"))
-                    session.execute(text("PRAGMA cache_size=10000;"))
-                    session.execute(text("PRAGMA foreign_keys=ON;"))
                     session.commit()
         except Exception as e:
             self.logger.warning(f"Database maintenance setup failed: {str(e)}")
@@ -0,0 +1,38 @@
+"""
+Error Handling for ScienceGPT v3.0
+Application exception types and shared error reporting helpers
+"""
+
+import logging
+import sys
+
+# Startup errors are shown in the page when running under Streamlit
+try:
+    import streamlit as st
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    STREAMLIT_AVAILABLE = False
+
+
+class ScienceGPTError(Exception):
+    """Base class for application errors"""
+
+
+class LLMError(ScienceGPTError):
+    """LLM provider, rate limiting or response generation failure"""
+
+
+class DatabaseError(ScienceGPTError):
+    """Database connection, schema or query failure"""
+
+
+def log_error(message: str) -> None:
+    """Log a recoverable error with the active exception's traceback, if any"""
+    logging.getLogger(__name__).error(message, exc_info=sys.exc_info()[0] is not None)
+
+
+def handle_startup_error(message: str) -> None:
+    """Log an error that stops the app from starting and show it to the user"""
+    log_error(message)
+    if STREAMLIT_AVAILABLE:
+        st.error(f"❌ {message}")
@@ -0,0 +1,58 @@
+"""
+Input Validators for ScienceGPT v3.0
+Validation and sanitization of user input and runtime environment
+"""
+
+import logging
+import re
+
+from ..config import get_settings
+
+
+# Limits for student questions
+MAX_INPUT_LENGTH = 2000
+
+# Patterns are compiled once at import; these run on every LLM request
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+_VALID_TEXT_RE = re.compile(r"\w", re.UNICODE)
+
+# Prompt-injection phrases, matched in a single pass as one alternation
+_BLOCKED_PHRASES = (
+    r"ignore (?:all )?(?:the )?(?:previous|prior|above) instructions",
+    r"disregard (?:all )?(?:the )?(?:previous|prior|above) instructions",
+    r"forget (?:all )?(?:your|the) instructions",
+    r"reveal (?:your|the) system prompt",
+)
+_BLOCKLIST_RE = re.compile("|".join(_BLOCKED_PHRASES), re.IGNORECASE)
+
+
+def sanitize_input(text: str) -> str:
+    """Remove control characters and redundant whitespace from user input"""
+    if not text:
+        return ""
+    
+    text = _CONTROL_CHARS_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+    return text.strip()[:MAX_INPUT_LENGTH]
+
+
+def validate_input_text(text: str) -> bool:
+    """Check that input is non-empty, within limits, and not a prompt injection"""
+    if not text or len(text) > MAX_INPUT_LENGTH:
+        return False
+    
+    if not _VALID_TEXT_RE.search(text):
+        return False
+    
+    return _BLOCKLIST_RE.search(text) is None
+
+
+def validate_environment() -> bool:
+    """Check that application settings load from the environment"""
+    try:
+        get_settings()
+        return True
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Environment validation failed: {str(e)}")
+        return False
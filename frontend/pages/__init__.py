@@ -3,6 +3,13 @@ Pages Package for ScienceGPT v3.0
 All application pages and their rendering logic
 """
 
-from . import home, learn, practice, progress, achievements, curriculum_explorer, settings
+import importlib
 
 __all__ = ["home", "learn", "practice", "progress", "achievements", "curriculum_explorer", "settings"]
+
+
+def __getattr__(name):
+    # Pages are imported on first access so only the rendered page is loaded
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
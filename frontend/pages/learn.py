@@ -5,8 +5,9 @@ AI-powered question and answer interface with context awareness
 
 import streamlit as st
 import asyncio
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator, Coroutine, Iterator, List, TypeVar
 
 from frontend.components.navigation import render_page_header, render_breadcrumb
 from frontend.widgets.cards import render_ai_response_card
@@ -102,6 +103,63 @@ def render_question_input() -> None:
             )
 
 
+T = TypeVar("T")
+
+
+@st.cache_resource
+def get_llm_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop that runs all LLM work
+    
+    Every rerun runs the script in a new thread with its own loop. The shared
+    handler's connection pool, semaphores and cache maintenance task must stay
+    on one loop, so they live on a dedicated background thread.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return loop
+
+
+def run_on_llm_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the LLM loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_llm_loop()).result()
+
+
+async def _create_llm_handler() -> LLMHandler:
+    """Construct the handler inside the LLM loop, where its cache starts maintenance"""
+    return LLMHandler()
+
+
+@st.cache_resource
+def get_llm_handler() -> LLMHandler:
+    """Get the process-wide LLM handler
+    
+    All questions share its response cache, rate limiter, in-flight request
+    coalescing and HTTP connection pool.
+    """
+    return run_on_llm_loop(_create_llm_handler())
+
+
+async def _next_chunk(stream: AsyncIterator[str]) -> Optional[str]:
+    """Next chunk of an async text stream, or None once it is exhausted"""
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+def iterate_stream(stream: AsyncIterator[str]) -> Iterator[str]:
+    """Drive an async text stream on the LLM loop from Streamlit's synchronous script code"""
+    try:
+        while True:
+            chunk = run_on_llm_loop(_next_chunk(stream))
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        # Stop generation if the script stops reading before the stream ends
+        run_on_llm_loop(stream.aclose())
+
+
 def process_question(question: str, include_examples: bool = True, detailed: bool = False, voice: bool = False) -> None:
     """Process user question and generate AI response"""
     
@@ -125,19 +183,24 @@ def process_question(question: str, include_examples: bool = True, detailed: boo
         }
         
         try:
-            # Get AI response
-            llm_handler = LLMHandler()
+            # Stream AI response as it is generated
+            llm_handler = get_llm_handler()
+            completed: List[Any] = []
             
-            # Use asyncio to handle the async call
-            response = asyncio.run(
-                llm_handler.explain_concept(
-                    topic=question,
-                    grade=grade,
-                    subject=subject,
-                    language=language,
-                    include_examples=include_examples
+            st.markdown("**🤖 AI Response:**")
+            st.write_stream(
+                iterate_stream(
+                    llm_handler.explain_concept_stream(
+                        topic=question,
+                        grade=grade,
+                        subject=subject,
+                        language=language,
+                        include_examples=include_examples,
+                        on_complete=completed.append
+                    )
                 )
             )
+            response = completed[0]
             
             # Store conversation
             if 'conversation_history' not in st.session_state:
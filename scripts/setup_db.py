@@ -13,7 +13,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.database.db_manager import DatabaseManager
-from backend.curriculum.ncert_curriculum import get_curriculum
+from backend.curriculum.ncert_curriculum import NCERTCurriculum
 from backend.config import get_settings
 
 
@@ -86,7 +86,8 @@ async def load_curriculum_data(db_manager: DatabaseManager):
     
     print("📚 Loading NCERT curriculum data...")
     
-    curriculum = get_curriculum()
+    # Builds every grade and writes the curriculum snapshot the app maps at startup
+    curriculum = NCERTCurriculum.preload(lazy_export=True)
     stats = curriculum.get_curriculum_stats()
     
     print(f"  📊 Total topics to load: {stats['total_topics']}")
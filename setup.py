@@ -65,5 +65,6 @@ setup(
     include_package_data=True,
     package_data={
         "": ["assets/**/*", ".streamlit/*", "docs/*"],
+        "backend.curriculum": ["data/*.jsonl"],
     },
 )
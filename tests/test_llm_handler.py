@@ -0,0 +1,214 @@
+"""
+Tests for the LLM handler: rate limiting, hedged requests and request coalescing
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from backend.ai.llm_handler import LLMHandler, LLMProvider, LLMResponse, RateLimiter
+from backend.utils.error_handlers import LLMError
+
+CONTEXT = {"grade": 7, "subject": "Physics", "type": "general"}
+
+
+def _response(provider: LLMProvider, content: str = "answer") -> LLMResponse:
+    return LLMResponse(
+        content=content, provider=provider, model="test", tokens_used=10,
+        response_time_ms=5, cached=False, timestamp=datetime.now(), metadata={}
+    )
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """A handler whose providers are placeholders; tests replace _make_request"""
+
+    def initialize_placeholder_providers(self):
+        self.providers = {provider: object() for provider in LLMProvider}
+        self._available = frozenset(self.providers)
+
+    monkeypatch.setattr(LLMHandler, "_initialize_providers", initialize_placeholder_providers)
+    return LLMHandler()
+
+
+# Rate limiting
+
+
+def test_try_acquire_admits_exactly_the_limit_under_concurrency():
+    async def scenario():
+        limiter = RateLimiter()
+        limit = RateLimiter.LIMITS[LLMProvider.GROQ]
+        results = await asyncio.gather(
+            *(limiter.try_acquire(LLMProvider.GROQ) for _ in range(limit + 5))
+        )
+        return limiter, limit, results
+
+    limiter, limit, results = asyncio.run(scenario())
+    allowed = [ok for ok, _ in results]
+    assert allowed.count(True) == limit
+    assert allowed[limit:] == [False] * 5
+    assert "Rate limit exceeded" in results[-1][1]
+    assert len(limiter.requests[LLMProvider.GROQ.value]) == limit
+
+
+def test_try_acquire_admits_again_once_the_window_passes():
+    async def scenario():
+        limiter = RateLimiter()
+        limit = RateLimiter.LIMITS[LLMProvider.OPENAI]
+        for _ in range(limit):
+            assert (await limiter.try_acquire(LLMProvider.OPENAI))[0]
+        rejected = (await limiter.try_acquire(LLMProvider.OPENAI))[0]
+
+        # Age every logged request past the sliding window
+        window = limiter.requests[LLMProvider.OPENAI.value]
+        for i in range(len(window)):
+            window[i] -= RateLimiter.WINDOW_SECONDS
+        admitted = (await limiter.try_acquire(LLMProvider.OPENAI))[0]
+        return rejected, admitted, len(window)
+
+    rejected, admitted, logged = asyncio.run(scenario())
+    assert not rejected
+    assert admitted
+    assert logged == 1
+
+
+def test_providers_have_independent_windows():
+    async def scenario():
+        limiter = RateLimiter()
+        for _ in range(RateLimiter.LIMITS[LLMProvider.GROQ]):
+            await limiter.try_acquire(LLMProvider.GROQ)
+        return (await limiter.try_acquire(LLMProvider.ANTHROPIC))[0]
+
+    assert asyncio.run(scenario())
+
+
+# Hedged requests
+
+
+def test_slow_provider_is_hedged_and_cancelled(handler):
+    cancelled = []
+
+    async def make_request(provider, question, context):
+        if provider is LLMProvider.GROQ:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+        return _response(provider)
+
+    handler._make_request = make_request
+    providers = [LLMProvider.GROQ, LLMProvider.OPENAI]
+    response = asyncio.run(handler._hedged_request(providers, "q", CONTEXT, hedge_delay=0.01))
+    assert response.provider is LLMProvider.OPENAI
+    assert cancelled == [LLMProvider.GROQ]
+
+
+def test_failed_provider_falls_through_without_waiting(handler):
+    calls = []
+
+    async def make_request(provider, question, context):
+        calls.append(provider)
+        if provider is not LLMProvider.ANTHROPIC:
+            raise LLMError(f"{provider.value} down")
+        return _response(provider)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        response = await handler._hedged_request(list(LLMProvider), "q", CONTEXT, hedge_delay=5)
+        return response, loop.time() - start
+
+    handler._make_request = make_request
+    response, elapsed = asyncio.run(scenario())
+    assert response.provider is LLMProvider.ANTHROPIC
+    assert calls == list(LLMProvider)
+    assert elapsed < 1
+
+
+def test_all_providers_failing_raises(handler):
+    async def make_request(provider, question, context):
+        raise LLMError("down")
+
+    handler._make_request = make_request
+    with pytest.raises(LLMError, match="All LLM providers failed"):
+        asyncio.run(handler._hedged_request(list(LLMProvider), "q", CONTEXT, hedge_delay=0.01))
+
+
+# Request coalescing
+
+
+def test_identical_concurrent_questions_share_one_fetch(handler):
+    calls = []
+
+    async def make_request(provider, question, context):
+        calls.append(question)
+        await asyncio.sleep(0.05)
+        return _response(provider)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            handler.generate_response("What is force?", dict(CONTEXT)) for _ in range(5)
+        ))
+
+    handler._make_request = make_request
+    responses = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert {r.content for r in responses} == {"answer"}
+    assert handler._inflight == {}
+
+
+def test_cancelling_the_first_caller_keeps_the_shared_fetch(handler):
+    calls = []
+
+    async def make_request(provider, question, context):
+        calls.append(question)
+        await asyncio.sleep(0.05)
+        return _response(provider)
+
+    async def scenario():
+        first = asyncio.ensure_future(handler.generate_response("What is force?", dict(CONTEXT)))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.ensure_future(handler.generate_response("What is force?", dict(CONTEXT)))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        first.cancel()
+        results = await asyncio.gather(*waiters)
+        return first, results
+
+    handler._make_request = make_request
+    first, results = asyncio.run(scenario())
+    assert first.cancelled()
+    assert [r.content for r in results] == ["answer"] * 3
+    assert len(calls) == 1
+
+
+def test_later_identical_questions_are_served_from_the_cache(handler):
+    calls = []
+
+    async def make_request(provider, question, context):
+        calls.append(question)
+        return _response(provider)
+
+    async def scenario():
+        first = await handler.generate_response("What is force?", dict(CONTEXT))
+        second = await handler.generate_response("  what is FORCE ", dict(CONTEXT))
+        return first, second
+
+    handler._make_request = make_request
+    first, second = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert not first.cached
+    assert second.cached and second.content == first.content
+
+
+def test_invalid_questions_are_rejected_before_any_fetch(handler):
+    async def make_request(provider, question, context):
+        raise AssertionError("no request expected")
+
+    handler._make_request = make_request
+    with pytest.raises(LLMError, match="Invalid input question"):
+        asyncio.run(handler.generate_response("   ", dict(CONTEXT)))
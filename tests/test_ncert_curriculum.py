@@ -0,0 +1,282 @@
+"""
+Tests for the NCERT curriculum: lazy loading, snapshots, indexes, search and export
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from backend.curriculum import ncert_curriculum
+from backend.curriculum.ncert_curriculum import (
+    GRADES, Chapter, NCERTCurriculum, Subject, TopicTable
+)
+
+
+@pytest.fixture(scope="module")
+def curriculum():
+    """Fully indexed curriculum without a snapshot"""
+    curriculum = NCERTCurriculum(None)
+    curriculum._ensure_indexes()
+    return curriculum
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    """Snapshot location private to one test, with its own shared state"""
+    path = tmp_path / "cache" / "curriculum.snapshot"
+    yield path
+    NCERTCurriculum._shared_states.pop(path, None)
+
+
+@pytest.fixture
+def grade_loads(monkeypatch):
+    """Grades built from the data file, in build order"""
+    loads = []
+    load_grade = NCERTCurriculum._load_grade
+
+    def counting_load_grade(self, grade):
+        loads.append(grade)
+        return load_grade(self, grade)
+
+    monkeypatch.setattr(NCERTCurriculum, "_load_grade", counting_load_grade)
+    return loads
+
+
+def _fresh(path):
+    """A curriculum that does not share state with earlier instances for path"""
+    NCERTCurriculum._shared_states.pop(path, None)
+    return NCERTCurriculum(path)
+
+
+# Lazy loading
+
+
+def test_chapter_topics_are_built_on_first_access():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return ["topic"]
+
+    chapter = Chapter(
+        id="ch", title="Chapter", description="", subject=Subject.PHYSICS,
+        grade=6, topics=factory, ncert_chapter_number="1"
+    )
+    assert calls == []
+    assert chapter.topics == ["topic"]
+    assert chapter.topics == ["topic"]
+    assert calls == [1]
+
+
+def test_single_grade_miss_builds_only_that_grade(snapshot_path, grade_loads):
+    curriculum = NCERTCurriculum(snapshot_path)
+
+    curriculum.get_grade(10)
+    curriculum.get_topics_by_grade_subject(10, Subject.PHYSICS)
+
+    assert grade_loads == [10]
+    # Plain reads never write the snapshot
+    assert not snapshot_path.exists()
+
+
+# Snapshots
+
+
+def test_preload_writes_a_snapshot_later_processes_map(snapshot_path, grade_loads):
+    built = NCERTCurriculum.preload(snapshot_path, lazy_export=True)
+    assert snapshot_path.exists()
+    assert sorted(grade_loads) == list(GRADES)
+    assert oct(snapshot_path.parent.stat().st_mode & 0o777) == oct(0o700)
+
+    grade_loads.clear()
+    mapped = _fresh(snapshot_path)
+    assert mapped.get_grade(10).keys() == built.get_grade(10).keys()
+    assert grade_loads == []
+    assert all(isinstance(blob, memoryview) for blob in mapped._pickled_grades.values())
+    assert [t.id for t in mapped.get_topics_by_grade_subject(10, Subject.PHYSICS)] == [
+        t.id for t in built.get_topics_by_grade_subject(10, Subject.PHYSICS)
+    ]
+
+
+def test_preload_keeps_a_current_snapshot(snapshot_path):
+    NCERTCurriculum.preload(snapshot_path, lazy_export=True)
+    mtime = snapshot_path.stat().st_mtime_ns
+
+    _fresh(snapshot_path)
+    NCERTCurriculum.preload(snapshot_path, lazy_export=True)
+    assert snapshot_path.stat().st_mtime_ns == mtime
+
+
+def test_tampered_snapshot_is_not_unpickled(snapshot_path, grade_loads):
+    NCERTCurriculum.preload(snapshot_path, lazy_export=True)
+    data = bytearray(snapshot_path.read_bytes())
+    data[-5] ^= 0xFF
+    snapshot_path.write_bytes(bytes(data))
+
+    grade_loads.clear()
+    curriculum = _fresh(snapshot_path)
+    curriculum.get_grade(6)
+    assert curriculum._pickled_grades == {}
+    assert grade_loads == [6]
+
+
+def test_stale_snapshot_is_ignored(snapshot_path, grade_loads, monkeypatch):
+    NCERTCurriculum.preload(snapshot_path, lazy_export=True)
+    version = ncert_curriculum._source_version()
+    monkeypatch.setattr(
+        ncert_curriculum, "_source_version", lambda: dict(version, data_sha256="changed")
+    )
+
+    grade_loads.clear()
+    curriculum = _fresh(snapshot_path)
+    curriculum.get_grade(6)
+    assert curriculum._pickled_grades == {}
+    assert grade_loads == [6]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_snapshot_in_a_shared_directory_is_neither_read_nor_written(snapshot_path, grade_loads):
+    NCERTCurriculum.preload(snapshot_path, lazy_export=True)
+    os.chmod(snapshot_path.parent, 0o777)
+    mtime = snapshot_path.stat().st_mtime_ns
+
+    grade_loads.clear()
+    curriculum = NCERTCurriculum.preload(_fresh(snapshot_path)._cache_path, lazy_export=True)
+    assert curriculum._pickled_grades == {}
+    assert sorted(grade_loads) == list(GRADES)
+    assert snapshot_path.stat().st_mtime_ns == mtime
+
+
+def test_concurrent_first_queries_build_indexes_once(curriculum, snapshot_path, monkeypatch):
+    topic_ids = list(curriculum.topic_index)
+    builds = []
+    build_indexes = NCERTCurriculum._build_indexes
+
+    def counting_build_indexes(self):
+        builds.append(1)
+        build_indexes(self)
+
+    monkeypatch.setattr(NCERTCurriculum, "_build_indexes", counting_build_indexes)
+    fresh = NCERTCurriculum(snapshot_path)
+    barrier = threading.Barrier(8)
+    missing = []
+
+    def lookup():
+        barrier.wait()
+        missing.extend(tid for tid in topic_ids if fresh.get_topic_by_id(tid) is None)
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert missing == []
+    assert builds == [1]
+
+
+# Columnar table
+
+
+def test_topic_table_rows_match_topic_attributes(curriculum):
+    table = curriculum.topic_table
+    topics = table.topics
+    for grade in (None, 6, 10):
+        for subject in (None, *Subject):
+            expected = [
+                i for i, t in enumerate(topics)
+                if (grade is None or t.grade == grade) and (subject is None or t.subject is subject)
+            ]
+            assert list(table.rows(grade, subject)) == expected
+
+
+def test_prerequisite_closure_lists_prerequisites_first(curriculum):
+    table = curriculum.topic_table
+    for row, topic in enumerate(table.topics):
+        closure = table.prerequisite_closure(row)
+        assert row not in closure
+        position = {r: i for i, r in enumerate(closure)}
+        for r in closure:
+            for prereq in table.topics[r].prerequisites:
+                prereq_row = table.row_of.get(prereq)
+                if prereq_row is not None and prereq_row != row:
+                    assert position[prereq_row] < position[r]
+        direct = {table.row_of[p] for p in topic.prerequisites if p in table.row_of}
+        assert direct <= set(closure)
+
+
+def test_get_prerequisites_resolves_known_ids(curriculum):
+    topic = curriculum.get_topic_by_id("cl6_sci_measurement")
+    assert [t.id for t in curriculum.get_prerequisites(topic.id)] == list(topic.prerequisites)
+    assert curriculum.get_prerequisites("missing") == []
+
+
+def test_topic_table_handles_an_empty_curriculum():
+    table = TopicTable([])
+    assert len(table) == 0
+    assert list(table.rows(6, Subject.PHYSICS)) == []
+
+
+# Search
+
+
+def _reference_search(curriculum, query, grade=None, subject=None):
+    """Scan every topic with the documented scoring: title 10, keyword 5, description 2"""
+    query = query.lower()
+    scored = []
+    for row, topic in enumerate(curriculum.topic_table.topics):
+        if grade and topic.grade != grade or subject and topic.subject is not subject:
+            continue
+        score = 10.0 * (query in topic.title.lower())
+        score += 5.0 * sum(query in k.lower() for k in topic.keywords)
+        score += 2.0 * (query in topic.description.lower())
+        if score:
+            scored.append((-score, row, topic.id))
+    return [topic_id for _, _, topic_id in sorted(scored)[:50]]
+
+
+@pytest.mark.parametrize("query", ["light", "Motion", "cell", "e", "ti", "energy", "xyz", "of"])
+@pytest.mark.parametrize("grade, subject", [(None, None), (10, None), (None, Subject.PHYSICS)])
+def test_search_matches_a_full_scan(curriculum, query, grade, subject):
+    results = [t.id for t in curriculum.search_topics(query, grade, subject)]
+    assert results == _reference_search(curriculum, query, grade, subject)
+
+
+def test_search_by_keywords(curriculum):
+    topic = curriculum.get_topic_by_id("cl6_sci_measurement")
+    keywords = topic.keywords[:2]
+    assert topic in curriculum.search_by_keywords([k.upper() for k in keywords])
+    assert curriculum.search_by_keywords([keywords[0], "no-such-keyword"]) == []
+    assert topic in curriculum.search_by_keywords([keywords[0], "no-such-keyword"], match_all=False)
+
+
+# Export
+
+
+def test_streamed_export_joins_to_the_cached_document(curriculum):
+    document = curriculum.export_curriculum_json()
+    assert b"".join(curriculum.export_curriculum_iter()).decode() == document
+
+    data = json.loads(document)
+    assert list(data) == [str(grade) for grade in GRADES]
+    assert document == json.dumps(data, indent=2, ensure_ascii=False)
+
+    exported = [
+        topic["id"]
+        for subjects in data.values()
+        for chapters in subjects.values()
+        for chapter in chapters
+        for topic in chapter["topics"]
+    ]
+    assert sorted(exported) == sorted(curriculum.topic_index)
+    assert len(exported) == curriculum.get_curriculum_stats()["total_topics"]
+
+
+def test_stats_are_copied_per_caller(curriculum):
+    stats = curriculum.get_curriculum_stats()
+    stats["grades_covered"].append(99)
+    assert 99 not in curriculum.get_curriculum_stats()["grades_covered"]
+    with pytest.raises(TypeError):
+        stats["topics_by_grade"][1] = 0
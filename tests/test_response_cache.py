@@ -0,0 +1,169 @@
+"""
+Tests for response cache key generation, the hot set, eviction and disk demotion
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backend.ai.llm_handler import LLMProvider, LLMResponse
+from backend.ai.response_cache import ResponseCache, _key_for
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+KEY_ARGS = ("What is photosynthesis?", 7, "Biology", "English", "concept_explanation", True)
+
+CONTEXT = {"grade": 7, "subject": "Biology", "type": "general"}
+
+
+def _response(content: str = "answer") -> LLMResponse:
+    return LLMResponse(
+        content=content, provider=LLMProvider.GROQ, model="test", tokens_used=10,
+        response_time_ms=5, cached=False, timestamp=datetime.now(), metadata={"source": "test"}
+    )
+
+
+def _key_in_subprocess(args, hash_seed: str) -> str:
+    """Compute _key_for in a fresh interpreter with its own hash seed"""
+
+    code = (
+        "import sys\n"
+        "from backend.ai.response_cache import _key_for\n"
+        f"sys.stdout.write(_key_for(*{args!r}))\n"
+    )
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(REPO_ROOT), env.get("PYTHONPATH"))))
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+@pytest.mark.parametrize("hash_seed", ["0", "12345"])
+def test_key_is_stable_across_processes(hash_seed):
+    assert _key_in_subprocess(KEY_ARGS, hash_seed) == _key_for(*KEY_ARGS)
+
+
+@pytest.mark.parametrize("question", [
+    "what is photosynthesis",
+    "  What   is\tphotosynthesis?",
+    "WHAT IS PHOTOSYNTHESIS??",
+    "What is photosynthesis ?!",
+    "What is\nphotosynthesis.",
+    "Ｗｈａｔ ｉｓ ｐｈｏｔｏｓｙｎｔｈｅｓｉｓ？",
+])
+def test_question_variants_share_a_key(question):
+    assert _key_for(question, *KEY_ARGS[1:]) == _key_for(*KEY_ARGS)
+
+
+@pytest.mark.parametrize("index, value", [
+    (0, "What is respiration?"),
+    (1, 8),
+    (2, "Physics"),
+    (3, "Hindi"),
+    (4, "quiz_generation"),
+    (5, False),
+])
+def test_answer_affecting_fields_change_the_key(index, value):
+    args = list(KEY_ARGS)
+    args[index] = value
+    assert _key_for(*args) != _key_for(*KEY_ARGS)
+
+
+# Hot set
+
+
+def test_cached_responses_are_private_copies():
+    async def scenario():
+        cache = ResponseCache()
+        original = _response()
+        await cache.set("q", CONTEXT, original)
+        first = await cache.get("q", CONTEXT)
+        first.metadata["source"] = "changed"
+        second = await cache.get("q", CONTEXT)
+        return original, first, second
+
+    original, first, second = asyncio.run(scenario())
+    assert not original.cached
+    assert first.cached and second.cached
+    assert first is not second
+    assert second.metadata == {"source": "test"}
+    assert original.metadata == {"source": "test"}
+
+
+def test_hot_set_is_bounded_and_cold_entries_still_decode():
+    async def scenario():
+        cache = ResponseCache()
+        cache.hot_entries = 2
+        for i in range(5):
+            await cache.set(f"q{i}", CONTEXT, _response(f"a{i}"))
+        hot = len(cache._hot)
+        coldest = await cache.get("q0", CONTEXT)
+        return cache, hot, coldest
+
+    cache, hot, coldest = asyncio.run(scenario())
+    assert hot == 2
+    assert coldest.content == "a0" and coldest.cached
+    assert cache.make_key("q0", CONTEXT) in cache._hot
+
+
+# Eviction and demotion
+
+
+def test_lru_eviction_keeps_the_limit_and_byte_count():
+    async def scenario():
+        cache = ResponseCache()
+        cache.max_entries = 10
+        for i in range(10):
+            await cache.set(f"q{i}", CONTEXT, _response(f"a{i}"))
+        # Touch the oldest entry so the next eviction skips it
+        await cache.get("q0", CONTEXT)
+        await cache.set("q10", CONTEXT, _response("a10"))
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert len(cache.cache) == 10
+    assert cache.cache_stats["evictions"] == 1
+    assert cache.make_key("q1", CONTEXT) not in cache.cache
+    assert cache.make_key("q0", CONTEXT) in cache.cache
+    assert cache._total_bytes == sum(entry.size_bytes for entry in cache.cache.values())
+
+
+def test_concurrent_sets_of_one_key_count_its_bytes_once():
+    async def scenario():
+        cache = ResponseCache()
+        await asyncio.gather(*(cache.set("q", CONTEXT, _response(f"a{i}")) for i in range(8)))
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert len(cache.cache) == 1
+    assert cache._total_bytes == next(iter(cache.cache.values())).size_bytes
+
+
+def test_evicted_entries_are_demoted_to_disk_and_promoted_back(tmp_path):
+    async def scenario():
+        cache = ResponseCache()
+        cache.disk = cache._open_disk_cache(str(tmp_path / "cache" / "responses.db"))
+        cache.max_entries = 10
+        for i in range(19):
+            await cache.set(f"q{i}", CONTEXT, _response(f"a{i}"))
+        on_disk = cache.disk.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        in_memory = len(cache.cache)
+        promoted = await cache.get("q0", CONTEXT)
+        hits = cache.cache_stats["hits"]
+        await cache.close()
+        return on_disk, in_memory, promoted, hits, cache
+
+    on_disk, in_memory, promoted, hits, cache = asyncio.run(scenario())
+    assert on_disk == 9
+    assert in_memory == 10
+    assert promoted.content == "a0" and promoted.cached
+    assert hits == 1
+    assert cache.disk is None
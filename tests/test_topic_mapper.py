@@ -0,0 +1,86 @@
+"""
+Tests for the topic mapper: frozen edge table, related topics and learning paths
+"""
+
+import pytest
+
+from backend.curriculum.ncert_curriculum import NCERTCurriculum, Subject
+from backend.curriculum.topic_mapper import TopicMapper
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    return TopicMapper(NCERTCurriculum(None))
+
+
+def test_freeze_keeps_one_edge_table_and_drops_the_builder_lists(mapper):
+    assert mapper._pending_edges is None
+    assert not hasattr(mapper, "_forward_edges")
+    assert not hasattr(mapper, "_reverse_edges")
+
+    edges = mapper._edges
+    assert len(edges.offsets) == len(edges.nodes) + 1
+    assert len(edges.sources) == len(edges.targets) == len(edges.types) == len(edges.strengths)
+
+
+def test_relationships_view_is_rebuilt_from_the_edge_table(mapper):
+    relationships = mapper.relationships
+    progression = mapper.difficulty_progressions["motion_and_mechanics"]
+
+    # Consecutive progression topics are linked by a prerequisite edge keyed by target
+    for source, target in zip(progression, progression[1:]):
+        [rel] = relationships[target]
+        assert (rel.source_topic_id, rel.target_topic_id) == (source, target)
+        assert (rel.relationship_type, rel.strength) == ("prerequisite", 0.8)
+
+    assert mapper.reverse_relationships == relationships
+    # Each call builds new lists, so callers cannot alter the frozen edges
+    relationships[progression[1]].clear()
+    assert mapper.relationships[progression[1]]
+
+
+def test_related_topics_include_the_reverse_prerequisite(mapper):
+    related = mapper.get_related_topics("cl6_sci_measurement")
+    assert ("cl6_sci_motion_types", "reverse_prerequisite", 0.8) in [
+        (topic.id, kind, strength) for topic, kind, strength in related
+    ]
+    assert [s for _, _, s in related] == sorted((s for _, _, s in related), reverse=True)
+    assert mapper.get_related_topics("missing") == []
+
+
+def test_learning_path_is_the_progression_prefix(mapper):
+    path = mapper.get_learning_path("cl10_sci_electric_power")
+    assert [t.id for t in path] == ["cl10_sci_electric_current", "cl10_sci_electric_power"]
+
+    # Callers get their own list; the cached path is unaffected
+    path.clear()
+    assert len(mapper.get_learning_path("cl10_sci_electric_power")) == 2
+
+
+def test_unknown_topics_have_no_path_and_are_not_cached(mapper):
+    assert mapper.get_learning_path("missing") is None
+    assert "missing" not in mapper._path_cache
+
+
+def test_suggest_next_topics_follows_the_progressions(mapper):
+    suggestions = mapper.suggest_next_topics(["cl10_sci_electric_current"])
+    assert [t.id for t in suggestions] == ["cl10_sci_electric_power"]
+    assert mapper.suggest_next_topics(["cl10_sci_electric_current"], Subject.BIOLOGY) == []
+
+
+def test_knowledge_gaps_skip_completed_topics(mapper):
+    gaps = mapper.find_knowledge_gaps(["cl10_sci_light_reflection"], "cl10_sci_light_refraction")
+    assert [t.id for t in gaps] == ["cl10_sci_light_refraction"]
+
+
+def test_export_lists_every_edge_by_target(mapper):
+    exported = mapper.export_topic_relationships()
+    assert exported["progressions"] == mapper.difficulty_progressions
+    assert exported["relationships"] == {
+        target: [
+            {"target": rel.target_topic_id, "type": rel.relationship_type, "strength": rel.strength}
+            for rel in rels
+        ]
+        for target, rels in mapper.relationships.items()
+    }
+    assert len(exported["cross_subject_connections"]) == len(mapper.cross_subject_connections)